@@ -46,7 +46,8 @@ def main():
                     os.getenv("OPENROUTER_API_KEY"),
                     os.getenv("OPENROUTER_BASE_URL"),
                     "z-ai/glm-4.6",
-                )
+                ),
+                cache_dir=os.path.join(os.getcwd(), "cache", "quality_check"),
             ),
             CorrectStage(),
             TranslateStage(),
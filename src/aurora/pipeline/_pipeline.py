@@ -51,12 +51,16 @@ class Pipeline:
         return None
 
     def run(self, src_path: str):
-        """扫描并处理所有影片。"""
-        movies = self._scan(src_path)
-        logger.info("扫描到 %d 部影片待处理。", len(movies))
-        for movie in movies:
-            # 启动该影片的处理流程（内部包含注册和状态同步）
-            self._process_movie(movie)
+        """扫描并处理所有影片，结束后关闭数据库连接。"""
+        try:
+            movies = self._scan(src_path)
+            logger.info("扫描到 %d 部影片待处理。", len(movies))
+            for movie in movies:
+                # 启动该影片的处理流程（内部包含注册和状态同步）
+                self._process_movie(movie)
+        finally:
+            # 关闭前 SQLite 会按需刷新查询规划所用的统计信息（pragma optimize）
+            self.database_manager.close()
 
     def _process_movie(self, movie: Movie):
         """处理单部影片，直到所有阶段完成。"""
@@ -67,8 +71,7 @@ class Pipeline:
         try:
             # 注册影片和其下的视频，并从数据库同步最新状态
             self.context.register_movie(movie)
-            for video in movie.videos:
-                self.context.set_video_status(video)
+            self.context.set_video_status_batch(movie.videos)
 
             # 处理影片级别的阶段
             while True:
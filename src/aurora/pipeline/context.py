@@ -7,7 +7,7 @@ import os
 import sqlite3
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import List, Optional
 
 from aurora.domain.enums import MetadataType
 from aurora.domain.movie import Movie, Video, Metadata
@@ -154,6 +154,15 @@ class PipelineContext:
         with self.get_cursor() as cursor:
             self.database_manager.set_video_status(video, cursor)
 
+    def set_video_status_batch(self, videos: List[Video]) -> None:
+        """批量从清单同步 Video 的状态。
+
+        Args:
+            videos (List[Video]): 待设置状态的视频列表
+        """
+        with self.get_cursor() as cursor:
+            self.database_manager.set_video_status_batch(videos, cursor)
+
     def update_video(self, video: Video) -> None:
         """更新 Video 的处理状态到清单。
 
@@ -1,5 +1,5 @@
 from dataclasses import fields, is_dataclass
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Iterator
 
 from aurora.domain.enums import TaskType, MetadataType
 from aurora.domain.movie import Movie, Metadata
@@ -177,6 +177,34 @@ class ScrapeStage(MoviePipelineStage):
             ),
         )
 
+    def _collect_untranslated(
+        self, data, context: PipelineContext, metadata_type: MetadataType
+    ) -> List[str]:
+        """收集数据结构中尚未翻译、且实体缓存中也没有译文的原文，去重后按出现顺序返回。"""
+        return [
+            text
+            for text in dict.fromkeys(self._iter_untranslated(data))
+            if text and not context.get_entity(metadata_type, text)
+        ]
+
+    def _iter_untranslated(self, data) -> Iterator[str]:
+        """按 _translate_data_structure 的遍历规则，逐个产出尚未翻译的原文。"""
+        if isinstance(data, BilingualText):
+            if not data.translated:
+                yield data.original
+        elif isinstance(data, BilingualList):
+            if not data.translated or len(data.translated) != len(data.original):
+                yield from data.original
+        elif isinstance(data, (list, tuple, set)):
+            for item in data:
+                yield from self._iter_untranslated(item)
+        elif isinstance(data, dict):
+            for item in data.values():
+                yield from self._iter_untranslated(item)
+        elif is_dataclass(data):
+            for field in fields(data):
+                yield from self._iter_untranslated(getattr(data, field.name))
+
     def _translate_data_structure(
         self,
         data,
@@ -308,6 +336,13 @@ class ScrapeStage(MoviePipelineStage):
             metadata_type, task_type = field_map[field.name]
             value = getattr(movie.metadata, field.name)
             logger.info('Check generic field: "%s"...', field.name)
+            # 先把该字段所有待翻译条目合并为一次请求，译文进入翻译器的结果缓存，
+            # 下面逐条翻译时直接命中；批量失败的条目只由下面的逐条翻译重试一次
+            texts = self._collect_untranslated(value, context, metadata_type)
+            if len(texts) > 1:
+                context.translator.translate_metadata_batch(
+                    task_type, texts, fallback=False
+                )
             self._translate_data_structure(value, context, metadata_type, task_type)
 
         # 最后翻译需要上下文的字段
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 from aurora.domain.enums import PiplinePhase, StageStatus
 from aurora.domain.movie import Movie, Video
@@ -12,6 +13,11 @@ from aurora.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    from diskcache import Cache as DiskCache
+except ImportError:
+    DiskCache = None
+
 
 class TranscribeAudioStage(VideoPipelineStage):
     """音频转写流水线阶段。
@@ -19,17 +25,29 @@ class TranscribeAudioStage(VideoPipelineStage):
     使用模块化转写服务将音频转写为字幕文件（SRT格式），并集成质量检测。
     """
 
-    def __init__(self, quality_check_provider: Provider):
+    def __init__(
+        self, quality_check_provider: Provider, cache_dir: Optional[str] = None
+    ):
         """初始化转写阶段。
 
         Args:
             quality_check_provider: 质量检测使用的LLM提供者
+            cache_dir: LLM 质量检测结果的缓存目录，需要安装 diskcache，未设置时不缓存
         """
         # 初始化转写器工厂
         self.transcriber_factory = TranscriberFactory()
 
+        cache = None
+        if cache_dir:
+            if DiskCache is None:
+                logger.warning("未安装 diskcache，LLM 质量检测结果将不会被缓存")
+            else:
+                cache = DiskCache(cache_dir)
+
         # 初始化质量检测器（使用20分钟作为最大间隔阈值）
-        self.quality_checker = QualityChecker(quality_check_provider, interval=1200)
+        self.quality_checker = QualityChecker(
+            quality_check_provider, interval=1200, cache=cache
+        )
 
         # 初始化转写服务
         self.transcription_service = TranscriptionService(
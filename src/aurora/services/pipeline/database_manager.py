@@ -1,16 +1,224 @@
 import itertools
+import os
 import os.path
 import re
 import sqlite3
 import uuid
+from collections import OrderedDict
 from contextlib import contextmanager
-from pathlib import Path
-from typing import List, Literal, Optional, Generator
+from typing import Dict, List, Literal, Optional, Generator, Tuple
 
 from aurora.domain.enums import PiplinePhase, StageStatus, MetadataType
 from aurora.domain.movie import Video, Movie, Metadata, Actor, Term
 from aurora.domain.subtitle import BilingualText
 
+# get_entity 翻译缓存的最大条目数
+ENTITY_CACHE_SIZE = 4096
+
+# 状态列的值到 StageStatus 的映射，代替逐个调用 StageStatus(value)
+_STATUS_BY_VALUE: Dict[str, StageStatus] = {
+    status.value: status for status in StageStatus
+}
+
+# set_video_status_batch 使用 IN 子句的最大视频数，超过后改用临时表联查
+BATCH_IN_LIMIT = 500
+
+# update_movie 写入 movies 表的字段，顺序与 _movie_field_values 的返回值一致
+_MOVIE_FIELD_COLUMNS = (
+    "title_ja",
+    "title_zh",
+    "synopsis_ja",
+    "synopsis_zh",
+    "director_ja",
+    "studio_ja",
+    "release_date",
+)
+_UPDATE_MOVIE_SQL = (
+    "update movies set "
+    + ", ".join(f"{col} = ?" for col in _MOVIE_FIELD_COLUMNS)
+    + " where code = ?"
+)
+_REPLACE_MOVIE_SQL = (
+    f"insert or replace into movies (code, {', '.join(_MOVIE_FIELD_COLUMNS)}) "
+    f"values ({', '.join('?' * (len(_MOVIE_FIELD_COLUMNS) + 1))})"
+)
+
+# 每个连接打开后执行的 PRAGMA。WAL + synchronous=NORMAL 使提交不再每次 fsync 主库文件，
+# 其余项加大页缓存、临时表放内存并启用内存映射读取。
+_CONNECTION_PRAGMAS = """
+pragma journal_mode = wal;
+pragma synchronous = normal;
+pragma cache_size = -65536;
+pragma temp_store = memory;
+pragma mmap_size = 268435456;
+"""
+
+# 视频文件表的列定义，建表脚本和旧库迁移共用
+_VIDEOS_COLUMNS_SQL = """(
+    sha256                      text primary key,
+    absolute_path               text unique,
+    filename                    text,
+    suffix                      text,
+    is_deleted                  integer not null default 0,
+    extracted_audio_status      text,
+    extracted_audio_path        text,
+    denoised_audio_status       text,
+    denoised_audio_path         text,
+    transcribed_subtitle_status text,
+    transcribed_subtitle_path   text,
+    corrected_subtitle_status   text,
+    corrected_subtitle_path     text,
+    translated_subtitle_status  text,
+    bilingual_subtitle_path     text,
+    bilingual_subtitle_status   text
+)"""
+
+# 数据库建表脚本，由 create_tables 通过 executescript 一次性执行。
+# 实体表、关系表和视频表只按文本主键访问，声明为 without rowid 使行数据直接存放在主键B树中，
+# 查询时省去一次 rowid 回表；已存在的 videos 表由 _migrate_videos_without_rowid 迁移，
+# 其余已存在的表不受影响。
+_SCHEMA_SQL = f"""
+-- ========== 核心表 ==========
+
+-- 影片表 - 只保留核心字段
+create table if not exists movies
+(
+    code         text primary key,
+    title_ja     text,
+    title_zh     text,
+    release_date text,
+    director_ja  text,
+    studio_ja    text,
+    synopsis_ja  text,
+    synopsis_zh  text,
+    foreign key (director_ja) references directors (name_ja),
+    foreign key (studio_ja) references studios (name_ja)
+);
+
+-- 视频文件表
+create table if not exists videos
+{_VIDEOS_COLUMNS_SQL} without rowid;
+
+-- ========== 元数据实体表 ==========
+
+-- 导演表
+create table if not exists directors
+(
+    name_ja text primary key,
+    name_zh text
+) without rowid;
+
+-- 制作商表
+create table if not exists studios
+(
+    name_ja text primary key,
+    name_zh text
+) without rowid;
+
+-- 类别表
+create table if not exists categories
+(
+    name_ja text primary key,
+    name_zh text
+) without rowid;
+
+-- 演员表 - 使用UUID作为主键
+create table if not exists actors
+(
+    actor_id     text primary key,
+    current_name text not null,
+    gender       text not null
+) without rowid;
+
+-- 演员名表
+create table if not exists actor_names
+(
+    name_ja  text primary key,
+    name_zh  text,
+    actor_id text not null,
+    foreign key (actor_id) references actors (actor_id)
+) without rowid;
+
+-- 术语表
+create table if not exists terms
+(
+    id                      integer primary key autoincrement,
+    origin                  text not null,
+    recommended_translation text,
+    description             text,
+    movie_code              text not null,
+    foreign key (movie_code) references movies (code)
+);
+
+-- ========== 关系表 ==========
+
+-- 影片-视频关系表
+create table if not exists movie_videos
+(
+    movie_code   text,
+    video_sha256 text,
+    primary key (movie_code, video_sha256),
+    foreign key (movie_code) references movies (code),
+    foreign key (video_sha256) references videos (sha256)
+) without rowid;
+
+-- 影片-类别关系表
+create table if not exists movie_categories
+(
+    movie_code  text,
+    category_ja text,
+    primary key (movie_code, category_ja),
+    foreign key (movie_code) references movies (code),
+    foreign key (category_ja) references categories (name_ja)
+) without rowid;
+
+-- 演员-电影关系表（统一处理男演员和女演员）
+create table if not exists act_in
+(
+    movie_code text,
+    actor_id   text,
+    primary key (movie_code, actor_id),
+    foreign key (movie_code) references movies (code),
+    foreign key (actor_id) references actors (actor_id)
+) without rowid;
+
+-- ========== 创建索引优化查询性能 ==========
+
+-- 视频文件路径索引
+create index if not exists idx_videos_absolute_path on videos (absolute_path);
+create index if not exists idx_videos_filename on videos (filename);
+
+-- 演员相关索引
+create index if not exists idx_actor_names_actor_id on actor_names (actor_id);
+create index if not exists idx_actors_gender on actors (gender);
+create index if not exists idx_actors_current_name on actors (current_name);
+
+-- 关系表索引
+create index if not exists idx_movie_videos_movie_code on movie_videos (movie_code);
+create index if not exists idx_movie_videos_video_sha256 on movie_videos (video_sha256);
+create index if not exists idx_movie_categories_movie_code on movie_categories (movie_code);
+create index if not exists idx_act_in_movie_code on act_in (movie_code);
+create index if not exists idx_act_in_actor_id on act_in (actor_id);
+
+-- 术语表索引
+create index if not exists idx_terms_movie_code on terms (movie_code);
+create index if not exists idx_terms_origin on terms (origin);
+
+-- ========== 全局术语表 ==========
+
+-- 全局术语表
+create table if not exists glossary_terms
+(
+    id                      integer primary key autoincrement,
+    literal                 varchar(255) not null unique,
+    recommended_translation varchar(500),
+    description             text         not null
+);
+
+-- 全局术语表索引
+create index if not exists idx_glossary_literal on glossary_terms (literal);
+"""
+
 
 class DatabaseManager:
     """
@@ -18,6 +226,18 @@ class DatabaseManager:
     Attributes:
         video_phases (List[PiplinePhase]): 支持的视频级文件流水线阶段列表
         db_path (str): SQLite数据库文件路径
+        phase_to_column (Dict[PiplinePhase, Tuple[str, str]]): 阶段到(状态列, 路径列)的映射
+        _phase_to_idx (Dict[PiplinePhase, Tuple[int, int]]): 阶段到(状态列, 路径列)在
+            ``select * from videos`` 结果行中下标的映射
+        _phase_order (Tuple[PiplinePhase, ...]): phase_to_column 中各阶段的顺序
+        _status_cols (Tuple[str, ...]): 与 _phase_order 对齐的状态列
+        _path_cols (Tuple[str, ...]): 与 _phase_order 对齐的路径列
+        _update_video_sql (str): update_video 使用的固定 UPDATE 语句
+        _final_product_phases (Tuple[PiplinePhase, ...]): 路径列与最终产物相同的阶段
+        _final_product_status_idx (int): 双语字幕阶段在 _phase_order 中的下标
+        _final_product_probe_sql (str): set_video_status 先行读取最终产物路径和各阶段状态的查询
+        _entity_cache (OrderedDict): (实体类型, 日文原文) 到中文翻译的LRU缓存
+        _conn (Optional[sqlite3.Connection]): 进程内共享的数据库连接，首次使用时创建
     """
 
     def __init__(self, db_path: str = os.path.join(os.getcwd(), "data.sqlite3")):
@@ -30,6 +250,7 @@ class DatabaseManager:
             PiplinePhase.BILINGUAL_SUBTITLE,
         ]
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
         self.phase_to_column = {
             PiplinePhase.EXTRACT_AUDIO: (
                 "extracted_audio_status",
@@ -56,7 +277,61 @@ class DatabaseManager:
                 "bilingual_subtitle_path",
             ),
         }
+        self._phase_order: Tuple[PiplinePhase, ...] = tuple(self.phase_to_column)
+        self._status_cols: Tuple[str, ...] = tuple(
+            status_col for status_col, _ in self.phase_to_column.values()
+        )
+        self._path_cols: Tuple[str, ...] = tuple(
+            path_col for _, path_col in self.phase_to_column.values()
+        )
+        self._update_video_sql, self._path_slots = self._build_update_video_sql()
+        final_product_col = self.phase_to_column[PiplinePhase.BILINGUAL_SUBTITLE][1]
+        # 与最终产物共用路径列的阶段
+        self._final_product_phases: Tuple[PiplinePhase, ...] = tuple(
+            phase
+            for phase, path_col in zip(self._phase_order, self._path_cols)
+            if path_col == final_product_col
+        )
+        self._final_product_status_idx = self._phase_order.index(
+            PiplinePhase.BILINGUAL_SUBTITLE
+        )
+        self._final_product_probe_sql = (
+            f"select {final_product_col}, {', '.join(self._status_cols)} "
+            "from videos where sha256 = ?"
+        )
         self.create_tables()
+        self._phase_to_idx: Dict[PiplinePhase, Tuple[int, int]] = (
+            self._build_phase_index()
+        )
+        self._entity_cache: OrderedDict[Tuple[MetadataType, str], str] = OrderedDict()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """
+        获取共享的数据库连接，首次调用时创建。
+
+        所有内部创建的游标都复用这一个连接，避免每次调用都重新打开数据库文件。
+
+        Returns:
+            sqlite3.Connection: 数据库连接
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.executescript(_CONNECTION_PRAGMAS)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """关闭共享的数据库连接，关闭前让 SQLite 按需更新查询规划所用的统计信息。"""
+        if self._conn is not None:
+            self._conn.execute("pragma optimize")
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "DatabaseManager":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     @contextmanager
     def get_cursor(self, commit: bool = False) -> Generator[sqlite3.Cursor, None, None]:
@@ -69,409 +344,91 @@ class DatabaseManager:
         Yields:
             sqlite3.Cursor: 数据库游标
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
+        cursor = conn.cursor()
         try:
-            cursor = conn.cursor()
             yield cursor
             if commit:
                 conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
         finally:
-            conn.close()
+            cursor.close()
 
     def create_tables(self):
+        """创建所有表和索引，整个建表脚本一次性交给 SQLite 执行。"""
         with self.get_cursor(commit=True) as cursor:
-            # ========== 核心表 ==========
-
-            # 影片表 - 只保留核心字段
-            cursor.execute(
-                """
-                create table if not exists movies
-                (
-                    code
-                        text
-                        primary
-                            key,
-                    title_ja
-                        text,
-                    title_zh
-                        text,
-                    release_date
-                        text,
-                    director_ja
-                        text,
-                    studio_ja
-                        text,
-                    synopsis_ja
-                        text,
-                    synopsis_zh
-                        text,
-                    foreign
-                        key
-                        (
-                         director_ja
-                            ) references directors
-                        (
-                         name_ja
-                            ),
-                    foreign key
-                        (
-                         studio_ja
-                            ) references studios
-                        (
-                         name_ja
-                            )
-                )
-                """
-            )
-
-            # 视频文件表
-            cursor.execute(
-                """
-                create table if not exists videos
-                (
-                    sha256
-                        text
-                        primary
-                            key,
-                    absolute_path
-                        text
-                        unique,
-                    filename
-                        text,
-                    suffix
-                        text,
-                    is_deleted
-                        integer
-                        not
-                            null
-                        default
-                            0,
-                    extracted_audio_status
-                        text,
-                    extracted_audio_path
-                        text,
-                    denoised_audio_status
-                        text,
-                    denoised_audio_path
-                        text,
-                    transcribed_subtitle_status
-                        text,
-                    transcribed_subtitle_path
-                        text,
-                    corrected_subtitle_status
-                        text,
-                    corrected_subtitle_path
-                        text,
-                    translated_subtitle_status
-                        text,
-                    bilingual_subtitle_path
-                        text,
-                    bilingual_subtitle_status
-                        text
-                )
-                """
-            )
-
-            # ========== 元数据实体表 ==========
-
-            # 导演表
-            cursor.execute(
-                """
-                create table if not exists directors
-                (
-                    name_ja
-                        text
-                        primary
-                            key,
-                    name_zh
-                        text
-                )
-                """
-            )
-
-            # 制作商表
-            cursor.execute(
-                """
-                create table if not exists studios
-                (
-                    name_ja
-                        text
-                        primary
-                            key,
-                    name_zh
-                        text
-                )
-                """
-            )
-
-            # 类别表
-            cursor.execute(
-                """
-                create table if not exists categories
-                (
-                    name_ja
-                        text
-                        primary
-                            key,
-                    name_zh
-                        text
-                )
-                """
-            )
-
-            # 演员表 - 使用UUID作为主键
-            cursor.execute(
-                """
-                create table if not exists actors
-                (
-                    actor_id
-                        text
-                        primary
-                            key,
-                    current_name
-                        text
-                        not
-                            null,
-                    gender
-                        text
-                        not
-                            null
-                )
-                """
-            )
-
-            # 演员名表
-            cursor.execute(
-                """
-                create table if not exists actor_names
-                (
-                    name_ja
-                        text
-                        primary
-                            key,
-                    name_zh
-                        text,
-                    actor_id
-                        text
-                        not
-                            null,
-                    foreign
-                        key
-                        (
-                         actor_id
-                            ) references actors
-                        (
-                         actor_id
-                            )
-                )
-                """
-            )
-
-            # 术语表
-            cursor.execute(
-                """
-                create table if not exists terms
-                (
-                    id
-                        integer
-                        primary
-                            key
-                        autoincrement,
-                    origin
-                        text
-                        not
-                            null,
-                    recommended_translation
-                        text,
-                    description
-                        text,
-                    movie_code
-                        text
-                        not
-                            null,
-                    foreign
-                        key
-                        (
-                         movie_code
-                            ) references movies
-                        (
-                         code
-                            )
-                )
-                """
-            )
-
-            # ========== 关系表 ==========
-
-            # 影片-视频关系表
-            cursor.execute(
-                """
-                create table if not exists movie_videos
-                (
-                    movie_code
-                        text,
-                    video_sha256
-                        text,
-                    primary
-                        key
-                        (
-                         movie_code,
-                         video_sha256
-                            ),
-                    foreign key
-                        (
-                         movie_code
-                            ) references movies
-                        (
-                         code
-                            ),
-                    foreign key
-                        (
-                         video_sha256
-                            ) references videos
-                        (
-                         sha256
-                            )
-                )
-                """
-            )
+            self._migrate_videos_without_rowid(cursor)
+            cursor.executescript(_SCHEMA_SQL)
 
-            # 影片-类别关系表
-            cursor.execute(
-                """
-                create table if not exists movie_categories
-                (
-                    movie_code
-                        text,
-                    category_ja
-                        text,
-                    primary
-                        key
-                        (
-                         movie_code,
-                         category_ja
-                            ),
-                    foreign key
-                        (
-                         movie_code
-                            ) references movies
-                        (
-                         code
-                            ),
-                    foreign key
-                        (
-                         category_ja
-                            ) references categories
-                        (
-                         name_ja
-                            )
-                )
-                """
-            )
+    @staticmethod
+    def _migrate_videos_without_rowid(cursor: sqlite3.Cursor):
+        """
+        将旧库中带 rowid 的 videos 表迁移为 without rowid 表。
 
-            # 演员-电影关系表（统一处理男演员和女演员）
-            cursor.execute(
-                """
-                create table if not exists act_in
-                (
-                    movie_code
-                        text,
-                    actor_id
-                        text,
-                    primary
-                        key
-                        (
-                         movie_code,
-                         actor_id
-                            ),
-                    foreign key
-                        (
-                         movie_code
-                            ) references movies
-                        (
-                         code
-                            ),
-                    foreign key
-                        (
-                         actor_id
-                            ) references actors
-                        (
-                         actor_id
-                            )
-                )
-                """
-            )
+        在一个事务中建新表、复制数据、删除旧表并改名；旧表上的索引随旧表删除，
+        之后由建表脚本重新创建。新建的库或已迁移的库不做任何操作。
 
-            # ========== 创建索引优化查询性能 ==========
+        Args:
+            cursor (sqlite3.Cursor): 数据库游标
+        """
+        cursor.execute(
+            "select sql from sqlite_master where type = 'table' and name = 'videos'"
+        )
+        row = cursor.fetchone()
+        if row is None or "without rowid" in row[0].lower():
+            return
 
-            # 视频文件路径索引
-            cursor.execute(
-                "create index if not exists idx_videos_absolute_path on videos(absolute_path)"
-            )
-            cursor.execute(
-                "create index if not exists idx_videos_filename on videos(filename)"
-            )
+        cursor.execute("pragma table_info(videos)")
+        columns = ", ".join(column[1] for column in cursor.fetchall())
+        cursor.executescript(
+            f"""
+            begin;
+            create table videos_without_rowid {_VIDEOS_COLUMNS_SQL} without rowid;
+            insert into videos_without_rowid ({columns}) select {columns} from videos;
+            drop table videos;
+            alter table videos_without_rowid rename to videos;
+            commit;
+            """
+        )
 
-            # 演员相关索引
-            cursor.execute(
-                "create index if not exists idx_actor_names_actor_id on actor_names(actor_id)"
-            )
-            cursor.execute(
-                "create index if not exists idx_actors_gender on actors(gender)"
-            )
-            cursor.execute(
-                "create index if not exists idx_actors_current_name on actors(current_name)"
-            )
+    def _build_update_video_sql(self) -> Tuple[str, Tuple[int, ...]]:
+        """
+        预先生成 update_video 使用的 UPDATE 语句。
 
-            # 关系表索引
-            cursor.execute(
-                "create index if not exists idx_movie_videos_movie_code on movie_videos(movie_code)"
-            )
-            cursor.execute(
-                "create index if not exists idx_movie_videos_video_sha256 on movie_videos(video_sha256)"
-            )
-            cursor.execute(
-                "create index if not exists idx_movie_categories_movie_code on movie_categories(movie_code)"
-            )
-            cursor.execute(
-                "create index if not exists idx_act_in_movie_code on act_in(movie_code)"
-            )
-            cursor.execute(
-                "create index if not exists idx_act_in_actor_id on act_in(actor_id)"
-            )
+        每列都写成 ``col = coalesce(?, col)``，参数为 None 时保留原值，
+        因此每次调用都能复用同一条语句，由 sqlite3 的语句缓存免去重复解析。
+        多个阶段共用的路径列只出现一次。
 
-            # 术语表索引
-            cursor.execute(
-                "create index if not exists idx_terms_movie_code on terms(movie_code)"
-            )
-            cursor.execute(
-                "create index if not exists idx_terms_origin on terms(origin)"
-            )
+        Returns:
+            Tuple[str, Tuple[int, ...]]: UPDATE 语句，以及 _path_cols 中各列在去重后路径参数中的位置
+        """
+        unique_path_cols = tuple(dict.fromkeys(self._path_cols))
+        path_slots = tuple(unique_path_cols.index(col) for col in self._path_cols)
+        set_clause = ", ".join(
+            f"{col} = coalesce(?, {col})"
+            for col in itertools.chain(self._status_cols, unique_path_cols)
+        )
+        return f"update videos set {set_clause} where sha256 = ?", path_slots
 
-            # ========== 全局术语表 ==========
+    def _build_phase_index(self) -> Dict[PiplinePhase, Tuple[int, int]]:
+        """
+        根据 videos 表结构预计算各阶段状态列与路径列的下标。
 
-            # 全局术语表
-            cursor.execute(
-                """
-                create table if not exists glossary_terms
-                (
-                    id
-                                            integer
-                        primary
-                            key
-                        autoincrement,
-                    literal
-                                            varchar(255) not null unique,
-                    recommended_translation varchar(500),
-                    description             text         not null
-                )
-                """
-            )
+        ``select * from videos`` 返回的列顺序与 ``pragma table_info`` 一致，
+        预先算好下标后读取行时可以直接按位置访问，无需按列名查找。
 
-            # 全局术语表索引
-            cursor.execute(
-                "create index if not exists idx_glossary_literal on glossary_terms(literal)"
-            )
+        Returns:
+            Dict[PiplinePhase, Tuple[int, int]]: 阶段到(状态列下标, 路径列下标)的映射
+        """
+        with self.get_cursor() as cursor:
+            cursor.execute("pragma table_info(videos)")
+            column_to_idx = {row[1]: row[0] for row in cursor.fetchall()}
+        return {
+            phase: (column_to_idx[status_col], column_to_idx[path_col])
+            for phase, (status_col, path_col) in self.phase_to_column.items()
+        }
 
     def get_metadata(
         self, movie_code: str, cursor: Optional[sqlite3.Cursor] = None
@@ -485,12 +442,10 @@ class DatabaseManager:
         Returns:
             Metadata | None: 元数据对象，如果不存在则返回 None
         """
-        conn = None
         internal_cursor = False
         if cursor is None:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
+            cursor.row_factory = sqlite3.Row
             internal_cursor = True
 
         try:
@@ -639,84 +594,62 @@ class DatabaseManager:
             return metadata
 
         finally:
-            if internal_cursor and conn:
-                conn.close()
+            if internal_cursor:
+                cursor.close()
 
     def register_movie(self, movie: Movie, cursor: Optional[sqlite3.Cursor] = None):
-        internal_cursor = False
-        if cursor is None:
-            cursor = self.get_cursor(commit=True).__enter__()
-            internal_cursor = True
-
-        try:
+        # 三张表的写入在同一事务中完成，已存在的记录由 on conflict do nothing 跳过
+        with self._get_cursor_context(cursor) as (internal_cursor, cursor):
             cursor.execute(
-                "INSERT OR IGNORE INTO movies (code) VALUES (?)", (movie.code,)
+                "insert into movies (code) values (?) on conflict do nothing",
+                (movie.code,),
+            )
+            cursor.executemany(
+                """
+                insert into videos (sha256, absolute_path, filename, suffix)
+                values (?, ?, ?, ?)
+                on conflict do nothing
+                """,
+                [
+                    (video.sha256, video.absolute_path, video.filename, video.suffix)
+                    for video in movie.videos
+                ],
+            )
+            cursor.executemany(
+                """
+                insert into movie_videos (movie_code, video_sha256)
+                values (?, ?)
+                on conflict do nothing
+                """,
+                [(movie.code, video.sha256) for video in movie.videos],
             )
-            for video in movie.videos:
-                cursor.execute(
-                    """
-                    INSERT
-                        OR IGNORE
-                    INTO videos (sha256, absolute_path, filename, suffix)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (video.sha256, video.absolute_path, video.filename, video.suffix),
-                )
-                cursor.execute(
-                    """
-                    INSERT
-                        OR IGNORE
-                    INTO movie_videos (movie_code, video_sha256)
-                    VALUES (?, ?)
-                    """,
-                    (movie.code, video.sha256),
-                )
-            if internal_cursor:
-                # 如果是内部创建的cursor，需要在这里提交
-                conn = sqlite3.connect(self.db_path)
-                conn.commit()
-                conn.close()
-        except:
-            if internal_cursor:
-                # 如果是内部创建的cursor，需要手动处理连接
-                pass
-            raise
 
     @staticmethod
-    def _extract_movie_metadata_fields(movie: Movie) -> dict:
+    def _movie_field_values(movie: Movie) -> Tuple:
         """
-        从Movie对象中提取元数据字段。
+        从Movie对象中按 _MOVIE_FIELD_COLUMNS 的顺序提取 movies 表的字段值。
 
         Args:
             movie (Movie): Movie对象
 
         Returns:
-            dict: 包含所有元数据字段的字典
+            Tuple: 与 _MOVIE_FIELD_COLUMNS 对齐的字段值
         """
         metadata = movie.metadata
-
-        return {
-            "title_ja": (
-                metadata.title.original if metadata and metadata.title else None
-            ),
-            "title_zh": (
-                metadata.title.translated if metadata and metadata.title else None
-            ),
-            "synopsis_ja": (
-                metadata.synopsis.original if metadata and metadata.synopsis else None
-            ),
-            "synopsis_zh": (
-                metadata.synopsis.translated if metadata and metadata.synopsis else None
-            ),
-            "director_ja": (
-                metadata.director.original if metadata and metadata.director else None
-            ),
-            "studio_ja": (
-                metadata.studio.original if metadata and metadata.studio else None
-            ),
-            "release_date": metadata.release_date if metadata else None,
-            "metadata": metadata,
-        }
+        if not metadata:
+            return (None,) * len(_MOVIE_FIELD_COLUMNS)
+
+        title, synopsis = metadata.title, metadata.synopsis
+        director, studio = metadata.director, metadata.studio
+        return (
+            title.original if title else None,
+            title.translated if title else None,
+            synopsis.original if synopsis else None,
+            synopsis.translated if synopsis else None,
+            director.original if director else None,
+            studio.original if studio else None,
+            metadata.release_date,
+        )
 
     def _update_movie_relations(self, movie: Movie, cursor: sqlite3.Cursor):
         """
@@ -804,36 +737,14 @@ class DatabaseManager:
             cursor (Optional[sqlite3.Cursor]): 数据库游标，如果为None则内部创建
         """
         with self._get_cursor_context(cursor) as (internal_cursor, cursor):
-            # 提取元数据字段
-            fields = self._extract_movie_metadata_fields(movie)
-
             # 1. 更新movies表的核心字段
             cursor.execute(
-                """
-                update movies
-                set title_ja     = ?,
-                    title_zh     = ?,
-                    synopsis_ja  = ?,
-                    synopsis_zh  = ?,
-                    director_ja  = ?,
-                    studio_ja    = ?,
-                    release_date = ?
-                where code = ?
-                """,
-                (
-                    fields["title_ja"],
-                    fields["title_zh"],
-                    fields["synopsis_ja"],
-                    fields["synopsis_zh"],
-                    fields["director_ja"],
-                    fields["studio_ja"],
-                    fields["release_date"],
-                    movie.code,
-                ),
+                _UPDATE_MOVIE_SQL, (*self._movie_field_values(movie), movie.code)
             )
 
             # 2. 更新关联关系
             self._update_movie_relations(movie, cursor)
+            self._entity_cache.clear()
 
     def update_movie_for_test(
         self, movie: Movie, cursor: Optional[sqlite3.Cursor] = None
@@ -850,30 +761,14 @@ class DatabaseManager:
             cursor (Optional[sqlite3.Cursor]): 数据库游标，如果为None则内部创建
         """
         with self._get_cursor_context(cursor) as (internal_cursor, cursor):
-            # 提取元数据字段
-            fields = self._extract_movie_metadata_fields(movie)
-
             # 1. 使用 INSERT OR REPLACE 插入或覆盖 movies 表的记录
             cursor.execute(
-                """
-                insert or replace into movies
-                (code, title_ja, title_zh, synopsis_ja, synopsis_zh, director_ja, studio_ja, release_date)
-                values (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    movie.code,
-                    fields["title_ja"],
-                    fields["title_zh"],
-                    fields["synopsis_ja"],
-                    fields["synopsis_zh"],
-                    fields["director_ja"],
-                    fields["studio_ja"],
-                    fields["release_date"],
-                ),
+                _REPLACE_MOVIE_SQL, (movie.code, *self._movie_field_values(movie))
             )
 
             # 2. 更新关联关系
             self._update_movie_relations(movie, cursor)
+            self._entity_cache.clear()
 
     @contextmanager
     def _get_cursor_context(self, cursor: Optional[sqlite3.Cursor] = None):
@@ -886,15 +781,13 @@ class DatabaseManager:
         Yields:
             tuple: (internal_cursor, cursor) - internal_cursor表示是否为内部创建的游标
         """
-        internal_cursor = cursor is None
-        if internal_cursor:
-            cursor = self.get_cursor(commit=True).__enter__()
+        if cursor is not None:
+            yield False, cursor
+            return
 
-        try:
-            yield internal_cursor, cursor
-        finally:
-            # 如果是内部创建的游标，上下文管理器会自动处理连接
-            pass
+        # 内部创建的游标在退出时提交事务，出错时回滚
+        with self.get_cursor(commit=True) as internal:
+            yield True, internal
 
     @staticmethod
     def _get_or_create_entity(
@@ -949,6 +842,8 @@ class DatabaseManager:
         - TITLE/SYNOPSIS: 从movies表查询
         - DIRECTOR/ACTOR/ACTRESS/CATEGORY/STUDIO: 从对应实体表查询
 
+        已查到的翻译会缓存在内存中，调用 update_movie 时缓存失效。
+
         Args:
             entity_type (MetadataType): 实体类型
             original_name (str): 日文原文
@@ -960,50 +855,78 @@ class DatabaseManager:
         if not original_name:
             return None
 
-        conn = None
+        key = (entity_type, original_name)
+        cached = self._entity_cache.get(key)
+        if cached is not None:
+            self._entity_cache.move_to_end(key)
+            return cached
+
         internal_cursor = False
         if cursor is None:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
             internal_cursor = True
 
         try:
-            # TITLE和SYNOPSIS从movies表查询（修复表名）
-            if entity_type == MetadataType.TITLE:
-                cursor.execute(
-                    "select title_zh from movies where title_ja = ?", (original_name,)
-                )
-                row = cursor.fetchone()
-                return row[0] if row and row[0] else None
+            translation = self._query_entity(cursor, entity_type, original_name)
+        finally:
+            if internal_cursor:
+                cursor.close()
 
-            if entity_type == MetadataType.SYNOPSIS:
-                cursor.execute(
-                    "select synopsis_zh from movies where synopsis_ja = ?",
-                    (original_name,),
-                )
-                row = cursor.fetchone()
-                return row[0] if row and row[0] else None
-
-            # 其他实体从对应表查询
-            table_map = {
-                MetadataType.DIRECTOR: "directors",
-                MetadataType.ACTOR: "actor_names",
-                MetadataType.CATEGORY: "categories",
-                MetadataType.STUDIO: "studios",
-            }
-            table_name = table_map.get(entity_type)
-            if not table_name:
-                return None
+        # 只缓存已有的翻译，未翻译的实体可能稍后被写入
+        if translation:
+            self._entity_cache[key] = translation
+            if len(self._entity_cache) > ENTITY_CACHE_SIZE:
+                self._entity_cache.popitem(last=False)
+        return translation
+
+    @staticmethod
+    def _query_entity(
+        cursor: sqlite3.Cursor, entity_type: MetadataType, original_name: str
+    ) -> str | None:
+        """
+        从数据库中查询元数据实体的翻译，不经过缓存。
+
+        Args:
+            cursor (sqlite3.Cursor): 数据库游标
+            entity_type (MetadataType): 实体类型
+            original_name (str): 日文原文
+
+        Returns:
+            str | None: 中文翻译，如果不存在则返回None
+        """
+        # TITLE和SYNOPSIS从movies表查询（修复表名）
+        if entity_type == MetadataType.TITLE:
+            cursor.execute(
+                "select title_zh from movies where title_ja = ?", (original_name,)
+            )
+            row = cursor.fetchone()
+            return row[0] if row and row[0] else None
 
+        if entity_type == MetadataType.SYNOPSIS:
             cursor.execute(
-                f"select name_zh from {table_name} where name_ja = ?",
+                "select synopsis_zh from movies where synopsis_ja = ?",
                 (original_name,),
             )
             row = cursor.fetchone()
             return row[0] if row and row[0] else None
-        finally:
-            if internal_cursor and conn:
-                conn.close()
+
+        # 其他实体从对应表查询
+        table_map = {
+            MetadataType.DIRECTOR: "directors",
+            MetadataType.ACTOR: "actor_names",
+            MetadataType.CATEGORY: "categories",
+            MetadataType.STUDIO: "studios",
+        }
+        table_name = table_map.get(entity_type)
+        if not table_name:
+            return None
+
+        cursor.execute(
+            f"select name_zh from {table_name} where name_ja = ?",
+            (original_name,),
+        )
+        row = cursor.fetchone()
+        return row[0] if row and row[0] else None
 
     def get_movie(
         self, movie_code: str, cursor: Optional[sqlite3.Cursor] = None
@@ -1018,12 +941,10 @@ class DatabaseManager:
         Returns:
             Movie | None: Movie对象，如果不存在则返回None
         """
-        conn = None
         internal_cursor = False
         if cursor is None:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
+            cursor.row_factory = sqlite3.Row
             internal_cursor = True
 
         try:
@@ -1078,8 +999,8 @@ class DatabaseManager:
             return movie
 
         finally:
-            if internal_cursor and conn:
-                conn.close()
+            if internal_cursor:
+                cursor.close()
 
     def get_video(
         self, sha256: str, cursor: Optional[sqlite3.Cursor] = None
@@ -1094,12 +1015,10 @@ class DatabaseManager:
         Returns:
             Video | None: Video对象，如果不存在则返回None
         """
-        conn = None
         internal_cursor = False
         if cursor is None:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
+            cursor.row_factory = sqlite3.Row
             internal_cursor = True
 
         try:
@@ -1120,16 +1039,15 @@ class DatabaseManager:
 
             # 加载流水线状态和副产品
             for phase in self.video_phases:
-                if phase not in self.phase_to_column:
+                if phase not in self._phase_to_idx:
                     continue
 
-                status_col, path_col = self.phase_to_column[phase]
+                status_idx, path_idx = self._phase_to_idx[phase]
 
-                # 加载状态 - 修复枚举值处理
-                if status_col and row[status_col]:
+                # 加载状态 - StageStatus枚举值是字符串，直接存储和读取
+                status_str = row[status_idx]
+                if status_str:
                     try:
-                        # StageStatus枚举值是字符串，直接存储和读取
-                        status_str = row[status_col]
                         video.status[phase] = StageStatus(status_str)
                     except (ValueError, TypeError):
                         video.status[phase] = StageStatus.PENDING
@@ -1137,14 +1055,15 @@ class DatabaseManager:
                     video.status[phase] = StageStatus.PENDING
 
                 # 加载副产品路径
-                if path_col and row[path_col]:
-                    video.by_products[phase] = row[path_col]
+                path = row[path_idx]
+                if path:
+                    video.by_products[phase] = path
 
             return video
 
         finally:
-            if internal_cursor and conn:
-                conn.close()
+            if internal_cursor:
+                cursor.close()
 
     def update_video_location(
         self,
@@ -1153,12 +1072,7 @@ class DatabaseManager:
         new_absolute_path: str,
         cursor: Optional[sqlite3.Cursor] = None,
     ):
-        internal_cursor = False
-        if cursor is None:
-            cursor = self.get_cursor(commit=True).__enter__()
-            internal_cursor = True
-
-        try:
+        with self._get_cursor_context(cursor) as (internal_cursor, cursor):
             # 修复表名
             cursor.execute(
                 """
@@ -1176,104 +1090,232 @@ class DatabaseManager:
                 """,
                 (filename, video.sha256),
             )
-        finally:
-            if internal_cursor:
-                pass  # 上下文管理器会自动处理连接
 
     def update_video(self, video: Video, cursor: Optional[sqlite3.Cursor] = None):
+        status_get = video.status.get
+        path_get = video.by_products.get
+        # StageStatus枚举的value是字符串；未设置的列传 None，由 coalesce 保留原值
+        params = [
+            status.value if (status := status_get(phase)) else None
+            for phase in self._phase_order
+        ]
+        path_params: List[Optional[str]] = [None] * (max(self._path_slots) + 1)
+        for slot, phase in zip(self._path_slots, self._phase_order):
+            path = path_get(phase)
+            if path:
+                path_params[slot] = path
+        params.extend(path_params)
+
+        if not any(params):
+            return  # Nothing to update
+
+        params.append(video.sha256)
+        with self._get_cursor_context(cursor) as (internal_cursor, cursor):
+            cursor.execute(self._update_video_sql, params)
+
+    @staticmethod
+    def _scan_existence(by_parent: Dict[str, List[str]], into: Dict[str, bool]):
+        """
+        对包含多个待检查文件的父目录调用一次 os.scandir，把找到的文件记为存在。
+
+        扫描结果只作为命中使用：大小写不敏感的文件系统、".."或末尾分隔符等情况下文件名比对
+        可能漏判，未命中的路径不写入 into，由 _path_exists 回退到 os.path.exists。
+        符号链接可能已失效，同样交给 os.path.exists 判断。只有一个文件的目录直接 stat
+        更省，不扫描。
+
+        Args:
+            by_parent (Dict[str, List[str]]): 父目录到待检查文件路径的映射
+            into (Dict[str, bool]): 写入检查结果的字典
+        """
+        for parent, children in by_parent.items():
+            # 翻译与双语字幕共用路径列，同一路径可能出现多次
+            children = set(children)
+            if len(children) < 2:
+                continue
+            try:
+                with os.scandir(parent or ".") as entries:
+                    names = {entry.name for entry in entries if not entry.is_symlink()}
+            except OSError:
+                continue
+            for path in children:
+                if os.path.basename(path) in names:
+                    into[path] = True
+
+    def _path_exists(self, path: str, exists_cache: Dict[str, bool]) -> bool:
+        """
+        检查文件是否存在，优先使用本次调用的缓存。
+
+        Args:
+            path (str): 文件路径
+            exists_cache (Dict[str, bool]): 单次 set_video_status 调用内的缓存
+
+        Returns:
+            bool: 文件是否存在
+        """
+        exists = exists_cache.get(path)
+        if exists is None:
+            exists = os.path.exists(path)
+            exists_cache[path] = exists
+        return exists
+
+    def set_video_status(self, video: Video, cursor: Optional[sqlite3.Cursor] = None):
         internal_cursor = False
         if cursor is None:
-            cursor = self.get_cursor(commit=True).__enter__()
+            # 按预计算的下标读取列，普通元组即可，无需 sqlite3.Row
+            cursor = self._get_conn().cursor()
             internal_cursor = True
 
         try:
-            set_clauses = []
-            params = []
-            for phase, (status_col, path_col) in self.phase_to_column.items():
-                if status_col:
-                    status = video.status.get(phase)
-                    if status:
-                        set_clauses.append(f"{status_col} = ?")
-                        params.append(status.value)  # StageStatus枚举的value是字符串
-                if path_col:
-                    path = video.by_products.get(phase)
-                    if path:
-                        set_clauses.append(f"{path_col} = ?")
-                        params.append(path)
+            # 先只读取最终产物路径和各阶段状态；双语字幕已合并且文件存在时无需读取整行。
+            # 翻译阶段与双语字幕共用路径列，只看文件是否存在会把"已翻译、未合并"误当作完成
+            cursor.execute(self._final_product_probe_sql, (video.sha256,))
+            probe = cursor.fetchone()
+            if not probe:
+                return
 
-            if not set_clauses:
-                return  # Nothing to update
+            final_product_path = probe[0]
+            statuses = [self._parse_status(status_str) for status_str in probe[1:]]
+            exists_cache: Dict[str, bool] = {}
+            if (
+                statuses[self._final_product_status_idx] is StageStatus.SUCCESS
+                and final_product_path
+                and self._path_exists(final_product_path, exists_cache)
+            ):
+                video.status.update(zip(self._phase_order, statuses))
+                for phase in self._final_product_phases:
+                    video.by_products[phase] = final_product_path
+                return
 
             # 修复表名
-            sql = f"update videos set {', '.join(set_clauses)} where sha256 = ?"
-            params.append(video.sha256)
-
-            cursor.execute(sql, tuple(params))
+            cursor.execute("select * from videos where sha256 = ?", (video.sha256,))
+            self._apply_video_row(video, cursor.fetchone(), exists_cache)
         finally:
             if internal_cursor:
-                pass  # 上下文管理器会自动处理连接
+                cursor.close()
+
+    def set_video_status_batch(
+        self, videos: List[Video], cursor: Optional[sqlite3.Cursor] = None
+    ):
+        """
+        批量同步视频状态，用一次查询代替逐个调用 set_video_status。
+
+        视频数量不超过 BATCH_IN_LIMIT 时使用 IN 子句，否则先写入临时表再联表查询，
+        以避开 SQLite 的参数个数上限。同一目录下的多个产物路径会先用一次 scandir 批量检查。
+
+        Args:
+            videos (List[Video]): 待同步状态的视频列表
+            cursor (Optional[sqlite3.Cursor]): 数据库游标，如果为None则内部创建
+        """
+        if not videos:
+            return
 
-    def set_video_status(self, video: Video, cursor: Optional[sqlite3.Cursor] = None):
-        conn = None
         internal_cursor = False
         if cursor is None:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
             internal_cursor = True
 
         try:
-            # 修复表名
-            cursor.execute("select * from videos where sha256 = ?", (video.sha256,))
-            row = cursor.fetchone()
-            if not row:
-                return
+            sha256s = [video.sha256 for video in videos]
+            if len(sha256s) <= BATCH_IN_LIMIT:
+                placeholders = ", ".join("?" * len(sha256s))
+                cursor.execute(
+                    f"select * from videos where sha256 in ({placeholders})", sha256s
+                )
+                rows = cursor.fetchall()
+            else:
+                cursor.execute(
+                    "create temp table if not exists tmp_sha256 (sha256 text primary key)"
+                )
+                cursor.execute("delete from tmp_sha256")
+                cursor.executemany(
+                    "insert or ignore into tmp_sha256 (sha256) values (?)",
+                    [(sha256,) for sha256 in sha256s],
+                )
+                cursor.execute(
+                    "select videos.* from videos join tmp_sha256 using (sha256)"
+                )
+                rows = cursor.fetchall()
+                cursor.execute("delete from tmp_sha256")
+
+            # sha256 是 videos 表的第一列
+            row_by_sha256 = {row[0]: row for row in rows}
+            by_parent: Dict[str, List[str]] = {}
+            for row in rows:
+                for _, path_idx in self._phase_to_idx.values():
+                    path = row[path_idx]
+                    if path:
+                        by_parent.setdefault(os.path.dirname(path), []).append(path)
+            exists_cache: Dict[str, bool] = {}
+            self._scan_existence(by_parent, exists_cache)
+            for video in videos:
+                row = row_by_sha256.get(video.sha256)
+                if row:
+                    self._apply_video_row(video, row, exists_cache)
+        finally:
+            if internal_cursor:
+                cursor.close()
 
-            # 1. 根据清单文件中的状态更新video.status和video.by_products
-            for phase in self.video_phases:
-                if phase not in self.phase_to_column:
-                    continue
+    @staticmethod
+    def _parse_status(status_str: Optional[str]) -> StageStatus:
+        """
+        将数据库中的状态字符串转换为 StageStatus，空值或非法值视为 PENDING。
 
-                status_col, path_col = self.phase_to_column[phase]
+        Args:
+            status_str (Optional[str]): 状态列的值
 
-                # 修复状态读取逻辑
-                if status_col and row[status_col]:
-                    try:
-                        status_str = row[status_col]
-                        video.status[phase] = StageStatus(status_str)
-                    except (ValueError, TypeError):
-                        video.status[phase] = StageStatus.PENDING
-                else:
-                    video.status[phase] = StageStatus.PENDING
+        Returns:
+            StageStatus: 阶段状态
+        """
+        return _STATUS_BY_VALUE.get(status_str, StageStatus.PENDING)
 
-                path = row[path_col] if path_col and row[path_col] else None
-                if path:
-                    video.by_products[phase] = path
+    def _apply_video_row(self, video: Video, row: Tuple, exists_cache: Dict[str, bool]):
+        """
+        根据 videos 表中的一行更新视频的状态与产物路径，并按产物是否存在重置状态。
 
-            # 2. 检查文件是否存在，并根据最终产物状态决定是否重置
-            final_product_path_col = self.phase_to_column[
-                PiplinePhase.BILINGUAL_SUBTITLE
-            ][1]
-            final_product_path = row[final_product_path_col]
-            final_product_exists = (
-                final_product_path and Path(final_product_path).exists()
-            )
+        Args:
+            video (Video): 待更新的视频对象
+            row (Tuple): ``select * from videos`` 返回的行
+            exists_cache (Dict[str, bool]): 文件存在性缓存
+        """
+        # 1. 根据清单文件中的状态更新video.status和video.by_products
+        for phase in self.video_phases:
+            if phase not in self._phase_to_idx:
+                continue
 
-            if final_product_exists:
-                return
+            status_idx, path_idx = self._phase_to_idx[phase]
 
-            # 如果最终的双语字幕不存在，则检查中间产物，并重置状态
-            for i, phase in enumerate(self.video_phases):
-                path = video.by_products.get(phase)
-                if path is None or not Path(path).exists():
-                    for subsequent_phase in self.video_phases[i:]:
-                        video.status[subsequent_phase] = StageStatus.PENDING
-                        if subsequent_phase in video.by_products:
-                            del video.by_products[subsequent_phase]
-                    break
-        finally:
-            if internal_cursor and conn:
-                conn.close()
+            video.status[phase] = self._parse_status(row[status_idx])
+
+            path = row[path_idx]
+            if path:
+                video.by_products[phase] = path
+
+        # 2. 检查文件是否存在，并根据最终产物状态决定是否重置
+        final_product_path_idx = self._phase_to_idx[PiplinePhase.BILINGUAL_SUBTITLE][1]
+        final_product_path = row[final_product_path_idx]
+        final_product_exists = final_product_path and self._path_exists(
+            final_product_path, exists_cache
+        )
+
+        if final_product_exists:
+            return
+
+        # 如果最终的双语字幕不存在，则检查中间产物，并重置状态。
+        # 同一目录下有多个尚未检查的产物时，用一次 scandir 代替逐个 stat
+        siblings: Dict[str, List[str]] = {}
+        for path in video.by_products.values():
+            if path not in exists_cache:
+                siblings.setdefault(os.path.dirname(path), []).append(path)
+        self._scan_existence(siblings, exists_cache)
+
+        for i, phase in enumerate(self.video_phases):
+            path = video.by_products.get(phase)
+            if path is None or not self._path_exists(path, exists_cache):
+                for subsequent_phase in self.video_phases[i:]:
+                    video.status[subsequent_phase] = StageStatus.PENDING
+                    if subsequent_phase in video.by_products:
+                        del video.by_products[subsequent_phase]
+                break
 
     @staticmethod
     def _get_or_create_actor_id(actor: Actor, cursor: sqlite3.Cursor) -> str:
@@ -1348,12 +1390,7 @@ class DatabaseManager:
                 )
 
     def update_terms(self, movie: Movie, cursor: Optional[sqlite3.Cursor] = None):
-        internal_cursor = False
-        if cursor is None:
-            cursor = self.get_cursor(commit=True).__enter__()
-            internal_cursor = True
-
-        try:
+        with self._get_cursor_context(cursor) as (internal_cursor, cursor):
             # 先删除旧的术语
             cursor.execute("DELETE FROM terms WHERE movie_code = ?", (movie.code,))
 
@@ -1371,9 +1408,6 @@ class DatabaseManager:
                         movie.code,
                     ),
                 )
-        finally:
-            if internal_cursor:
-                pass  # 上下文管理器会自动处理连接
 
     # ========== 全局术语库方法 ==========
 
@@ -23,10 +23,12 @@ class TranscriberFactory:
         if type == "whisper":
             model_size = kwargs.get("model_size", "medium")
             device = kwargs.get("device", "cuda")
-            compute_type = kwargs.get("compute_type", "float16")
+            compute_type = kwargs.get("compute_type")
             language = kwargs.get("language", "ja")
             beam_size = kwargs.get("beam_size", 6)
             vad_filter = kwargs.get("vad_filter", True)
+            batch_size = kwargs.get("batch_size", 16)
+            high_precision = kwargs.get("high_precision", False)
 
             return WhisperTranscriber(
                 model_size=model_size,
@@ -35,6 +37,8 @@ class TranscriberFactory:
                 language=language,
                 beam_size=beam_size,
                 vad_filter=vad_filter,
+                batch_size=batch_size,
+                high_precision=high_precision,
             )
         else:
             raise ValueError(f"Unknown transcriber type: {type}")
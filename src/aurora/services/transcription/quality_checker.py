@@ -1,13 +1,133 @@
+import contextvars
+import hashlib
 import json
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator, List, MutableMapping, Optional, Tuple
 
+import numpy as np
 from aurora.domain.results import ChatResult
 from aurora.pipeline.context import PipelineContext
 from aurora.services.translation.provider import Provider
 from aurora.utils.logger import get_logger
 from langfuse import observe, get_client
 
+try:
+    from diskcache import Cache as DiskCache
+except ImportError:
+    DiskCache = None
+
+# orjson 解析LLM响应更快；它的 JSONDecodeError 与标准库一样是 ValueError 的子类
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 logger = get_logger(__name__)
 
+# SRT 时间戳 H:MM:SS,mmm，小时位数不限，分秒允许一位，毫秒可省略或用 "." 分隔
+_SRT_TIME_PATTERN = r"(\d+):(\d{1,2}):(\d{1,2})(?:[,.](\d{1,3}))?"
+# 匹配 SRT 字幕块的序号行和紧随其后的时间轴行 HH:MM:SS,mmm --> HH:MM:SS,mmm
+_SRT_BLOCK_RE = re.compile(
+    r"^[ \t]*(\d+)[ \t]*\r?\n"
+    rf"[ \t]*{_SRT_TIME_PATTERN}[ \t]*-->[ \t]*{_SRT_TIME_PATTERN}",
+    re.MULTILINE,
+)
+
+# 送给 LLM 检查的样本取开头和结尾各多少条字幕
+LLM_SAMPLE_HEAD = 20
+LLM_SAMPLE_TAIL = 20
+
+# LLM 质量检测的提示词
+_LLM_CHECK_INTRO = """You are an ultra-fast subtitle quality check API. Your task is to determine if a subtitle file is structurally broken based on a small sample. Your response must be immediate and only in the specified JSON format.
+
+"""
+_LLM_CHECK_CRITERIA = """**Analysis Criteria (Based ONLY on the sample):**
+1.  **Structural Damage:** Is the file completely missing timestamps (`-->`) or is the sequence number logic broken?
+2.  **Unusable Garbage:** Is the text composed of random characters (e.g., "j@#f!d$"), encoding errors (e.g., ""), or ONLY consists of meaningless, non-dialogue placeholders like "Music" or "Opening" in the entire sample?
+
+"""
+_LLM_CHECK_ACCEPTABLE = """**IMPORTANT: Do NOT fail a file for these reasons (These are ACCEPTABLE):**
+- **Natural Conversation:** The presence of common conversational fillers/interjections in Japanese (e.g., 「えっと」「うん」「あの」「はい」「うーん」) is NORMAL and indicates a good transcription. DO NOT count these as errors.
+- **Time Gaps:** Large gaps in timestamps between subtitle entries are NORMAL and simply mean there is no dialogue in that part of the video.
+- **Advertisements:** The presence of ads at the beginning or end is acceptable.
+
+"""
+# 精简提示词中代替上面“可接受情况”列表的一句话
+_LLM_CHECK_ACCEPTABLE_SHORT = (
+    "Accept natural Japanese fillers, time gaps, and ads at the start or end.\n\n"
+)
+_LLM_CHECK_OUTPUT = """**Output Format (Your entire response MUST be ONLY this valid JSON object):**
+- If the sample appears usable for further processing: `{"qualified": true}`
+- If the sample is structurally broken or pure garbage: `{"qualified": false, "reason": "A very brief, 10-word max explanation."}`
+"""
+
+
+def _minify_prompt(prompt: str) -> str:
+    """去掉 Markdown 加粗标记，合并连续的空格和空行。
+
+    Args:
+        prompt: 原始提示词
+
+    Returns:
+        str: 精简后的提示词
+    """
+    prompt = prompt.replace("**", "")
+    prompt = re.sub(r"[ \t]+", " ", prompt)
+    prompt = re.sub(r"\n\s*\n", "\n", prompt)
+    return prompt.strip()
+
+
+LLM_CHECK_SYSTEM_PROMPT = (
+    _LLM_CHECK_INTRO + _LLM_CHECK_CRITERIA + _LLM_CHECK_ACCEPTABLE + _LLM_CHECK_OUTPUT
+)
+# 默认使用的精简提示词：同样的判定标准和JSON输出约定，去掉格式标记和“可接受情况”列表，长度约少三分之一
+LLM_CHECK_SYSTEM_PROMPT_MINIFIED = _minify_prompt(
+    _LLM_CHECK_INTRO
+    + _LLM_CHECK_CRITERIA
+    + _LLM_CHECK_ACCEPTABLE_SHORT
+    + _LLM_CHECK_OUTPUT
+)
+
+# LLM 返回的内容不是合法JSON时，最多请求的次数（含第一次）
+LLM_JSON_ATTEMPTS = 3
+LLM_JSON_REPAIR_PROMPT = (
+    "Your prior output was not valid JSON: {snippet}. Output ONLY the JSON object."
+)
+
+
+def _dump_user_query(user_query: dict) -> str:
+    """把用户消息序列化为紧凑的JSON。
+
+    固定字段在前、字幕文本在后，同样的前缀每次序列化出同样的字节，便于服务端缓存前缀。
+
+    Args:
+        user_query: 用户消息字典
+
+    Returns:
+        str: 不转义非ASCII字符、不含多余空白的JSON文本
+    """
+    return json.dumps(user_query, ensure_ascii=False, separators=(",", ":"))
+
+
+# LLM 质量检测结果的缓存有效期（秒）
+LLM_CACHE_TTL = 30 * 24 * 3600
+
+
+@dataclass
+class ParsedSrt:
+    """一次扫描SRT文本得到的解析结果，供格式、规则和LLM检查共用。
+
+    Attributes:
+        timestamps (np.ndarray): 形状为 (N, 2) 的数组，每行为 (start_time, end_time) 的秒数
+        block_starts (List[int]): 每个字幕块在原文中的起始偏移
+    """
+
+    timestamps: np.ndarray
+    block_starts: List[int]
+
 
 class QualityChecker:
     """字幕质量检测器。
@@ -15,15 +135,29 @@ class QualityChecker:
     提供基于大模型的质量检测功能。
     """
 
-    def __init__(self, check_provider: Provider, interval: int):
+    def __init__(
+        self,
+        check_provider: Provider,
+        interval: int,
+        cache: Optional[MutableMapping[str, Tuple[float, bool]]] = None,
+        minified_prompt: bool = True,
+    ):
         """初始化质量检测器。
 
         Args:
             check_provider: 大模型服务提供者
             interval: 基于规则的质量检查中允许的最大间隔，单位为秒
+            cache: LLM 检测结果缓存，键为提示词和样本的哈希，值为 (写入时间, 是否合格)；
+                为None时不缓存
+            minified_prompt: 是否使用精简的系统提示词，为False时使用完整提示词
         """
         self.check_provider = check_provider
         self.interval = interval
+        self.cache = cache
+        if minified_prompt:
+            self.system_prompt = LLM_CHECK_SYSTEM_PROMPT_MINIFIED
+        else:
+            self.system_prompt = LLM_CHECK_SYSTEM_PROMPT
 
     @classmethod
     def from_config_yaml(cls, file_path: str):
@@ -51,7 +185,19 @@ class QualityChecker:
         """
         check_provider = Provider.from_config(config["check_provider"])
         interval = config.get("interval", 10)
-        return cls(check_provider=check_provider, interval=interval)
+        cache = None
+        cache_dir = config.get("cache_dir")
+        if cache_dir:
+            if DiskCache is None:
+                logger.warning("未安装 diskcache，LLM 质量检测结果将不会被缓存")
+            else:
+                cache = DiskCache(cache_dir)
+        return cls(
+            check_provider=check_provider,
+            interval=interval,
+            cache=cache,
+            minified_prompt=config.get("minified_prompt", True),
+        )
 
     @observe
     def _llm_quality_check(self, text: str, context: PipelineContext) -> bool:
@@ -63,80 +209,150 @@ class QualityChecker:
         Returns:
             bool: 如果字幕质量合格返回True，否则返回False。
         """
-        system_prompt = """You are an ultra-fast subtitle quality check API. Your task is to determine if a subtitle file is structurally broken based on a small sample. Your response must be immediate and only in the specified JSON format.
-
-**Analysis Criteria (Based ONLY on the sample):**
-1.  **Structural Damage:** Is the file completely missing timestamps (`-->`) or is the sequence number logic broken?
-2.  **Unusable Garbage:** Is the text composed of random characters (e.g., "j@#f!d$"), encoding errors (e.g., ""), or ONLY consists of meaningless, non-dialogue placeholders like "Music" or "Opening" in the entire sample?
+        messages = self._check_messages(text)
+        # temperature=0 时同样的输入得到同样的结论，命中缓存则直接返回
+        cache_key = self._cache_key(messages)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.info("Subtitle quality check hit cache: qualified=%s", cached)
+            return cached
 
-**IMPORTANT: Do NOT fail a file for these reasons (These are ACCEPTABLE):**
-- **Natural Conversation:** The presence of common conversational fillers/interjections in Japanese (e.g., 「えっと」「うん」「あの」「はい」「うーん」) is NORMAL and indicates a good transcription. DO NOT count these as errors.
-- **Time Gaps:** Large gaps in timestamps between subtitle entries are NORMAL and simply mean there is no dialogue in that part of the video.
-- **Advertisements:** The presence of ads at the beginning or end is acceptable.
-
-**Output Format (Your entire response MUST be ONLY this valid JSON object):**
-- If the sample appears usable for further processing: `{"qualified": true}`
-- If the sample is structurally broken or pure garbage: `{"qualified": false, "reason": "A very brief, 10-word max explanation."}`
-"""
         langfuse = get_client()
         langfuse.update_current_trace(
             session_id=context.langfuse_session_id,
             tags=["quality_check", "subtitle", context.movie_code],
         )
-        user_query = {"info": "这是一个成人影片的视频字幕", "text": text}
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": str(user_query)},
-        ]
         logger.info("Checking subtitle quality with low-cost LLM...")
-        result: ChatResult = self.check_provider.chat(
-            messages, temperature=0.0, response_format={"type": "json_object"}
-        )
-        if result.success:
+        for attempt in range(1, LLM_JSON_ATTEMPTS + 1):
+            result: ChatResult = self.check_provider.chat(
+                messages, temperature=0.0, response_format={"type": "json_object"}
+            )
+            if not result.success:
+                logger.error("Failed to check subtitle quality")
+                return True
             logger.info(
                 f"Subtitle quality check completed. Spend {result.time_taken / 1000.0} seconds."
             )
             try:
-                result_json_object = json.loads(result.content)
-                logger.info(
-                    f"Subtitle quality check completed. Response is {result_json_object}"
+                result_json_object = json_loads(result.content)
+            except ValueError as e:
+                logger.warning(
+                    "Quality check result is not valid JSON (attempt %d/%d): %s",
+                    attempt,
+                    LLM_JSON_ATTEMPTS,
+                    e,
                 )
-                if result_json_object.get("qualified", True):  # 乐观估计，默认合格
-                    return True
-                else:
-                    logger.warning(
-                        f"Subtitle quality based on llm check failed: {result_json_object.get('reason', 'No reason provided')}"
-                    )
-                    return False
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse quality check result as JSON: {e}")
+                # 把错误输出和修正要求追加到对话中，要求模型只输出JSON对象
+                messages = messages + [
+                    {"role": "assistant", "content": result.content},
+                    {
+                        "role": "user",
+                        "content": LLM_JSON_REPAIR_PROMPT.format(
+                            snippet=result.content[:200]
+                        ),
+                    },
+                ]
+                continue
+
+            logger.info(
+                f"Subtitle quality check completed. Response is {result_json_object}"
+            )
+            if result_json_object.get("qualified", True):  # 乐观估计，默认合格
+                self._set_cached(cache_key, True)
                 return True
-        else:
-            logger.error("Failed to check subtitle quality")
-            return True
+            else:
+                logger.warning(
+                    f"Subtitle quality based on llm check failed: {result_json_object.get('reason', 'No reason provided')}"
+                )
+                self._set_cached(cache_key, False)
+                return False
+
+        logger.error(
+            "Failed to parse quality check result as JSON after %d attempts",
+            LLM_JSON_ATTEMPTS,
+        )
+        return True
+
+    def _check_messages(self, text: str) -> List[dict]:
+        """构造单份字幕LLM检查的消息列表。
+
+        Args:
+            text: 待检查的字幕文本
 
-    def _rule_quality_check(self, text: str) -> bool:
+        Returns:
+            List[dict]: 发送给大模型的消息列表
+        """
+        user_query = {"info": "这是一个成人影片的视频字幕", "text": text}
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": _dump_user_query(user_query)},
+        ]
+
+    @staticmethod
+    def _cache_key(messages: List[dict]) -> str:
+        """计算LLM检测请求的缓存键。
+
+        Args:
+            messages: 发送给大模型的消息列表
+
+        Returns:
+            str: 各消息内容以 NUL 分隔后的 SHA-256 十六进制摘要
+        """
+        payload = "\0".join(message["content"] for message in messages)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_cached(self, key: str) -> Optional[bool]:
+        """读取未过期的缓存结果。
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[bool]: 缓存的检测结论，未命中或已过期时返回None
+        """
+        if self.cache is None:
+            return None
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        created_at, qualified = entry
+        if time.time() - created_at > LLM_CACHE_TTL:
+            return None
+        return qualified
+
+    def _set_cached(self, key: str, qualified: bool):
+        """写入检测结论，只在LLM调用成功且返回合法JSON时调用。
+
+        Args:
+            key: 缓存键
+            qualified: 检测结论
+        """
+        if self.cache is not None:
+            self.cache[key] = (time.time(), qualified)
+
+    def _rule_quality_check(
+        self, text: str, parsed: Optional[ParsedSrt] = None
+    ) -> bool:
         """
         使用规则对字幕质量进行检查。若前一条字幕的结束时间和后一条字幕的开始时间相差过大，则认为质量不合格。
         Args:
             text (str): 待检查的字幕文本。
+            parsed (Optional[ParsedSrt]): 已有的解析结果，为None时从text解析
         Returns:
             bool: 如果字幕质量合格返回True，否则返回False。
         """
         try:
-            timestamps = self._parse_srt_timestamps(text)
+            if parsed is None:
+                parsed = self._parse_srt(text)
+            timestamps = parsed.timestamps
 
             if len(timestamps) < 2:
                 logger.warning("字幕条目数量不足")
                 return True  # 单条字幕也视为合格
 
-            # 计算相邻字幕之间的最大间隔
-            max_gap = 0
-            for i in range(1, len(timestamps)):
-                gap = (
-                    timestamps[i][0] - timestamps[i - 1][1]
-                )  # 当前开始时间 - 前一个结束时间
-                max_gap = max(max_gap, gap)
+            # 计算相邻字幕之间的最大间隔：当前开始时间 - 前一个结束时间
+            gaps = timestamps[1:, 0] - timestamps[:-1, 1]
+            max_gap = max(0.0, float(gaps.max()))
 
             logger.info(f"最大时间间隔: {max_gap} 秒")
 
@@ -150,131 +366,90 @@ class QualityChecker:
             logger.error(f"规则质量检测失败: {e}")
             return False
 
-    def _format_quality_check(self, text: str) -> bool:
+    def _format_quality_check(
+        self, text: str, parsed: Optional[ParsedSrt] = None
+    ) -> bool:
         """
         使用格式对字幕质量进行检查。若字幕文件缺少时间戳或序号逻辑错误，则认为质量不合格。
         Args:
             text (str): 待检查的字幕文本。
+            parsed (Optional[ParsedSrt]): 已有的解析结果，为None时只搜索第一个字幕块
         Returns:
             bool: 如果字幕质量合格返回True，否则返回False。
         """
-        try:
-            lines = text.strip().split("\n")
-
-            # 检查基本格式
-            if not lines:
-                logger.warning("字幕文件为空")
-                return False
-
-            # 检查时间戳格式
-            has_timestamps = False
-            has_sequence = False
-
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-
-                # 检查序号行
-                if line.isdigit():
-                    has_sequence = True
-                    i += 1
-                    if i >= len(lines):
-                        break
-
-                    # 检查时间轴行
-                    time_line = lines[i].strip()
-                    if "-->" in time_line:
-                        has_timestamps = True
-                        i += 2  # 跳过时间轴行和文本行
-                    else:
-                        i += 1
-                else:
-                    i += 1
-
-            if not has_timestamps:
-                logger.warning("字幕文件缺少时间戳")
-                return False
-
-            if not has_sequence:
-                logger.warning("字幕文件缺少序号")
-                return False
+        if not text.strip():
+            logger.warning("字幕文件为空")
+            return False
 
-            return True
+        # 完全没有时间轴箭头时不必再跑正则，子串查找在C层完成
+        if "-->" not in text:
+            logger.warning("字幕文件缺少时间戳")
+            return False
 
-        except Exception as e:
-            logger.error(f"格式质量检测失败: {e}")
+        # 至少要有一个“序号行 + 时间轴行”的字幕块
+        if parsed is not None:
+            has_block = bool(parsed.block_starts)
+        else:
+            has_block = _SRT_BLOCK_RE.search(text) is not None
+        if not has_block:
+            logger.warning("字幕文件缺少序号或时间戳")
             return False
 
-    def _parse_srt_timestamps(self, srt_content: str) -> list:
-        """解析SRT文件中的时间戳。
+        return True
+
+    @staticmethod
+    def _parse_srt(srt_content: str) -> ParsedSrt:
+        """用一个预编译的正则一次扫描全文，得到各字幕块的时间戳和起始偏移。
 
         Args:
             srt_content: SRT字幕内容
 
         Returns:
-            时间戳列表，每个元素为 (start_time, end_time) 的秒数
+            ParsedSrt: 解析结果
         """
         timestamps = []
-        lines = srt_content.strip().split("\n")
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # 检查是否为序号行
-            if line.isdigit():
-                i += 1
-                if i >= len(lines):
-                    break
-
-                # 检查是否为时间轴行
-                time_line = lines[i].strip()
-                if "-->" in time_line:
-                    # 解析时间格式 HH:MM:SS,mmm --> HH:MM:SS,mmm
-                    times = time_line.split(" --> ")
-                    if len(times) == 2:
-                        start_seconds = self._parse_srt_time(times[0])
-                        end_seconds = self._parse_srt_time(times[1])
-                        timestamps.append((start_seconds, end_seconds))
-                    i += 2  # 跳过时间轴行和文本行
-                else:
-                    i += 1
-            else:
-                i += 1
-
-        return timestamps
+        block_starts = []
+        for match in _SRT_BLOCK_RE.finditer(srt_content):
+            _, h1, m1, s1, ms1, h2, m2, s2, ms2 = match.groups()
+            # 先在整数毫秒上累加，最后只做一次除法，结果是离真实时间最近的浮点数
+            start_ms = ((int(h1) * 60 + int(m1)) * 60 + int(s1)) * 1000 + int(ms1 or 0)
+            end_ms = ((int(h2) * 60 + int(m2)) * 60 + int(s2)) * 1000 + int(ms2 or 0)
+            timestamps.append((start_ms / 1000.0, end_ms / 1000.0))
+            block_starts.append(match.start())
+        return ParsedSrt(
+            timestamps=np.array(timestamps, dtype=np.float64).reshape(-1, 2),
+            block_starts=block_starts,
+        )
 
-    def _parse_srt_time(self, time_str: str) -> float:
-        """将SRT时间格式转换为秒数。
+    @classmethod
+    def _parse_srt_timestamps(cls, srt_content: str) -> np.ndarray:
+        """解析SRT文件中的时间戳。
 
         Args:
-            time_str: SRT时间字符串 (HH:MM:SS,mmm)
+            srt_content: SRT字幕内容
 
         Returns:
-            秒数
+            形状为 (N, 2) 的数组，每行为 (start_time, end_time) 的秒数
         """
-        # 处理可能的空格
-        time_str = time_str.strip()
+        return cls._parse_srt(srt_content).timestamps
 
-        # 分离毫秒部分
-        if "," in time_str:
-            time_part, ms_part = time_str.split(",")
-            milliseconds = int(ms_part)
-        else:
-            time_part = time_str
-            milliseconds = 0
-
-        # 解析时分秒
-        parts = time_part.split(":")
-        if len(parts) == 3:
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            seconds = int(parts[2])
-        else:
-            raise ValueError(f"Invalid time format: {time_str}")
+    @staticmethod
+    def _sample_text(text: str, parsed: ParsedSrt) -> str:
+        """取开头 LLM_SAMPLE_HEAD 条和结尾 LLM_SAMPLE_TAIL 条字幕作为LLM检查的样本。
+
+        Args:
+            text (str): 完整的字幕文本
+            parsed (ParsedSrt): text 的解析结果
 
-        total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
-        return total_seconds
+        Returns:
+            str: 样本文本，字幕条数不多时返回原文
+        """
+        starts = parsed.block_starts
+        if len(starts) <= LLM_SAMPLE_HEAD + LLM_SAMPLE_TAIL:
+            return text
+        head = text[: starts[LLM_SAMPLE_HEAD]].rstrip()
+        tail = text[starts[-LLM_SAMPLE_TAIL] :].strip()
+        return f"{head}\n\n{tail}\n"
 
     def quality_check(self, text: str, context: PipelineContext) -> bool:
         """
@@ -285,8 +460,67 @@ class QualityChecker:
         Returns:
             bool: 如果字幕质量合格返回True，否则返回False。
         """
+        # 只解析一次，格式和规则检查共用解析结果，LLM 只看开头和结尾的样本
+        parsed = self._parse_srt(text)
         return (
-            self._format_quality_check(text)
-            and self._rule_quality_check(text)
-            and self._llm_quality_check(text, context)
+            self._format_quality_check(text, parsed)
+            and self._rule_quality_check(text, parsed)
+            and self._llm_quality_check(self._sample_text(text, parsed), context)
         )
+
+    def quality_check_stream(
+        self, blocks: Iterator[str], context: PipelineContext
+    ) -> Tuple[bool, str]:
+        """
+        一边接收转写产出的字幕块一边检查质量。
+
+        收到开头 LLM_SAMPLE_HEAD 条字幕后立即在后台线程用LLM检查开头样本，与后续转写重叠进行；
+        开头样本不合格时停止迭代并关闭blocks，剩余音频不再转写。转写结束后对全文做格式和规则检查，
+        再用LLM检查开头样本之后的结尾部分。
+        Args:
+            blocks (Iterator[str]): 逐条产出的SRT字幕块。
+            context(PipelineContext): 流水线执行上下文。
+        Returns:
+            Tuple[bool, str]: (是否合格, 已收到的字幕文本)
+        """
+        collected: List[str] = []
+        head_check: Optional[Future] = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for block in blocks:
+                collected.append(block)
+                if head_check is None:
+                    if len(collected) == LLM_SAMPLE_HEAD:
+                        # 复制当前上下文，让 langfuse 的观测链路延续到工作线程
+                        head_check = executor.submit(
+                            contextvars.copy_context().run,
+                            self._llm_quality_check,
+                            "".join(collected),
+                            context,
+                        )
+                elif head_check.done() and not head_check.result():
+                    logger.warning("开头样本未通过LLM质量检测，提前停止转写")
+                    close = getattr(blocks, "close", None)
+                    if close is not None:
+                        close()
+                    return False, "".join(collected)
+
+            text = "".join(collected)
+            parsed = self._parse_srt(text)
+            if not (
+                self._format_quality_check(text, parsed)
+                and self._rule_quality_check(text, parsed)
+            ):
+                return False, text
+            if head_check is None:
+                return (
+                    self._llm_quality_check(self._sample_text(text, parsed), context),
+                    text,
+                )
+            if not head_check.result():
+                return False, text
+
+        # 开头样本已检查过，只需再检查之后的最多 LLM_SAMPLE_TAIL 条字幕
+        tail_starts = parsed.block_starts[LLM_SAMPLE_HEAD:][-LLM_SAMPLE_TAIL:]
+        if not tail_starts:
+            return True, text
+        return self._llm_quality_check(text[tail_starts[0] :], context), text
@@ -68,8 +68,10 @@ class TranscriptionService:
                 # 创建转写器实例
                 transcriber = self.transcriber_factory.create_transcriber("whisper")
 
-                # 执行转写
-                srt_content = transcriber.transcribe(audio_path)
+                # 边转写边检查质量，开头样本不合格时提前停止转写
+                quality_passed, srt_content = self.quality_checker.quality_check_stream(
+                    transcriber.iter_srt_blocks(audio_path), context
+                )
 
                 if not srt_content:
                     logger.warning("转写结果为空")
@@ -79,11 +81,6 @@ class TranscriptionService:
                     else:
                         return False, None, "转写结果为空"
 
-                # 质量检测
-                quality_passed = self.quality_checker.quality_check(
-                    srt_content, context
-                )
-
                 if not quality_passed:
                     logger.warning("质量检测失败")
                     if attempt < self.max_retries:
@@ -0,0 +1,142 @@
+import threading
+import time
+from enum import Enum
+
+from aurora.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitState(Enum):
+    """熔断器状态。"""
+
+    CLOSED = "closed"  # 正常放行
+    OPEN = "open"  # 熔断中，快速失败
+    HALF_OPEN = "half_open"  # 熔断时间已过，放行少量探测请求
+
+
+class CircuitBreaker:
+    """基于连续失败次数的熔断器，熔断一段时间后通过半开探测自动恢复。
+
+    状态转换：
+        - CLOSED：连续失败达到 failure_threshold 次后转为 OPEN。
+        - OPEN：拒绝所有请求，open_ms 毫秒后转为 HALF_OPEN。
+        - HALF_OPEN：最多放行 half_open_requests 个探测请求；累计 success_threshold 次成功后
+          转为 CLOSED，任一探测失败则重新转为 OPEN。
+
+    线程安全，可被并发调用同一 Provider 的多个线程共享。
+
+    Attributes:
+        failure_threshold (int): 触发熔断的连续失败次数。
+        success_threshold (int): 半开状态下恢复所需的成功次数。
+        open_ms (int): 熔断持续时间（毫秒）。
+        half_open_requests (int): 半开状态下最多放行的探测请求数。
+        consecutive_failures (int): 当前连续失败次数。
+        last_open_ts (float): 最近一次熔断的 time.monotonic() 时间戳。
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        success_threshold: int = 2,
+        open_ms: int = 30000,
+        half_open_requests: int = 3,
+    ):
+        """初始化熔断器。
+
+        Args:
+            failure_threshold (int): 触发熔断的连续失败次数，默认5。
+            success_threshold (int): 半开状态下恢复所需的成功次数，默认2。
+            open_ms (int): 熔断持续时间（毫秒），默认30秒。
+            half_open_requests (int): 半开状态下最多放行的探测请求数，默认3。
+        """
+        self.failure_threshold = failure_threshold
+        self.success_threshold = success_threshold
+        self.open_ms = open_ms
+        self.half_open_requests = half_open_requests
+        self.consecutive_failures = 0
+        self.last_open_ts = 0.0
+        self._state = CircuitState.CLOSED
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """当前状态，熔断时间已过时会先转为 HALF_OPEN。
+
+        Returns:
+            CircuitState: 当前状态。
+        """
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        """判断是否放行一次请求。半开状态下每次放行都会占用一个探测名额。
+
+        Returns:
+            bool: 放行返回True，应快速失败时返回False。
+        """
+        with self._lock:
+            state = self._current_state()
+            if state is CircuitState.CLOSED:
+                return True
+            if (
+                state is CircuitState.HALF_OPEN
+                and self._half_open_calls < self.half_open_requests
+            ):
+                self._half_open_calls += 1
+                return True
+            return False
+
+    def on_success(self):
+        """记录一次服务端正常响应的调用。"""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.success_threshold:
+                    self._state = CircuitState.CLOSED
+                    self.consecutive_failures = 0
+                    logger.info("Circuit breaker closed after successful probes")
+            else:
+                self.consecutive_failures = 0
+
+    def on_failure(self):
+        """记录一次可重试的失败（超时、连接错误、5xx、限流等）。"""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._open()
+                return
+            self.consecutive_failures += 1
+            if (
+                self._state is CircuitState.CLOSED
+                and self.consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def trip(self):
+        """立即熔断，用于认证失败、额度不足等重试无法解决的错误。"""
+        with self._lock:
+            self._open()
+
+    def _current_state(self) -> CircuitState:
+        """返回当前状态，调用方需持有锁。"""
+        if (
+            self._state is CircuitState.OPEN
+            and (time.monotonic() - self.last_open_ts) * 1000 >= self.open_ms
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+            self._half_open_successes = 0
+            logger.info("Circuit breaker half-open, probing provider")
+        return self._state
+
+    def _open(self):
+        """转为 OPEN 状态，调用方需持有锁。"""
+        if self._state is not CircuitState.OPEN:
+            logger.warning(
+                "Circuit breaker opened (consecutive failures: %d)",
+                self.consecutive_failures,
+            )
+        self._state = CircuitState.OPEN
+        self.last_open_ts = time.monotonic()
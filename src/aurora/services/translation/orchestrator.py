@@ -1,5 +1,11 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import contextvars
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, MutableMapping, Optional
 
 from aurora.domain.context import TranslateContext
 from aurora.domain.enums import TaskType
@@ -13,18 +19,36 @@ from aurora.services.translation.strategies import (
     ContextualMetaDataStrategy,
     NoSliceSubtitleStrategy,
 )
+from aurora.utils.logger import get_logger
 from langfuse import observe
-from yaml import safe_load
+
+logger = get_logger(__name__)
+
+try:
+    from diskcache import Cache as DiskCache
+except ImportError:
+    DiskCache = None
+
+# 已解析的 YAML 配置：(真实路径, 修改时间, 文件大小) -> 配置字典，文件未变化时不再重复解析
+_YAML_CACHE: Dict[tuple, Dict] = {}
+_YAML_CACHE_LOCK = threading.Lock()
+
+# 字幕任务：结果由 Provider 的响应缓存按分片缓存，不进入元数据结果缓存
+_SUBTITLE_TASKS = {TaskType.CORRECT_SUBTITLE, TaskType.TRANSLATE_SUBTITLE}
 
 
 @dataclass
 class TaskConfig:
     """任务配置数据类"""
 
-    providers: List[Provider]
+    providers: List[Provider] = field(default_factory=list)
     stream: Optional[bool] = None  # 如果为 None，则使用全局 streaming_models 判断
     temperature: Optional[float] = None  # 如果为 None, 则不传参
     strategy: Optional[Dict] = None  # 策略配置（如 slice、size 等）
+    hedge_ms: Optional[int] = None  # 对冲请求延迟（毫秒），为 None 时逐个故障转移
+    max_parallel: Optional[int] = None  # 对冲时最多同时进行的请求数，为 None 时不限制
+    # 尚未创建的 Provider 配置，首次处理该任务时才创建并追加到 providers
+    provider_configs: Optional[List[Dict]] = None
 
 
 class TranslateOrchestrator:
@@ -38,23 +62,56 @@ class TranslateOrchestrator:
         self,
         task_configs: Dict[TaskType, TaskConfig],
         streaming_models: List[str] = None,
+        result_cache: Optional[MutableMapping[str, str]] = None,
     ):
+        """初始化翻译编排器。
+
+        Args:
+            task_configs (Dict[TaskType, TaskConfig]): 各任务的配置。
+            streaming_models (List[str]): 需要流式请求的模型列表。
+            result_cache (Optional[MutableMapping[str, str]]): 元数据翻译结果缓存，
+                键为任务类型和输入的哈希，值为翻译结果；为None时使用进程内的字典。
+        """
         self.task_configs = task_configs
         self.streaming_models = streaming_models or []
+        self.result_cache = result_cache if result_cache is not None else {}
+        self._providers_lock = threading.Lock()
+        # (任务类型, 是否流式) -> 策略实例；策略只保存配置，可在调用和线程间复用
+        self._strategies: Dict[tuple, TranslateStrategy] = {}
 
     @classmethod
     def from_config_yaml(cls, file_path: str):
         """从 YAML 配置文件创建 TranslateOrchestrator 实例。
 
+        同一文件未修改时复用上次解析的结果，from_config 不会修改传入的配置。
+
         Args:
             file_path (str): YAML 配置文件路径
 
         Returns:
             TranslateOrchestrator: 翻译编排器实例
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            config: Dict = safe_load(f)
-            return cls.from_config(config["translate_orchestrator"])
+        real_path = os.path.realpath(file_path)
+        stat = os.stat(real_path)
+        key = (real_path, stat.st_mtime_ns, stat.st_size)
+        with _YAML_CACHE_LOCK:
+            config = _YAML_CACHE.get(key)
+
+        if config is None:
+            # yaml 只在这里用到，延迟导入以免拖慢只用 from_config 或构造函数的进程启动；
+            # 优先使用 libyaml 实现的 C 加载器
+            import yaml
+
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(real_path, "r", encoding="utf-8") as f:
+                config = yaml.load(f, Loader=loader)
+            with _YAML_CACHE_LOCK:
+                # 文件修改后旧版本的解析结果不会再命中，一并清理
+                for stale in [k for k in _YAML_CACHE if k[0] == real_path]:
+                    del _YAML_CACHE[stale]
+                _YAML_CACHE[key] = config
+
+        return cls.from_config(config["translate_orchestrator"])
 
     @classmethod
     def from_config(cls, config: Dict):
@@ -87,13 +144,6 @@ class TranslateOrchestrator:
             if not task_type:
                 continue
 
-            # 创建 Provider 列表
-            providers = []
-            for provider_config in task_data.get("providers", []):
-                provider = Provider.from_config(provider_config)
-                if provider:
-                    providers.append(provider)
-
             # 读取 stream 配置（可选）
             stream = task_data.get("stream")
 
@@ -103,18 +153,35 @@ class TranslateOrchestrator:
             # 读取 strategy 配置（可选）
             strategy = task_data.get("strategy")
 
+            # 读取对冲延迟配置（可选），默认不对冲。对冲时落后的请求无法取消，会在后台跑完，
+            # 标题、简介等耗时较长的任务可能因此成倍消耗请求和token
+            hedge_ms = task_data.get("hedge_ms")
+            max_parallel = task_data.get("max_parallel")
+
             # 创建 TaskConfig
+            # Provider 在首次处理该任务时才创建，只用到部分任务的进程不必初始化其余客户端
             task_configs[task_type] = TaskConfig(
-                providers=providers,
+                provider_configs=task_data.get("providers", []),
                 stream=stream,
                 temperature=temperature,
                 strategy=strategy,
+                hedge_ms=hedge_ms,
+                max_parallel=max_parallel,
             )
 
         # 读取需要流式请求的模型列表
         streaming_models = config.get("streaming_models", [])
 
-        return cls(task_configs, streaming_models)
+        # 元数据翻译结果缓存目录（可选），未设置时只在进程内缓存
+        result_cache = None
+        cache_dir = config.get("cache_dir")
+        if cache_dir:
+            if DiskCache is None:
+                logger.warning("未安装 diskcache，元数据翻译结果只在进程内缓存")
+            else:
+                result_cache = DiskCache(cache_dir)
+
+        return cls(task_configs, streaming_models, result_cache)
 
     @observe
     def correct_subtitle(
@@ -230,10 +297,185 @@ class TranslateOrchestrator:
         )
         return self._process_task(context)
 
+    @observe
+    def translate_metadata_batch(
+        self, task_type: TaskType, texts: List[str], fallback: bool = True
+    ) -> List[ProcessResult]:
+        """批量翻译同类型的元数据（如一部影片的全部演员或分类）。
+
+        先查结果缓存，未命中的不同文本合并为一次请求；批量请求失败或返回内容无法解析时，
+        按 fallback 逐条回退到 translate_generic_metadata 的处理流程。
+
+        Args:
+            task_type (TaskType): 元数据任务类型（导演、演员、分类、片商等）。
+            texts (List[str]): 待翻译的文本列表。
+            fallback (bool): 是否对批量请求未覆盖的条目逐条翻译。为 False 时只发送批量请求，
+                未翻译的条目返回失败结果，由调用方自行处理。
+
+        Returns:
+            List[ProcessResult]: 与 texts 一一对应的翻译结果。
+        """
+        contexts = [
+            TranslateContext(task_type=task_type, text_to_process=text)
+            for text in texts
+        ]
+        results: List[Optional[ProcessResult]] = [None] * len(texts)
+        # 待请求的文本 -> 缓存键，重复的文本只请求一次
+        pending: Dict[str, str] = {}
+        for i, context in enumerate(contexts):
+            cache_key = self._result_cache_key(context)
+            results[i] = self._cached_result(cache_key, task_type)
+            if results[i] is None and texts[i] and not texts[i].isspace():
+                pending[texts[i]] = cache_key
+
+        if len(pending) > 1:
+            batch_results = self._dispatch_batch(task_type, list(pending))
+            if batch_results is not None:
+                translated = dict(zip(pending, batch_results))
+                for text, cache_key in pending.items():
+                    self.result_cache[cache_key] = translated[text].content
+                for i, text in enumerate(texts):
+                    if results[i] is None and text in translated:
+                        results[i] = translated[text]
+
+        # 空文本、只有一条待翻译或批量请求失败时逐条处理，前面的条目成功后重复文本会命中缓存
+        for i, context in enumerate(contexts):
+            if results[i] is not None:
+                continue
+            if fallback:
+                results[i] = self._process_task(context)
+            else:
+                results[i] = ProcessResult(
+                    task_type=task_type,
+                    success=False,
+                    content=None,
+                    attempt_count=0,
+                    time_taken=0,
+                )
+        return results
+
+    def _dispatch_batch(
+        self, task_type: TaskType, texts: List[str]
+    ) -> Optional[List[ProcessResult]]:
+        """依次请求各提供者批量翻译元数据，返回第一个成功的结果。
+
+        Args:
+            task_type (TaskType): 元数据任务类型。
+            texts (List[str]): 互不相同的待翻译文本。
+
+        Returns:
+            Optional[List[ProcessResult]]: 与 texts 一一对应的结果；任务未配置、
+                不支持批量翻译或所有提供者都失败时返回 None。
+        """
+        task_config = self.task_configs.get(task_type)
+        if not task_config:
+            return None
+        for provider in self._get_providers(task_config):
+            strategy = self._select_strategy(provider, task_type, task_config)
+            # 标题、简介等需要上下文的任务只能逐条翻译
+            if not isinstance(strategy, SimpleMetaDataStrategy):
+                return None
+            batch_results = strategy.process_batch(provider, task_type, texts)
+            if batch_results is not None:
+                return batch_results
+        return None
+
     def _process_task(self, context: TranslateContext) -> ProcessResult:
         """处理任务的内部方法。
 
-        根据任务类型选择合适的Provider和Strategy进行处理。
+        元数据任务先查结果缓存，未命中时根据任务类型选择合适的Provider和Strategy进行处理，
+        成功的结果写入缓存。
+
+        Args:
+            context (TranslateContext): 任务上下文。
+
+        Returns:
+            ProcessResult: 处理结果。
+        """
+        # 元数据（演员名、分类等）在不同影片间大量重复，相同输入直接返回上次的译文；
+        # 字幕由 Provider 的响应缓存按分片缓存
+        cache_key = None
+        if context.task_type not in _SUBTITLE_TASKS:
+            cache_key = self._result_cache_key(context)
+            cached = self._cached_result(cache_key, context.task_type)
+            if cached is not None:
+                return cached
+
+        result = self._dispatch_task(context)
+        if cache_key is not None and result.success and result.content is not None:
+            self.result_cache[cache_key] = result.content
+        return result
+
+    def _cached_result(
+        self, cache_key: str, task_type: TaskType
+    ) -> Optional[ProcessResult]:
+        """查询结果缓存。
+
+        Args:
+            cache_key (str): 由 _result_cache_key 计算的缓存键。
+            task_type (TaskType): 任务类型。
+
+        Returns:
+            Optional[ProcessResult]: 命中时返回成功的结果，未命中返回 None。
+        """
+        cached = self.result_cache.get(cache_key)
+        if cached is None:
+            return None
+        logger.info("Result cache hit for %s", task_type)
+        return ProcessResult(
+            task_type=task_type,
+            success=True,
+            content=cached,
+            attempt_count=0,
+            time_taken=0,
+        )
+
+    @staticmethod
+    def _result_cache_key(context: TranslateContext) -> str:
+        """计算元数据翻译结果的缓存键。
+
+        Args:
+            context (TranslateContext): 任务上下文。
+
+        Returns:
+            str: 任务类型、待翻译文本和相关演员的 SHA-256 十六进制摘要。
+        """
+        payload = json.dumps(
+            [
+                context.task_type.name,
+                context.text_to_process,
+                context.actors,
+                context.actress,
+            ],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_providers(self, task_config: TaskConfig) -> List[Provider]:
+        """返回任务的提供者列表，尚未创建的按 provider_configs 创建。
+
+        加锁避免并发处理同一任务时重复创建。
+
+        Args:
+            task_config (TaskConfig): 任务配置。
+
+        Returns:
+            List[Provider]: 提供者列表。
+        """
+        if task_config.provider_configs is not None:
+            with self._providers_lock:
+                if task_config.provider_configs is not None:
+                    for provider_config in task_config.provider_configs:
+                        provider = Provider.from_config(provider_config)
+                        if provider:
+                            task_config.providers.append(provider)
+                    task_config.provider_configs = None
+        return task_config.providers
+
+    def _dispatch_task(self, context: TranslateContext) -> ProcessResult:
+        """按任务配置依次或对冲地调用各提供者。
 
         Args:
             context (TranslateContext): 任务上下文。
@@ -242,7 +484,7 @@ class TranslateOrchestrator:
             ProcessResult: 处理结果。
         """
         task_config = self.task_configs.get(context.task_type)
-        if not task_config or not task_config.providers:
+        if not task_config or not self._get_providers(task_config):
             return ProcessResult(
                 task_type=context.task_type,
                 success=False,
@@ -251,12 +493,19 @@ class TranslateOrchestrator:
                 time_taken=0,
             )
 
-        for provider in task_config.providers:
-            strategy = self._select_strategy(provider, context.task_type, task_config)
-            result = strategy.process(provider, context)
-
-            if result and result.success:
+        if task_config.hedge_ms is not None and len(task_config.providers) > 1:
+            result = self._process_hedged(context, task_config)
+            if result is not None:
                 return result
+        else:
+            for provider in task_config.providers:
+                strategy = self._select_strategy(
+                    provider, context.task_type, task_config
+                )
+                result = strategy.process(provider, context)
+
+                if result and result.success:
+                    return result
         return ProcessResult(
             task_type=context.task_type,
             success=False,
@@ -265,11 +514,74 @@ class TranslateOrchestrator:
             time_taken=0,
         )
 
+    def _process_hedged(
+        self, context: TranslateContext, task_config: TaskConfig
+    ) -> Optional[ProcessResult]:
+        """按对冲方式并发请求多个提供者，返回最先成功的结果。
+
+        先请求第一个提供者；它在 hedge_ms 内没有返回或返回失败时，再并发请求下一个，依此类推。
+        hedge_ms 为0时同时请求所有提供者；设置了 max_parallel 时，进行中的请求达到上限后
+        不再按时间对冲，等其中一个失败后再请求下一个。
+        拿到第一个成功结果后立即返回，尚未开始的请求被取消；已在进行的请求无法中止，
+        会在后台跑完后被丢弃，其请求和token照常计费。
+
+        Args:
+            context (TranslateContext): 任务上下文。
+            task_config (TaskConfig): 任务配置，hedge_ms 不能为 None。
+
+        Returns:
+            Optional[ProcessResult]: 最先成功的结果，全部失败时返回 None。
+        """
+        providers = task_config.providers
+        hedge_seconds = task_config.hedge_ms / 1000.0
+        max_parallel = min(task_config.max_parallel or len(providers), len(providers))
+        executor = ThreadPoolExecutor(max_workers=max_parallel)
+        pending: set[Future] = set()
+        next_index = 0
+        try:
+            while next_index < len(providers) or pending:
+                if next_index < len(providers) and len(pending) < max_parallel:
+                    provider = providers[next_index]
+                    strategy = self._select_strategy(
+                        provider, context.task_type, task_config
+                    )
+                    if next_index > 0:
+                        logger.info(
+                            "Also requesting provider %s for %s",
+                            provider.model,
+                            context.task_type,
+                        )
+                    # 复制当前上下文，让 langfuse 的观测链路延续到工作线程
+                    pending.add(
+                        executor.submit(
+                            contextvars.copy_context().run,
+                            strategy.process,
+                            provider,
+                            context,
+                        )
+                    )
+                    next_index += 1
+
+                can_hedge = next_index < len(providers) and len(pending) < max_parallel
+                timeout = hedge_seconds if can_hedge else None
+                done, pending = wait(
+                    pending, timeout=timeout, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    result = future.result()
+                    if result and result.success:
+                        return result
+            return None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _select_strategy(
         self, provider: Provider, task_type: TaskType, task_config: TaskConfig
     ) -> TranslateStrategy:
         """选择合适的翻译策略。
 
+        策略只取决于任务配置和是否流式请求，同一组合只创建一次实例。
+
         Args:
             provider (Provider): 服务提供者。
             task_type (TaskType): 任务类型。
@@ -284,6 +596,30 @@ class TranslateOrchestrator:
             use_stream = task_config.stream
         else:
             use_stream = provider.model in self.streaming_models
+
+        key = (task_type, use_stream)
+        strategy = self._strategies.get(key)
+        if strategy is None:
+            # 并发时可能重复创建，setdefault 保证所有线程拿到同一个实例
+            strategy = self._strategies.setdefault(
+                key, self._create_strategy(task_type, task_config, use_stream)
+            )
+        return strategy
+
+    @staticmethod
+    def _create_strategy(
+        task_type: TaskType, task_config: TaskConfig, use_stream: bool
+    ) -> TranslateStrategy:
+        """按任务类型和策略配置创建翻译策略。
+
+        Args:
+            task_type (TaskType): 任务类型。
+            task_config (TaskConfig): 任务配置。
+            use_stream (bool): 是否使用流式请求。
+
+        Returns:
+            TranslateStrategy: 新建的翻译策略实例。
+        """
         use_temperature = task_config.temperature
 
         # 根据任务类型选择策略
@@ -295,11 +631,16 @@ class TranslateOrchestrator:
             if slice_enabled:
                 return SliceSubtitleStrategy(
                     slice_size=slice_size,
+                    batch_size=strategy_config.get("batch", 1),
+                    use_batch_api=strategy_config.get("batch_api", False),
+                    max_workers=strategy_config.get("workers"),
                     stream=use_stream,
                     temperature=use_temperature,
                 )
             else:
-                return NoSliceSubtitleStrategy(stream=use_stream)
+                return NoSliceSubtitleStrategy(
+                    stream=use_stream, max_workers=strategy_config.get("workers")
+                )
 
         elif task_type == TaskType.TRANSLATE_SUBTITLE:
             # 读取策略配置
@@ -309,11 +650,16 @@ class TranslateOrchestrator:
             if slice_enabled:
                 return SliceSubtitleStrategy(
                     slice_size=slice_size,
+                    batch_size=strategy_config.get("batch", 1),
+                    use_batch_api=strategy_config.get("batch_api", False),
+                    max_workers=strategy_config.get("workers"),
                     stream=use_stream,
                     temperature=use_temperature,
                 )
             else:
-                return NoSliceSubtitleStrategy(stream=use_stream)
+                return NoSliceSubtitleStrategy(
+                    stream=use_stream, max_workers=strategy_config.get("workers")
+                )
 
         elif task_type in {
             TaskType.METADATA_DIRECTOR,
@@ -124,6 +124,19 @@ TRANSLATE_SUBTITLE_USER_QUERY = {
     "srt_block": "text_value",
 }
 
+# 批量处理多个字幕分片时追加在系统提示词之后的说明
+SUBTITLE_BATCH_INSTRUCTION = """
+
+<Batch_Instructions>
+本次输入的 `srt_block` 是一个列表，每一项包含编号 `id` 和一段独立的SRT字幕 `text`。请按上述规则分别处理每一项，不得合并、拆分或遗漏任何一项，每一项的序号和时间轴必须与该项原文一致。
+输出以json格式，只包含一个字段 `"results"`(List[Dict])，每个输入项对应其中一项：
+    - `"id"`(int): 对应输入项的编号
+    - 其余字段与单独处理该项时的输出字段相同（`"content"`、`"success"` 等）
+</Batch_Instructions>"""
+
+# 大模型输出的字幕序号或时间轴与原文不一致时，要求其重新输出的提示
+SUBTITLE_TIMELINE_REPAIR_PROMPT = "你输出的以下字幕块的序号或时间轴与原文不一致：{indices}。请保持每个字幕块的序号和时间轴与原文完全相同，重新输出完整的json结果。"
+
 DIRECTOR_SYSTEM_PROMPT = """你是一位专业的日本人名翻译专家，精通将日本人名准确翻译为中文，深知其中“约定俗成”的重要性。
 你的任务是接收一个或多个由逗号分隔的日本导演的姓名，并提供最标准、最通用的中文翻译。
 **# 翻译总则：**
@@ -346,3 +359,11 @@ CATEGORY_SYSTEM_PROMPT = """你是一位精通日本流行文化和AV行业术
 4.  **只输出结果**：不要添加任何解释。"""
 
 category_examples = {"ドラマ": "剧情", "NTR": "NTR", "ハイビジョン": "高清"}
+
+# 一次请求翻译多条元数据时追加在系统提示词之后的说明
+METADATA_BATCH_INSTRUCTION = """
+
+<Batch_Instructions>
+本次输入是一个json数组，每一项是一条独立的待翻译文本。请按上述规则分别翻译每一项，不得合并、拆分或遗漏任何一项。
+输出以json格式，只包含一个字段 `"results"`(List[str])，按输入顺序依次给出每一项的译文，项数必须与输入相同。
+</Batch_Instructions>"""
@@ -1,17 +1,281 @@
+import asyncio
 import hashlib
+import json
 import os
+import random
+import re
 import time
+import uuid
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
-
+from contextvars import ContextVar
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, MutableMapping, Optional
+
+import httpx
 import openai as native_openai
 from aurora.domain.enums import ErrorType
 from aurora.domain.results import ChatResult
+from aurora.services.translation.circuit_breaker import CircuitBreaker, CircuitState
+from aurora.services.translation.rate_limiter import RateLimiter
 from aurora.utils.logger import get_logger
 from langfuse import observe, openai
 
 logger = get_logger(__name__)
 
+try:
+    from diskcache import Cache as DiskCache
+except ImportError:
+    DiskCache = None
+
+# orjson 序列化更快，且直接输出 UTF-8，中日文消息不会被转义成 \uXXXX
+try:
+    import orjson
+
+    def _dumps_sorted(obj) -> bytes:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+
+except ImportError:
+
+    def _dumps_sorted(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str).encode(
+            "utf-8"
+        )
+
+
+# 重试退避：第 n 次重试等待 uniform(0, base * 2**n) 秒（full jitter），且不超过上限
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+# 服务端 Retry-After 给出的等待时间超过该值时不采信，改用指数退避
+RETRY_AFTER_MAX = 60.0
+# 接近总时长上限时，单次请求至少保留的超时时间（秒）
+MIN_ATTEMPT_TIMEOUT = 5.0
+
+# 批处理接口（/v1/batches）：服务端承诺的完成时限、轮询间隔，以及本地最长等待秒数
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 30.0
+BATCH_MAX_WAIT = 3600.0
+# 取消后等待批处理进入 cancelled 状态的最长秒数，进入后才能读取已完成部分的输出
+BATCH_CANCEL_WAIT = 900.0
+# 批处理任务的终止状态
+_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# 为Google模型准备的安全设置，将其设置为最低阈值
+# 只发送给 Google 模型和 OpenRouter（见 OpenaiProvider._needs_safety_settings），
+# 由 OpenRouter 传递给后端的Gemini等模型；内容不变，模块加载时构建一次，只读以免被意外修改
+_SAFETY_SETTINGS = MappingProxyType(
+    {
+        "safety_settings": (
+            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+        ),
+    }
+)
+
+
+@dataclass(frozen=True)
+class ErrorPolicy:
+    """一类 API 错误的处理方式。
+
+    Attributes:
+        error (ErrorType): 返回给调用方的错误类型。
+        retryable (bool): 是否重试；可重试的错误计入熔断器的连续失败次数。
+        trip (bool): 是否立即熔断（Provider 级别的不可恢复错误）。
+    """
+
+    error: ErrorType
+    retryable: bool
+    trip: bool = False
+
+
+# 按 HTTP 状态码查找错误处理方式，未登记的状态码（如 5xx）按 DEFAULT_ERROR_POLICY 重试
+STATUS_POLICY: Dict[int, ErrorPolicy] = {
+    # Provider 级别的不可恢复错误，触发熔断
+    401: ErrorPolicy(ErrorType.AUTHENTICATION_ERROR, retryable=False, trip=True),
+    402: ErrorPolicy(ErrorType.INSUFFICIENT_QUOTA, retryable=False, trip=True),
+    403: ErrorPolicy(ErrorType.PERMISSION_DENIED, retryable=False, trip=True),
+    404: ErrorPolicy(ErrorType.NOT_FOUND, retryable=False, trip=True),
+    # 请求级别错误，不重试也不触发熔断（可能通过调整请求解决）
+    400: ErrorPolicy(ErrorType.UNPROCESSABLE_ENTITY, retryable=False),
+    413: ErrorPolicy(ErrorType.PAYLOAD_TOO_LARGE, retryable=False),
+    422: ErrorPolicy(ErrorType.UNPROCESSABLE_ENTITY, retryable=False),
+    # 可重试错误
+    408: ErrorPolicy(ErrorType.TIMEOUT, retryable=True),
+    429: ErrorPolicy(ErrorType.RATE_LIMIT, retryable=True),
+}
+DEFAULT_ERROR_POLICY = ErrorPolicy(ErrorType.OTHER, retryable=True)
+_TIMEOUT_POLICY = ErrorPolicy(ErrorType.TIMEOUT, retryable=True)
+_CONNECTION_POLICY = ErrorPolicy(ErrorType.CONNECTION_ERROR, retryable=True)
+# 429 中的额度不足（insufficient_quota）重试无法恢复
+_QUOTA_POLICY = STATUS_POLICY[402]
+
+
+def _classify_error(err: Exception) -> ErrorPolicy:
+    """查找一次调用异常对应的处理方式。
+
+    Args:
+        err (Exception): chat 请求中抛出的异常。
+
+    Returns:
+        ErrorPolicy: 错误处理方式。
+    """
+    # APITimeoutError 是 APIConnectionError 的子类，需要先判断
+    if isinstance(err, native_openai.APITimeoutError):
+        return _TIMEOUT_POLICY
+    if isinstance(err, native_openai.APIConnectionError):
+        return _CONNECTION_POLICY
+    status_code = getattr(err, "status_code", None)
+    if status_code == 429 and "quota" in str(err).lower():
+        return _QUOTA_POLICY
+    return STATUS_POLICY.get(status_code, DEFAULT_ERROR_POLICY)
+
+
+# 计算响应缓存键前去掉的行尾空白（含全角空格）
+_TRAILING_SPACE_RE = re.compile(r"[ \t\u3000]+$", re.MULTILINE)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def _normalize_cache_content(content):
+    """规整消息内容，使只有换行符或首尾空白不同的请求命中同一缓存项。
+
+    Args:
+        content: 消息的 content 字段，非字符串（如多模态内容列表）原样返回。
+
+    Returns:
+        规整后的内容。
+    """
+    if not isinstance(content, str):
+        return content
+    content = content.replace("\r\n", "\n")
+    return _TRAILING_SPACE_RE.sub("", content).strip()
+
+
+def _text_message_digest(role: str, content: str) -> bytes:
+    """计算纯文本消息的摘要。
+
+    Args:
+        role (str): 消息角色。
+        content (str): 消息内容。
+
+    Returns:
+        bytes: SHA-256 摘要。
+    """
+    return hashlib.sha256(
+        _dumps_sorted({"role": role, "content": _normalize_cache_content(content)})
+    ).digest()
+
+
+@lru_cache(maxsize=1024)
+def _prefix_message_digest(role: str, content: str) -> bytes:
+    """计算前缀消息的摘要并缓存。
+
+    同一任务的请求共用相同的系统提示词和示例，这些消息只在第一次出现时规整、序列化和哈希，
+    之后按 (role, content) 直接取回摘要。最后一条用户消息每次都不同且可能很长，不走这里，
+    以免缓存长期持有大段字幕文本。
+
+    Args:
+        role (str): 消息角色。
+        content (str): 消息内容。
+
+    Returns:
+        bytes: SHA-256 摘要。
+    """
+    return _text_message_digest(role, content)
+
+
+def _message_digest(message: Dict, memoize: bool = False) -> bytes:
+    """计算单条消息的摘要。
+
+    Args:
+        message (Dict): 消息。
+        memoize (bool): 是否缓存纯文本消息的摘要，只应对共用的前缀消息开启。
+
+    Returns:
+        bytes: SHA-256 摘要。
+    """
+    content = message.get("content")
+    if message.keys() == {"role", "content"} and isinstance(content, str):
+        if memoize:
+            return _prefix_message_digest(message["role"], content)
+        return _text_message_digest(message["role"], content)
+    normalized = {**message, "content": _normalize_cache_content(content)}
+    return hashlib.sha256(_dumps_sorted(normalized)).digest()
+
+
+def _with_cache_control(messages: list) -> list:
+    """给系统消息加上 Anthropic 的 cache_control 标记，返回新的消息列表。
+
+    系统提示词在同类请求间不变，标记后服务端会缓存这段前缀，后续请求按缓存读取计费。
+
+    Args:
+        messages (list): 消息列表，不会被修改。
+
+    Returns:
+        list: 系统消息内容改写为带 cache_control 的文本块后的消息列表。
+    """
+    marked = []
+    for message in messages:
+        content = message.get("content")
+        if message.get("role") == "system" and isinstance(content, str):
+            block = {"type": "text", "text": content}
+            block["cache_control"] = {"type": "ephemeral"}
+            message = {**message, "content": [block]}
+        marked.append(message)
+    return marked
+
+
+# 当前线程中正在发送请求的 Provider 的限流器，供共享 HTTP 客户端的响应钩子读取
+_active_limiter: ContextVar[Optional[RateLimiter]] = ContextVar(
+    "active_limiter", default=None
+)
+
+
+def _record_rate_limit_headers(response: httpx.Response):
+    """httpx 响应钩子：把限流响应头交给发起请求的 Provider 的限流器。"""
+    limiter = _active_limiter.get()
+    if limiter is not None:
+        limiter.update(response.headers)
+
+
+def _build_http_client() -> httpx.Client:
+    """创建所有 OpenaiProvider 共享的 HTTP 客户端。
+
+    同一 base_url 的不同模型共用一个连接池，已建立的 TLS 连接可在重试和后续请求间复用。
+    安装了 h2 时启用 HTTP/2。读超时由各 Provider 的 timeout 按请求覆盖。
+    每个响应的限流响应头会交给当前发起请求的 Provider 的限流器。
+
+    Returns:
+        httpx.Client: 共享的 HTTP 客户端。
+    """
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_keepalive_connections=100,
+            max_connections=200,
+            keepalive_expiry=120.0,
+        ),
+        timeout=httpx.Timeout(connect=10.0, read=500.0, write=30.0, pool=5.0),
+        follow_redirects=True,
+        event_hooks={"response": [_record_rate_limit_headers]},
+    )
+
+
+_HTTP_CLIENT = _build_http_client()
+
 
 class Provider(ABC):
     """翻译服务提供者抽象基类。
@@ -53,6 +317,36 @@ class Provider(ABC):
         """
         pass
 
+    async def achat(self, messages, **kwargs) -> ChatResult:
+        """chat 的协程版本，供事件循环中的调用方并发发起多个请求。
+
+        请求和重试等待在线程池中执行，不阻塞事件循环；调用上下文（包括 langfuse 追踪）
+        会随 asyncio.to_thread 传入工作线程。
+
+        Args:
+            messages (list): 消息列表。
+            **kwargs: 透传给 chat 的关键字参数。
+
+        Returns:
+            ChatResult: 聊天请求的结果。
+        """
+        return await asyncio.to_thread(self.chat, messages, **kwargs)
+
+    def batch_chat(self, messages_list: List[list], **kwargs) -> List[ChatResult]:
+        """批量发送聊天请求。
+
+        默认实现逐个调用 chat；服务端提供批处理接口的提供者可以重写此方法，
+        用一次提交代替多次请求。
+
+        Args:
+            messages_list (List[list]): 各请求的消息列表。
+            **kwargs: 透传给 chat 的关键字参数。
+
+        Returns:
+            List[ChatResult]: 与 messages_list 顺序一致的结果。
+        """
+        return [self.chat(messages, **kwargs) for messages in messages_list]
+
     @staticmethod
     def from_config(config: Dict) -> Optional["Provider"]:
         """从配置字典创建 Provider 实例（工厂方法）。
@@ -87,14 +381,26 @@ class OpenaiProvider(Provider):
         base_url (str): API基础URL。
         _model (str): 使用的模型名称。
         timeout (int): 请求超时时间（秒）。
-        _available (bool): 提供者是否可用（熔断状态）。
-        client (openai.OpenAI): OpenAI客户端实例。
+        deadline (float): 一次 chat 调用（含所有重试和等待）的总时长上限（秒）。
+        breaker (CircuitBreaker): 熔断器，连续失败或不可恢复错误时熔断，之后通过半开探测自动恢复。
+        client (openai.OpenAI): OpenAI客户端实例，底层连接池在所有实例间共享。
+        cache (Optional[MutableMapping[str, str]]): 响应缓存，为None时不缓存。
+        limiter (RateLimiter): 按服务端限流响应头做准入控制的限流器。
     """
 
     # 享元模式的缓存字典，存储已创建的实例
     _instance_cache: Dict[str, "OpenaiProvider"] = {}
 
-    def __init__(self, api_key, base_url, model, timeout=500):
+    def __init__(
+        self,
+        api_key,
+        base_url,
+        model,
+        timeout=500,
+        cache: Optional[MutableMapping[str, str]] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        deadline: Optional[float] = None,
+    ):
         """初始化OpenAI提供者。
 
         Args:
@@ -102,19 +408,71 @@ class OpenaiProvider(Provider):
             base_url (str): API基础URL。
             model (str): 使用的模型名称。
             timeout (int): 请求超时时间（秒），默认500秒。
+            cache (Optional[MutableMapping[str, str]]): 响应缓存，键为模型、消息和请求参数的哈希，
+                值为正常结束（finish_reason 为 stop）的响应内容；为None时不缓存。
+            breaker (Optional[CircuitBreaker]): 熔断器，为None时使用默认参数创建。
+            deadline (Optional[float]): 一次 chat 调用（含所有重试和等待）的总时长上限（秒），
+                为None时取 timeout 的2倍。
         """
         self.api_key = api_key
         self.base_url = base_url
         self._model = model
         self.timeout = timeout
-        self._available = True
+        self.deadline = deadline if deadline is not None else timeout * 2
+        self.breaker = breaker or CircuitBreaker()
+        self.cache = cache
+        self.limiter = RateLimiter()
+        # safety_settings 只对 Gemini 有意义，其他后端可能因未知字段返回 400
+        self._extra_body = (
+            _SAFETY_SETTINGS if self._needs_safety_settings(model, base_url) else None
+        )
+        # Anthropic 模型只在显式标记 cache_control 时缓存提示词前缀
+        self._cache_control = self._needs_cache_control(model)
         self.client = openai.OpenAI(
-            api_key=self.api_key, base_url=self.base_url, timeout=self.timeout
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http_client=_HTTP_CLIENT,
         )
 
+    @staticmethod
+    def _needs_safety_settings(model: str, base_url: Optional[str]) -> bool:
+        """判断是否需要随请求发送 Gemini 的 safety_settings。
+
+        Google 模型直接需要；经 OpenRouter 转发时后端可能是 Gemini，且 OpenRouter 会忽略
+        不认识的字段，因此也发送。
+
+        Args:
+            model (str): 模型名称。
+            base_url (Optional[str]): API基础URL。
+
+        Returns:
+            bool: 需要发送时返回True。
+        """
+        model = (model or "").lower()
+        return (
+            "gemini" in model
+            or "google" in model
+            or "openrouter" in (base_url or "").lower()
+        )
+
+    @staticmethod
+    def _needs_cache_control(model: str) -> bool:
+        """判断是否需要给系统消息加 cache_control 标记（Anthropic 模型，如经 OpenRouter 调用）。
+
+        Args:
+            model (str): 模型名称。
+
+        Returns:
+            bool: 需要标记时返回True。
+        """
+        model = (model or "").lower()
+        return "claude" in model or "anthropic" in model
+
     @property
     def available(self) -> bool:
-        return self._available
+        # 只查看状态，不占用半开探测名额
+        return self.breaker.state is not CircuitState.OPEN
 
     @property
     def model(self):
@@ -130,6 +488,8 @@ class OpenaiProvider(Provider):
                 - api_key (str): API密钥（可以是 "ENV_XXX" 格式引用环境变量）
                 - base_url (str): API基础URL（可以是 "ENV_XXX" 格式引用环境变量）
                 - timeout (int, optional): 超时时间，默认500秒
+                - cache_dir (str, optional): 响应缓存目录，需要安装 diskcache，未设置时不缓存
+                - deadline (float, optional): 一次调用含重试的总时长上限（秒），默认为 timeout 的2倍
 
         Returns:
             Optional[OpenaiProvider]: OpenaiProvider 实例，如果创建失败返回 None
@@ -138,6 +498,8 @@ class OpenaiProvider(Provider):
         api_key = config.get("api_key")
         base_url = config.get("base_url")
         timeout = config.get("timeout", 500)
+        cache_dir = config.get("cache_dir")
+        deadline = config.get("deadline")
 
         # 处理环境变量：如果值以 "ENV_" 开头，则从环境变量中获取
         if api_key and api_key.startswith("ENV_"):
@@ -167,7 +529,9 @@ class OpenaiProvider(Provider):
             return None
 
         # 生成配置的唯一键用于享元模式缓存
-        cache_key = cls._generate_config_key(api_key, base_url, model, timeout)
+        cache_key = cls._generate_config_key(
+            api_key, base_url, model, timeout, cache_dir, deadline
+        )
 
         # 检查缓存中是否已存在相同配置的实例
         if cache_key in cls._instance_cache:
@@ -176,8 +540,22 @@ class OpenaiProvider(Provider):
             )
             return cls._instance_cache[cache_key]
 
+        response_cache = None
+        if cache_dir:
+            if DiskCache is None:
+                logger.warning("未安装 diskcache，模型 %s 的响应将不会被缓存", model)
+            else:
+                response_cache = DiskCache(cache_dir)
+
         # 创建新实例并缓存
-        instance = cls(api_key=api_key, base_url=base_url, model=model, timeout=timeout)
+        instance = cls(
+            api_key=api_key,
+            base_url=base_url,
+            model=model,
+            timeout=timeout,
+            cache=response_cache,
+            deadline=deadline,
+        )
         cls._instance_cache[cache_key] = instance
         logger.debug(
             "Created and cached new OpenaiProvider instance for key: %s", cache_key
@@ -187,7 +565,13 @@ class OpenaiProvider(Provider):
 
     @classmethod
     def _generate_config_key(
-        cls, api_key: str, base_url: str, model: str, timeout: int
+        cls,
+        api_key: str,
+        base_url: str,
+        model: str,
+        timeout: int,
+        cache_dir: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> str:
         """生成配置的唯一键，用于享元模式缓存。
 
@@ -196,12 +580,14 @@ class OpenaiProvider(Provider):
             base_url (str): API基础URL
             model (str): 模型名称
             timeout (int): 超时时间
+            cache_dir (Optional[str]): 响应缓存目录
+            deadline (Optional[float]): 总时长上限
 
         Returns:
             str: 配置的唯一哈希键
         """
         # 将所有配置参数组合成字符串并生成MD5哈希
-        config_str = f"{api_key}|{base_url}|{model}|{timeout}"
+        config_str = f"{api_key}|{base_url}|{model}|{timeout}|{cache_dir}|{deadline}"
         return hashlib.md5(config_str.encode()).hexdigest()
 
     @classmethod
@@ -222,26 +608,113 @@ class OpenaiProvider(Provider):
         """
         return len(cls._instance_cache)
 
+    def _response_cache_key(self, messages, kwargs: Dict) -> str:
+        """计算响应缓存键。
+
+        是否流式返回不影响最终内容，因此不计入键；temperature 等采样参数计入。
+        消息内容先统一换行符并去掉行尾和首尾空白，重复的字幕片段即使空白略有不同也能命中。
+        每条消息单独求摘要，除最后一条外的前缀消息（系统提示词、示例等）的摘要会被缓存，
+        不必每次重新序列化。
+
+        Args:
+            messages (list): 消息列表。
+            kwargs (Dict): 透传给接口的其他参数。
+
+        Returns:
+            str: 模型、各条消息摘要和参数的 SHA-256 十六进制摘要。
+        """
+        digest = hashlib.sha256(self.model.encode("utf-8"))
+        last = len(messages) - 1
+        for i, message in enumerate(messages):
+            digest.update(_message_digest(message, memoize=i < last))
+        digest.update(_dumps_sorted(kwargs))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _retry_after(err: Optional[Exception]) -> Optional[float]:
+        """从错误响应的 retry-after-ms / retry-after 头中解析服务端要求的等待秒数。
+
+        Args:
+            err (Optional[Exception]): 本次调用抛出的异常。
+
+        Returns:
+            Optional[float]: 等待秒数；没有可用的响应头时返回 None。
+        """
+        headers = getattr(getattr(err, "response", None), "headers", None)
+        if not headers:
+            return None
+
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms:
+            try:
+                return float(retry_after_ms) / 1000
+            except ValueError:
+                pass
+
+        retry_after = headers.get("retry-after")
+        if not retry_after:
+            return None
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+        # Retry-After 也可能是 HTTP 日期
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return retry_at.timestamp() - time.time()
+
+    def _compute_backoff(self, attempt: int, err: Optional[Exception]) -> float:
+        """计算第 attempt 次失败后的重试等待时间。
+
+        服务端通过 Retry-After 给出合理的等待时间时直接采用；否则使用带 full jitter 的指数退避，
+        让共享同一 Provider 的多个 worker 错开重试，避免集中重试再次触发限流。
+
+        Args:
+            attempt (int): 从0开始的失败次数。
+            err (Optional[Exception]): 本次调用抛出的异常，没有异常时为 None。
+
+        Returns:
+            float: 等待秒数。
+        """
+        retry_after = self._retry_after(err)
+        if retry_after is not None and 0 <= retry_after <= RETRY_AFTER_MAX:
+            return retry_after
+        return min(RETRY_MAX_DELAY, random.uniform(0, RETRY_BASE_DELAY * 2**attempt))
+
     @observe
     def chat(self, messages, stream: bool = False, **kwargs) -> ChatResult:
         """
         发送chat请求，支持自动重试机制和流式调用
         - 最多重试3次
-        - 遇到可恢复错误时等待5秒后重试
+        - 遇到可恢复错误时按指数退避加随机抖动等待后重试，429 等响应优先遵循 Retry-After
         - 黑名单模式：默认可重试，只排除明确不可重试的错误
         - 支持流式调用：stream=True 启用流式响应（默认False保持向后兼容）
+        - 配置了响应缓存时，相同模型、消息和参数的请求直接返回缓存内容
 
         Args:
             messages: 消息列表
             stream: 是否启用流式调用，默认False
             **kwargs: 其他参数
         """
-        # 熔断检查：如果 Provider 已不可用，快速失败
-        if not self.available:
-            logger.warning(
-                "Provider %s is unavailable due to previous irrecoverable error",
-                self.model,
-            )
+        # timeout、extra_headers 和 stream 只影响 HTTP 调用，不计入缓存键
+        attempt_timeout_cap = kwargs.pop("timeout", self.timeout)
+        caller_headers = kwargs.pop("extra_headers", None)
+
+        response_cache_key = None
+        if self.cache is not None:
+            response_cache_key = self._response_cache_key(messages, kwargs)
+            cached = self.cache.get(response_cache_key)
+            if cached is not None:
+                logger.info("Response cache hit for model: %s", self.model)
+                return ChatResult(
+                    success=True, attempt_count=0, time_taken=0, content=cached
+                )
+
+        # 熔断检查：熔断中或半开探测名额已满时快速失败
+        if not self.breaker.allow_request():
+            logger.warning("Provider %s circuit is open, failing fast", self.model)
             return ChatResult(
                 success=False,
                 attempt_count=0,
@@ -249,51 +722,81 @@ class OpenaiProvider(Provider):
                 content=None,
                 error=ErrorType.OTHER,
             )
-        start_time = time.time()
+        # 用单调时钟计时，不受系统时间校正影响
+        start = time.monotonic()
+
+        def elapsed_ms() -> int:
+            return int((time.monotonic() - start) * 1000)
+
+        # 总时长上限：剩余时间不够再等一次退避时放弃重试，每次请求的超时也不超过剩余时间
+        deadline_at = start + self.deadline
+
+        def wait_before_retry(err: Optional[Exception]) -> bool:
+            delay = self._compute_backoff(attempt, err)
+            if time.monotonic() + delay >= deadline_at:
+                logger.warning(
+                    "Provider %s reached its %.0f second deadline, stop retrying",
+                    self.model,
+                    self.deadline,
+                )
+                return False
+            logger.info("Retrying in %.1f seconds...", delay)
+            time.sleep(delay)
+            return True
+
         attempt_count = 0
 
         logger.info("OpenAIProvider chat called for model: %s", self.model)
 
         max_retries = 3
 
-        retry_delay = 8  # 秒
-
-        # 为Google模型准备的安全设置，将其设置为最低阈值
-        # 这会通过OpenRouter传递给后端的Gemini等模型
-        safety_settings = {
-            "safety_settings": [
-                {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-                {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-                {
-                    "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                    "threshold": "BLOCK_NONE",
-                },
-                {
-                    "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                    "threshold": "BLOCK_NONE",
-                },
-            ],
+        # 同一次调用的所有重试共用一个幂等键：请求已到达服务端但响应丢失时，重试不会被重复计费。
+        # 键是随机的而不是由消息内容推导，避免调用方有意重发的相同请求被服务端当作重复请求。
+        extra_headers = {
+            "Idempotency-Key": uuid.uuid4().hex,
+            **(caller_headers or {}),
         }
+        if self._cache_control:
+            messages = _with_cache_control(messages)
+        extra_body = self._extra_body
+        if "extra_body" in kwargs:
+            extra_body = {**(extra_body or {}), **(kwargs.pop("extra_body") or {})}
 
         for attempt in range(max_retries):
+            # 重试前熔断器已打开（本次或其他线程的失败所致）时不再重试
+            if attempt > 0 and self.breaker.state is CircuitState.OPEN:
+                logger.warning("Provider %s circuit opened, stop retrying", self.model)
+                break
             attempt_count += 1
+            self.limiter.acquire()
             try:
-                mode_str = "streaming" if stream else "non-streaming"
-                logger.info(
-                    f"Sending request to API (attempt {attempt + 1}/{max_retries}, {mode_str} mode)..."
+                logger.debug(
+                    "Sending request to API (attempt %d/%d, %s mode)...",
+                    attempt + 1,
+                    max_retries,
+                    "streaming" if stream else "non-streaming",
                 )
 
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    stream=stream,
-                    extra_body=safety_settings,
-                    **kwargs,
-                )
+                limiter_token = _active_limiter.set(self.limiter)
+                try:
+                    response = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        stream=stream,
+                        extra_body=extra_body,
+                        extra_headers=extra_headers,
+                        timeout=min(
+                            attempt_timeout_cap,
+                            max(MIN_ATTEMPT_TIMEOUT, deadline_at - time.monotonic()),
+                        ),
+                        **kwargs,
+                    )
+                finally:
+                    _active_limiter.reset(limiter_token)
 
                 # 处理流式响应
                 if stream:
-                    logger.info("Receiving streaming response from API")
+                    logger.debug("Receiving streaming response from API")
                     content_parts = []
                     finish_reason = None
 
@@ -314,17 +817,18 @@ class OpenaiProvider(Provider):
 
                         content = "".join(content_parts)
                         logger.info(
-                            f"Streaming response complete: finish_reason={finish_reason}, content_length={len(content)} chars"
+                            "Streaming response complete: finish_reason=%s, content_length=%d chars",
+                            finish_reason,
+                            len(content),
                         )
 
                     except Exception as stream_error:
-                        logger.error(f"Error during streaming: {str(stream_error)}")
+                        logger.error("Error during streaming: %s", stream_error)
+                        self.breaker.on_failure()
                         # 流式处理出错，视为可重试错误
-                        if attempt < max_retries - 1:
-                            logger.info(f"Retrying in {retry_delay} seconds...")
-                            time.sleep(retry_delay)
+                        if attempt < max_retries - 1 and wait_before_retry(None):
                             continue
-                        time_taken = int((time.time() - start_time) * 1000)
+                        time_taken = elapsed_ms()
                         return ChatResult(
                             success=False,
                             attempt_count=attempt_count,
@@ -335,16 +839,15 @@ class OpenaiProvider(Provider):
 
                 # 处理非流式响应
                 else:
-                    logger.info("Received response from API")
+                    logger.debug("Received response from API")
 
                     if not response.choices:
                         logger.error("No choices in response")
+                        self.breaker.on_failure()
                         # 空响应可能是临时问题，允许重试
-                        if attempt < max_retries - 1:
-                            logger.info(f"Retrying in {retry_delay} seconds...")
-                            time.sleep(retry_delay)
+                        if attempt < max_retries - 1 and wait_before_retry(None):
                             continue
-                        time_taken = int((time.time() - start_time) * 1000)  # 毫秒
+                        time_taken = elapsed_ms()
                         return ChatResult(
                             success=False,
                             attempt_count=attempt_count,
@@ -358,22 +861,30 @@ class OpenaiProvider(Provider):
                     finish_reason = choice.finish_reason
 
                     logger.info(
-                        f"Response: finish_reason={finish_reason}, content_length={len(content) if content else 0} chars"
+                        "Response: finish_reason=%s, content_length=%d chars",
+                        finish_reason,
+                        len(content) if content else 0,
                     )
 
+                # 服务端已正常返回，无论完成原因如何都记为成功
+                self.breaker.on_success()
+
                 # 统一处理完成原因（流式和非流式都执行此逻辑）
                 if finish_reason == "stop":
-                    time_taken = int((time.time() - start_time) * 1000)  # 毫秒
+                    time_taken = elapsed_ms()
+                    content = content.strip() if content else ""
+                    if response_cache_key is not None:
+                        self.cache[response_cache_key] = content
                     return ChatResult(
                         success=True,
                         attempt_count=attempt_count,
                         time_taken=time_taken,
-                        content=content.strip() if content else "",
+                        content=content,
                     )
                 elif finish_reason == "length":
                     # 长度限制 - 不可重试（业务逻辑问题）
                     logger.warning("Response finished due to length limit")
-                    time_taken = int((time.time() - start_time) * 1000)
+                    time_taken = elapsed_ms()
                     return ChatResult(
                         success=False,
                         attempt_count=attempt_count,
@@ -384,7 +895,7 @@ class OpenaiProvider(Provider):
                 elif finish_reason == "content_filter":
                     # 内容过滤 - 不可重试（内容违规）
                     logger.warning("Response blocked by content filter")
-                    time_taken = int((time.time() - start_time) * 1000)
+                    time_taken = elapsed_ms()
                     return ChatResult(
                         success=False,
                         attempt_count=attempt_count,
@@ -394,8 +905,8 @@ class OpenaiProvider(Provider):
                     )
                 else:
                     # 其他 finish_reason 也返回内容
-                    logger.warning(f"Unexpected finish_reason: {finish_reason}")
-                    time_taken = int((time.time() - start_time) * 1000)
+                    logger.warning("Unexpected finish_reason: %s", finish_reason)
+                    time_taken = elapsed_ms()
                     return ChatResult(
                         success=True,
                         attempt_count=attempt_count,
@@ -403,258 +914,200 @@ class OpenaiProvider(Provider):
                         content=content.strip() if content else "",
                     )
 
-            except native_openai.AuthenticationError as e:
-                # 认证错误 - 不可重试（API密钥无效），触发熔断
-                logger.error(f"OpenAI API authentication error: {str(e)}")
-                self._available = False  # 触发熔断
-                time_taken = int((time.time() - start_time) * 1000)
-                return ChatResult(
-                    success=False,
-                    attempt_count=attempt_count,
-                    time_taken=time_taken,
-                    content=None,
-                    error=ErrorType.AUTHENTICATION_ERROR,
+            except Exception as e:
+                # 黑名单模式：未在状态码表中登记的错误默认可重试
+                policy = _classify_error(e)
+                logger.error(
+                    "%s during OpenAI API call (attempt %d/%d): %s",
+                    type(e).__name__,
+                    attempt + 1,
+                    max_retries,
+                    e,
                 )
+                if policy.trip:
+                    self.breaker.trip()  # 触发熔断
+                elif policy.retryable:
+                    self.breaker.on_failure()
+                else:
+                    self.breaker.on_success()  # 服务可达，只是请求本身有问题
 
-            except native_openai.PermissionDeniedError as e:
-                # 权限错误 - 不可重试（账户权限不足），触发熔断
-                logger.error(f"OpenAI API permission denied: {str(e)}")
-                self._available = False  # 触发熔断
-                time_taken = int((time.time() - start_time) * 1000)
-                return ChatResult(
-                    success=False,
-                    attempt_count=attempt_count,
-                    time_taken=time_taken,
-                    content=None,
-                    error=ErrorType.PERMISSION_DENIED,
-                )
+                if policy.error is ErrorType.RATE_LIMIT:
+                    # 服务端给出 Retry-After 时同一 Provider 的其他请求也一起暂停
+                    retry_after = self._retry_after(e)
+                    if retry_after is not None and 0 < retry_after <= RETRY_AFTER_MAX:
+                        self.limiter.block_for(retry_after)
 
-            except native_openai.NotFoundError as e:
-                # 资源未找到 - 不可重试（模型不存在等），触发熔断
-                logger.error(f"OpenAI API resource not found: {str(e)}")
-                self._available = False  # 触发熔断
-                time_taken = int((time.time() - start_time) * 1000)
+                if (
+                    policy.retryable
+                    and attempt < max_retries - 1
+                    and wait_before_retry(e)
+                ):
+                    continue
                 return ChatResult(
                     success=False,
                     attempt_count=attempt_count,
-                    time_taken=time_taken,
+                    time_taken=elapsed_ms(),
                     content=None,
-                    error=ErrorType.NOT_FOUND,
+                    error=policy.error,
                 )
 
-            except native_openai.UnprocessableEntityError as e:
-                # 请求格式错误 - 不可重试（参数问题），但不触发熔断（可能是特定请求的问题）
-                logger.error(f"OpenAI API unprocessable entity: {str(e)}")
-                time_taken = int((time.time() - start_time) * 1000)
-                return ChatResult(
-                    success=False,
-                    attempt_count=attempt_count,
-                    time_taken=time_taken,
-                    content=None,
-                    error=ErrorType.UNPROCESSABLE_ENTITY,
-                )
+        # 理论上不会到这里，但作为保险
+        logger.error("All retry attempts exhausted")
+        time_taken = elapsed_ms()
+        return ChatResult(
+            success=False,
+            attempt_count=attempt_count,
+            time_taken=time_taken,
+            content=None,
+            error=ErrorType.OTHER,
+        )
 
-            except native_openai.APITimeoutError as e:
-                # 超时错误 - 可重试
-                logger.error(
-                    f"OpenAI API timeout error (attempt {attempt + 1}/{max_retries}): {str(e)}"
-                )
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                time_taken = int((time.time() - start_time) * 1000)
-                return ChatResult(
-                    success=False,
-                    attempt_count=attempt_count,
-                    time_taken=time_taken,
-                    content=None,
-                    error=ErrorType.TIMEOUT,
-                )
-            except native_openai.APIConnectionError as e:
-                # 连接错误 - 可重试
-                logger.error(
-                    f"OpenAI API connection error (attempt {attempt + 1}/{max_retries}): {e.__cause__}"
-                )
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                time_taken = int((time.time() - start_time) * 1000)
-                return ChatResult(
-                    success=False,
-                    attempt_count=attempt_count,
-                    time_taken=time_taken,
-                    content=None,
-                    error=ErrorType.CONNECTION_ERROR,
-                )
+    def batch_chat(self, messages_list: List[list], **kwargs) -> List[ChatResult]:
+        """通过 OpenAI 批处理接口（/v1/batches）一次提交多个请求。
 
-            except native_openai.RateLimitError as e:
-                # 速率限制 - 检查是否为额度不足
-                error_message = str(e)
-                # 检查是否是额度不足（insufficient_quota）
-                if (
-                    "insufficient_quota" in error_message.lower()
-                    or "quota" in error_message.lower()
-                ):
-                    logger.error(f"OpenAI API insufficient quota: {error_message}")
-                    self._available = False  # 触发熔断
-                    time_taken = int((time.time() - start_time) * 1000)
-                    return ChatResult(
-                        success=False,
-                        attempt_count=attempt_count,
-                        time_taken=time_taken,
-                        content=None,
-                        error=ErrorType.INSUFFICIENT_QUOTA,
-                    )
+        把请求写成 JSONL 上传后创建批处理任务，每 BATCH_POLL_INTERVAL 秒轮询一次，
+        超过 BATCH_MAX_WAIT 秒仍未完成时取消任务，并继续轮询到 cancelled 状态以读取已完成、
+        已计费的那部分结果。批处理按异步计费，价格约为普通请求的一半，
+        但完成时间不确定，适合对时延不敏感的任务。
+        未返回或未正常结束的请求记为失败，由调用方逐个重试；命中响应缓存的请求不提交。
 
-                # 普通速率限制 - 可重试
-                logger.error(
-                    f"OpenAI API rate limit exceeded (attempt {attempt + 1}/{max_retries}): {error_message}"
-                )
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                time_taken = int((time.time() - start_time) * 1000)
-                return ChatResult(
+        Args:
+            messages_list (List[list]): 各请求的消息列表。
+            **kwargs: 写入每个请求体的其他参数。与 chat 相同，stream、timeout 和
+                extra_headers 不写入请求体也不计入缓存键，两条路径的缓存可以互相命中。
+
+        Returns:
+            List[ChatResult]: 与 messages_list 顺序一致的结果，time_taken 均为整个批处理的耗时。
+        """
+        kwargs.pop("stream", None)
+        kwargs.pop("timeout", None)
+        kwargs.pop("extra_headers", None)
+        results: List[Optional[ChatResult]] = [None] * len(messages_list)
+        cache_keys: List[Optional[str]] = [None] * len(messages_list)
+        if self.cache is not None:
+            for i, messages in enumerate(messages_list):
+                cache_keys[i] = self._response_cache_key(messages, kwargs)
+                cached = self.cache.get(cache_keys[i])
+                if cached is not None:
+                    results[i] = ChatResult(
+                        success=True, attempt_count=0, time_taken=0, content=cached
+                    )
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        if not self.breaker.allow_request():
+            logger.warning("Provider %s circuit is open, failing fast", self.model)
+            for i in pending:
+                results[i] = ChatResult(
                     success=False,
-                    attempt_count=attempt_count,
-                    time_taken=time_taken,
+                    attempt_count=0,
+                    time_taken=0,
                     content=None,
-                    error=ErrorType.RATE_LIMIT,
+                    error=ErrorType.OTHER,
                 )
+            return results
 
-            except native_openai.APIStatusError as e:
-                # 根据状态码进行细粒度分类
-                status_code = e.status_code
-                time_taken = int((time.time() - start_time) * 1000)
-
-                # 应触发熔断的状态码（Provider 级别的不可恢复错误）
-                if status_code == 401:
-                    logger.error(
-                        f"OpenAI API authentication error (401): {e.response.text}"
-                    )
-                    self._available = False  # 触发熔断
-                    return ChatResult(
-                        success=False,
-                        attempt_count=attempt_count,
-                        time_taken=time_taken,
-                        content=None,
-                        error=ErrorType.AUTHENTICATION_ERROR,
-                    )
-                if status_code == 402:
-                    logger.error(
-                        f"OpenAI API payment required (402): {e.response.text}"
-                    )
-                    self._available = False  # 触发熔断
-                    return ChatResult(
-                        success=False,
-                        attempt_count=attempt_count,
-                        time_taken=time_taken,
-                        content=None,
-                        error=ErrorType.INSUFFICIENT_QUOTA,
-                    )
-                if status_code == 403:
-                    logger.error(
-                        f"OpenAI API permission denied (403): {e.response.text}"
-                    )
-                    self._available = False  # 触发熔断
-                    return ChatResult(
-                        success=False,
-                        attempt_count=attempt_count,
-                        time_taken=time_taken,
-                        content=None,
-                        error=ErrorType.PERMISSION_DENIED,
-                    )
-                if status_code == 404:
-                    logger.error(f"OpenAI API not found (404): {e.response.text}")
-                    self._available = False  # 触发熔断
-                    return ChatResult(
-                        success=False,
-                        attempt_count=attempt_count,
-                        time_taken=time_taken,
-                        content=None,
-                        error=ErrorType.NOT_FOUND,
-                    )
-
-                # 请求级别错误（不触发熔断，可能通过调整请求解决）
-                if status_code == 400:
-                    logger.error(f"OpenAI API bad request (400): {e.response.text}")
-                    return ChatResult(
-                        success=False,
-                        attempt_count=attempt_count,
-                        time_taken=time_taken,
-                        content=None,
-                        error=ErrorType.UNPROCESSABLE_ENTITY,
-                    )
-                if status_code == 413:
-                    logger.error(
-                        f"OpenAI API payload too large (413): {e.response.text}"
-                    )
-                    return ChatResult(
-                        success=False,
-                        attempt_count=attempt_count,
-                        time_taken=time_taken,
-                        content=None,
-                        error=ErrorType.PAYLOAD_TOO_LARGE,
-                    )
-                if status_code == 422:
-                    logger.error(
-                        f"OpenAI API unprocessable entity (422): {e.response.text}"
-                    )
-                    return ChatResult(
-                        success=False,
-                        attempt_count=attempt_count,
-                        time_taken=time_taken,
-                        content=None,
-                        error=ErrorType.UNPROCESSABLE_ENTITY,
-                    )
+        start = time.monotonic()
+        body_extra = dict(self._extra_body or {})
+        lines = [
+            _dumps_sorted(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": messages_list[i],
+                        **body_extra,
+                        **kwargs,
+                    },
+                }
+            )
+            for i in pending
+        ]
 
-                # 其他状态码 - 可重试（如 5xx, 429, 408 等）
-                else:
-                    logger.error(
-                        f"OpenAI API status error (attempt {attempt + 1}/{max_retries}): {status_code} - {e.response.text}"
+        output = ""
+        try:
+            input_file = self.client.files.create(
+                file=("batch.jsonl", b"\n".join(lines)), purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window=BATCH_COMPLETION_WINDOW,
+            )
+            logger.info(
+                "Submitted batch %s with %d requests for model: %s",
+                batch.id,
+                len(pending),
+                self.model,
+            )
+            cancel_requested = False
+            while batch.status not in _BATCH_FINAL_STATUSES:
+                waited = time.monotonic() - start
+                if not cancel_requested and waited >= BATCH_MAX_WAIT:
+                    logger.warning(
+                        "Batch %s not finished after %.0f seconds, cancelling",
+                        batch.id,
+                        BATCH_MAX_WAIT,
                     )
-                    if attempt < max_retries - 1:
-                        logger.info(
-                            f"Status code {status_code} is retryable. Retrying in {retry_delay} seconds..."
-                        )
-                        time.sleep(retry_delay)
-                        continue
-                    return ChatResult(
-                        success=False,
-                        attempt_count=attempt_count,
-                        time_taken=time_taken,
-                        content=None,
-                        error=ErrorType.OTHER,
+                    batch = self.client.batches.cancel(batch.id)
+                    cancel_requested = True
+                    continue
+                if cancel_requested and waited >= BATCH_MAX_WAIT + BATCH_CANCEL_WAIT:
+                    logger.warning(
+                        "Batch %s still %s, giving up", batch.id, batch.status
                     )
+                    break
+                time.sleep(BATCH_POLL_INTERVAL)
+                batch = self.client.batches.retrieve(batch.id)
+            if batch.output_file_id:
+                output = self.client.files.content(batch.output_file_id).text
+        except Exception as e:
+            policy = _classify_error(e)
+            logger.error("%s during OpenAI batch call: %s", type(e).__name__, e)
+            if policy.trip:
+                self.breaker.trip()
+            elif policy.retryable:
+                self.breaker.on_failure()
+        else:
+            logger.info("Batch %s finished with status: %s", batch.id, batch.status)
+            # failed、expired、cancelled 等状态说明服务端没能按时处理，同样计入失败
+            if batch.status == "completed":
+                self.breaker.on_success()
+            else:
+                self.breaker.on_failure()
+
+        time_taken = int((time.monotonic() - start) * 1000)
+        for line in output.splitlines():
+            try:
+                record = json.loads(line)
+                i = int(record["custom_id"])
+                response = record.get("response") or {}
+                choice = response["body"]["choices"][0]
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+            if (
+                i not in pending
+                or response.get("status_code") != 200
+                or choice.get("finish_reason") != "stop"
+            ):
+                continue
+            content = ((choice.get("message") or {}).get("content") or "").strip()
+            if cache_keys[i] is not None:
+                self.cache[cache_keys[i]] = content
+            results[i] = ChatResult(
+                success=True, attempt_count=1, time_taken=time_taken, content=content
+            )
 
-            except Exception as e:
-                # 其他未知错误 - 默认可重试（黑名单模式）
-                logger.error(
-                    f"Unexpected error during OpenAI API call (attempt {attempt + 1}/{max_retries}): {str(e)}"
-                )
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                time_taken = int((time.time() - start_time) * 1000)
-                return ChatResult(
+        for i in pending:
+            if results[i] is None:
+                results[i] = ChatResult(
                     success=False,
-                    attempt_count=attempt_count,
+                    attempt_count=1,
                     time_taken=time_taken,
                     content=None,
                     error=ErrorType.OTHER,
                 )
-
-        # 理论上不会到这里，但作为保险
-        logger.error("All retry attempts exhausted")
-        time_taken = int((time.time() - start_time) * 1000)
-        return ChatResult(
-            success=False,
-            attempt_count=attempt_count,
-            time_taken=time_taken,
-            content=None,
-            error=ErrorType.OTHER,
-        )
+        return results
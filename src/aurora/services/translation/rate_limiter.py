@@ -0,0 +1,139 @@
+import re
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+from aurora.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# OpenAI 的重置时间是 "1s"、"6m0s"、"20ms" 这样的时长
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+# 各维度对应的 (剩余额度, 重置时间) 响应头，按顺序取第一个存在的
+# OpenRouter 只返回不带后缀的 x-ratelimit-remaining / x-ratelimit-reset，按请求数计
+_HEADER_NAMES = {
+    "requests": (
+        ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+        ("x-ratelimit-remaining", "x-ratelimit-reset"),
+    ),
+    "tokens": (("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),),
+}
+
+
+def parse_reset_seconds(value: str) -> Optional[float]:
+    """解析限流重置时间响应头，返回距离重置还有多少秒。
+
+    支持时长（"1s"、"6m0s"、"20ms"）、秒数，以及秒级或毫秒级的 Unix 时间戳。
+
+    Args:
+        value (str): 响应头的值。
+
+    Returns:
+        Optional[float]: 距离重置的秒数，无法解析时返回 None。
+    """
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        parts = _DURATION_RE.findall(value)
+        if not parts or "".join(n + unit for n, unit in parts) != value:
+            return None
+        return sum(float(n) * _UNIT_SECONDS[unit] for n, unit in parts)
+
+    if number > 1e12:
+        return number / 1000 - time.time()
+    if number > 1e9:
+        return number - time.time()
+    return number
+
+
+class RateLimiter:
+    """根据服务端返回的限流响应头做准入控制，在额度耗尽前主动放慢请求，避免触发 429。
+
+    每次响应后用 x-ratelimit-* 响应头刷新剩余额度和重置时间；每次请求前调用 acquire，
+    剩余请求数低于 low_watermark 时把剩余额度均匀分摊到重置前的时间内，额度为0时等到重置。
+    收到带 Retry-After 的 429 时可调用 block_for，让共享同一 Provider 的线程一起暂停。
+
+    线程安全。
+
+    Attributes:
+        low_watermark (int): 开始分摊请求的剩余请求数阈值。
+        max_wait (float): 单次 acquire 最长等待秒数。
+    """
+
+    def __init__(self, low_watermark: int = 2, max_wait: float = 60.0):
+        """初始化限流器。
+
+        Args:
+            low_watermark (int): 开始分摊请求的剩余请求数阈值，默认2。
+            max_wait (float): 单次 acquire 最长等待秒数，默认60秒。
+        """
+        self.low_watermark = low_watermark
+        self.max_wait = max_wait
+        # 维度 -> (剩余额度, 重置时的 time.monotonic() 时间戳)
+        self._windows: Dict[str, Tuple[int, float]] = {}
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, headers: Mapping[str, str]):
+        """用一次响应的限流响应头刷新额度。
+
+        Args:
+            headers (Mapping[str, str]): 响应头，键不区分大小写（如 httpx.Headers）。
+        """
+        now = time.monotonic()
+        with self._lock:
+            for dimension, candidates in _HEADER_NAMES.items():
+                for remaining_name, reset_name in candidates:
+                    remaining = headers.get(remaining_name)
+                    reset = headers.get(reset_name)
+                    if remaining is None or reset is None:
+                        continue
+                    reset_seconds = parse_reset_seconds(reset)
+                    try:
+                        remaining = int(float(remaining))
+                    except ValueError:
+                        break
+                    if reset_seconds is not None:
+                        self._windows[dimension] = (remaining, now + reset_seconds)
+                    break
+
+    def block_for(self, seconds: float):
+        """在接下来的 seconds 秒内阻止所有请求，用于服务端给出 Retry-After 的情况。
+
+        Args:
+            seconds (float): 暂停秒数。
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def acquire(self) -> float:
+        """请求前调用，必要时等待，并预扣一次请求额度。
+
+        Returns:
+            float: 实际等待的秒数。
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = self._blocked_until - now
+
+            for dimension, (remaining, reset_at) in list(self._windows.items()):
+                if reset_at <= now:
+                    del self._windows[dimension]
+                    continue
+                if remaining <= 0:
+                    wait = max(wait, reset_at - now)
+                elif dimension == "requests" and remaining < self.low_watermark:
+                    wait = max(wait, (reset_at - now) / (remaining + 1))
+
+            requests = self._windows.get("requests")
+            if requests is not None:
+                self._windows["requests"] = (requests[0] - 1, requests[1])
+            wait = min(max(wait, 0.0), self.max_wait)
+
+        if wait > 0:
+            logger.info("Rate limit nearly exhausted, waiting %.2f seconds", wait)
+            time.sleep(wait)
+        return wait
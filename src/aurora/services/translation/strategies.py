@@ -1,6 +1,8 @@
+import contextvars
 import json
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List, Dict
 
 from aurora.data_structures.subtitle_node import SubtitleBlock
@@ -26,19 +28,42 @@ from aurora.services.translation.prompts import (
     TITLE_SYSTEM_PROMPT,
     SYNOPSIS_USER_QUERY,
     TITLE_USER_QUERY,
+    SUBTITLE_BATCH_INSTRUCTION,
+    METADATA_BATCH_INSTRUCTION,
+    SUBTITLE_TIMELINE_REPAIR_PROMPT,
 )
 from aurora.services.translation.provider import Provider
+from aurora.utils import json_utils
 from aurora.utils.logger import get_logger
-from aurora.utils.prompt_utils import build_messages, recursive_replace
+from aurora.utils.prompt_utils import (
+    build_messages,
+    fill_placeholders,
+    find_placeholders,
+)
 from aurora.utils.subtitle_utils import (
     update_translate_context,
     adaptive_slice_subtitle,
     aggregate_successful_results,
+    extract_timelines,
+    find_mismatched_subtitles,
 )
 from langfuse import observe
 
 logger = get_logger(__name__)
 
+# 字幕序号或时间轴与原文不一致时，最多请求的次数（含第一次）
+SUBTITLE_VALIDATION_ATTEMPTS = 3
+
+# 元数据查询模板中的占位符
+METADATA_PLACEHOLDERS = frozenset(
+    {"actors_value", "actresses_value", "synopsis_value", "title_value"}
+)
+# 字幕查询模板中的占位符
+SUBTITLE_PLACEHOLDERS = frozenset({"metadata_value", "text_value", "terms_value"})
+
+# 尽力而为处理字幕块时同时请求 Provider 的最大线程数
+SUBTITLE_WORKERS = 4
+
 
 class TranslateStrategy(ABC):
     """
@@ -54,15 +79,21 @@ class TranslateStrategy(ABC):
         self.stream = stream
         self.temperature = temperature
 
+    def _chat_kwargs(self, **kwargs) -> dict:
+        """_adaptive_chat 传给 Provider 的参数（不含 stream）。
+
+        批处理接口也用它构造参数，使同一请求走两条路径时的响应缓存键一致。
+        """
+        if self.temperature is None:
+            kwargs["temperature"] = self.temperature
+        return kwargs
+
     def _adaptive_chat(
         self, provider: Provider, messages: list, **kwargs
     ) -> ChatResult:
-        if self.temperature is not None:
-            return provider.chat(messages, stream=self.stream, **kwargs)
-        else:
-            return provider.chat(
-                messages, temperature=self.temperature, stream=self.stream, **kwargs
-            )
+        return provider.chat(
+            messages, stream=self.stream, **self._chat_kwargs(**kwargs)
+        )
 
     def _call_provider(
         self, provider: Provider, messages, context: TranslateContext
@@ -147,13 +178,36 @@ class MetaDataTranslateStrategy(TranslateStrategy):
             TaskType.METADATA_SYNOPSIS: SYNOPSIS_USER_QUERY,
             TaskType.METADATA_TITLE: TITLE_USER_QUERY,
         }
+        # 模板不变，占位符位置只需查找一次
+        self._query_plans = {
+            task_type: find_placeholders(template, METADATA_PLACEHOLDERS)
+            for task_type, template in self.query_templates.items()
+        }
 
     def process(self, provider: Provider, context: TranslateContext) -> ProcessResult:
         raise NotImplementedError()
 
+    @staticmethod
+    def _skip_blank_text(context: TranslateContext) -> Optional[ProcessResult]:
+        """
+        待翻译文本为空或只有空白时不必请求大模型，直接返回空字符串作为成功结果
+        否则返回 None，表示需要继续处理
+        """
+        text = context.text_to_process
+        if text and not text.isspace():
+            return None
+        logger.info("Skipping %s for blank text", context.task_type)
+        return ProcessResult(
+            task_type=context.task_type,
+            attempt_count=0,
+            time_taken=0,
+            content="",
+            success=True,
+        )
+
 
 class SimpleMetaDataStrategy(MetaDataTranslateStrategy):
-    """带UUID前缀的元数据翻译策略。不需要其他额外信息，用于片商、演员、导演和类别等简单元数据翻译。"""
+    """简单元数据翻译策略。不需要其他额外信息，用于片商、演员、导演和类别等简单元数据翻译。"""
 
     @observe
     def process(self, provider: Provider, context: TranslateContext) -> ProcessResult:
@@ -166,6 +220,10 @@ class SimpleMetaDataStrategy(MetaDataTranslateStrategy):
         Returns:
             ProcessResult: 翻译结果。
         """
+        blank_result = self._skip_blank_text(context)
+        if blank_result is not None:
+            return blank_result
+
         # 熔断检查：如果 Provider 已熔断，快速失败
         circuit_breaker_result = self._check_provider_available(
             provider, context.task_type
@@ -179,6 +237,83 @@ class SimpleMetaDataStrategy(MetaDataTranslateStrategy):
         messages = build_messages(system_prompt, examples, context.text_to_process)
         return self._call_provider(provider, messages, context)
 
+    @observe
+    def process_batch(
+        self, provider: Provider, task_type: TaskType, texts: List[str]
+    ) -> Optional[List[ProcessResult]]:
+        """在一次请求中翻译多条同类型的元数据。
+
+        输入以json数组发送，要求大模型按相同顺序返回 `"results"` 数组。
+
+        Args:
+            provider (Provider): 服务提供者。
+            task_type (TaskType): 元数据任务类型。
+            texts (List[str]): 待翻译的文本列表。
+
+        Returns:
+            Optional[List[ProcessResult]]: 与 texts 一一对应的结果；请求失败、提供者已熔断
+                或返回内容无法解析、项数不符时返回 None，由调用方逐条重试。
+        """
+        if self._check_provider_available(provider, task_type) is not None:
+            return None
+
+        messages = [
+            {
+                "role": "system",
+                "content": self.system_prompts[task_type] + METADATA_BATCH_INSTRUCTION,
+            }
+        ]
+        # 示例同样合并成一问一答，让大模型直接看到批量输入输出的格式
+        examples = self.examples.get(task_type, {})
+        if examples:
+            messages.append(
+                {
+                    "role": "user",
+                    "content": json.dumps(list(examples), ensure_ascii=False),
+                }
+            )
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": json.dumps(
+                        {"results": list(examples.values())}, ensure_ascii=False
+                    ),
+                }
+            )
+        messages.append(
+            {"role": "user", "content": json.dumps(texts, ensure_ascii=False)}
+        )
+
+        chat_result = self._adaptive_chat(provider, messages)
+        translations = None
+        if chat_result.success and chat_result.content:
+            try:
+                translations = json_utils.loads(chat_result.content)["results"]
+            except (ValueError, KeyError, TypeError):
+                translations = None
+        if (
+            not isinstance(translations, list)
+            or len(translations) != len(texts)
+            or not all(isinstance(item, str) for item in translations)
+        ):
+            logger.warning(
+                "Batch translation of %d %s items returned malformed content",
+                len(texts),
+                task_type,
+            )
+            return None
+
+        return [
+            ProcessResult(
+                task_type=task_type,
+                attempt_count=chat_result.attempt_count,
+                time_taken=chat_result.time_taken,
+                content=translation,
+                success=True,
+            )
+            for translation in translations
+        ]
+
 
 class ContextualMetaDataStrategy(MetaDataTranslateStrategy):
     """使用上下文替换的元数据翻译策略。适用于需要上下文信息的元数据翻译，如简介、标题等。"""
@@ -213,19 +348,25 @@ class ContextualMetaDataStrategy(MetaDataTranslateStrategy):
             "synopsis_value": context.text_to_process,
             "title_value": context.text_to_process,
         }
-        populated_query = recursive_replace(
-            self.query_templates.get(context.task_type, {}), replacements
+        populated_query = fill_placeholders(
+            self.query_templates.get(context.task_type, {}),
+            self._query_plans.get(context.task_type, []),
+            replacements,
         )
         messages.append(
             {
                 "role": "user",
-                "content": json.dumps(populated_query, ensure_ascii=False, indent=2),
+                "content": json_utils.dumps_pretty(populated_query),
             }
         )
         return messages
 
     @observe
     def process(self, provider: Provider, context: TranslateContext) -> ProcessResult:
+        blank_result = self._skip_blank_text(context)
+        if blank_result is not None:
+            return blank_result
+
         messages = self.build_contextual_messages(context)
         return self._call_provider(provider, messages, context)
 
@@ -251,6 +392,11 @@ class BaseSubtitleStrategy(TranslateStrategy):
             TaskType.CORRECT_SUBTITLE: CORRECT_SUBTITLE_USER_QUERY,
             TaskType.TRANSLATE_SUBTITLE: TRANSLATE_SUBTITLE_USER_QUERY,
         }
+        # 模板不变，占位符位置只需查找一次
+        self._query_plans = {
+            task_type: find_placeholders(query, SUBTITLE_PLACEHOLDERS)
+            for task_type, query in self.user_queries.items()
+        }
 
     def process(self, provider: Provider, context: TranslateContext) -> ProcessResult:
         """处理字幕（需由子类实现）。
@@ -270,16 +416,34 @@ class BestEffortSubtitleStrategy(BaseSubtitleStrategy):
 
     维护字幕块链表，当节点失败时如果台词数>=10则三等分后重试。
     子类只需实现_create_initial_linked_list方法来创建初始链表。
+
+    Attributes:
+        max_workers (int): 同时请求 Provider 的最大节点数。
     """
 
+    def __init__(
+        self,
+        stream: bool = False,
+        temperature: float = 1.0,
+        max_workers: Optional[int] = None,
+    ):
+        """初始化尽力而为策略。
+
+        Args:
+            max_workers (Optional[int]): 同时请求 Provider 的最大节点数，
+                为None时使用 SUBTITLE_WORKERS。
+        """
+        super().__init__(stream, temperature)
+        self.max_workers = max_workers or SUBTITLE_WORKERS
+
     def build_contextual_subtitle_messages(
-        self, context: TranslateContext, node_text: str
+        self, context: TranslateContext, node_text: str | List[Dict]
     ) -> List[Dict[str, str]]:
         """构建字幕处理消息。
 
         Args:
             context: 处理上下文对象，需要包含metadata、terms等属性。
-            node_text (str): 待处理的字幕文本。
+            node_text (str | List[Dict]): 待处理的字幕文本，批量处理时为 {"id", "text"} 列表。
 
         Returns:
             list: 构建好的消息列表。
@@ -291,10 +455,10 @@ class BestEffortSubtitleStrategy(BaseSubtitleStrategy):
             "text_value": node_text,
             "terms_value": context.terms,
         }
-        populated_query_dict = recursive_replace(user_query, replacements)
-        user_content_json = json.dumps(
-            populated_query_dict, ensure_ascii=False, indent=2
+        populated_query_dict = fill_placeholders(
+            user_query, self._query_plans[context.task_type], replacements
         )
+        user_content_json = json_utils.dumps_pretty(populated_query_dict)
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_content_json},
@@ -330,6 +494,18 @@ class BestEffortSubtitleStrategy(BaseSubtitleStrategy):
         Returns:
             ProcessResult: 处理结果。
         """
+        # 没有任何字幕块时不请求大模型，直接失败
+        text = context.text_to_process
+        if not text or text.isspace():
+            logger.warning("No subtitles to process for %s", context.task_type)
+            return ProcessResult(
+                task_type=context.task_type,
+                attempt_count=0,
+                time_taken=0,
+                content=None,
+                success=False,
+            )
+
         # 熔断检查：如果 Provider 已熔断，快速失败
         circuit_breaker_result = self._check_provider_available(
             provider, context.task_type
@@ -376,8 +552,9 @@ class BestEffortSubtitleStrategy(BaseSubtitleStrategy):
     ) -> Tuple[SubtitleBlock, int, int]:
         """尽力而为地处理链表。
 
-        逐个处理节点，失败时如果台词数>=10则三等分节点并插入链表。
-        在处理过程中动态累积术语库，使后续节点能够利用之前识别的术语。
+        每轮把所有未处理的节点并发交给 Provider（最多 max_workers 个同时请求），
+        再按链表顺序串行收集结果：失败且台词数>=10的节点三等分后插入链表，留到下一轮处理。
+        术语库在每轮结束后按顺序累积，供下一轮的节点使用。
 
         Args:
             provider: 服务提供者。
@@ -391,62 +568,163 @@ class BestEffortSubtitleStrategy(BaseSubtitleStrategy):
                 int: 总 api 调用次数.
                 int: 总 api 时间(ms).
         """
-        prev = None
-        current = head
         new_head = head
 
-        while current is not None:
-            if current.is_processed:
-                # 已处理，跳过
-                prev = current
-                current = current.next
-                continue
+        while True:
+            pending = []
+            node = new_head
+            while node is not None:
+                if not node.is_processed:
+                    pending.append(node)
+                node = node.next
+            if not pending:
+                break
+
+            results = dict(
+                zip(pending, self._chat_nodes_concurrently(provider, context, pending))
+            )
 
-            # 处理当前节点
-            messages = self.build_contextual_subtitle_messages(context, current.origin)
+            prev = None
+            current = new_head
+            while current is not None:
+                result = results.get(current)
+                if result is None:
+                    prev = current
+                    current = current.next
+                    continue
 
-            logger.info("Processing node with %d subtitles", current.count_subtitles())
-            result = self._adaptive_chat(
-                provider, messages, timeout=500, response_format={"type": "json_object"}
-            )
+                # 累加调用次数和API时间（无论成功失败）
+                total_attempt_count += result.attempt_count
+                total_api_time += result.time_taken
+
+                if result.success:
+                    # 成功，标记为已处理
+                    current.processed = result
+                    current.is_processed = True
+                    context = update_translate_context(context, result)
+                    logger.info("Node processed successfully")
+                    prev = current
+                    current = current.next
+                    continue
 
-            # 累加调用次数和API时间（无论成功失败）
-            total_attempt_count += result.attempt_count
-            total_api_time += result.time_taken
-
-            if result.success:
-                # 成功，标记为已处理
-                current.processed = result
-                current.is_processed = True
-                context = update_translate_context(context, result)
-                logger.info("Node processed successfully")
-                prev = current
-                current = current.next
-            else:
                 # 失败，检查是否需要三等分
                 subtitle_count = current.count_subtitles()
                 logger.warning(
                     "Node processing failed, subtitle count: %d", subtitle_count
                 )
-
                 if subtitle_count >= 10:
-                    # 三等分
+                    # 三等分，新节点留到下一轮处理
                     logger.info("Splitting node into 3 parts")
-                    node1, node2, node3 = current.split_into_three()
-
+                    node1, _, node3 = current.split_into_three()
                     if prev is None:
                         new_head = node1
                     else:
                         prev.next = node1
-
-                    current = node1
+                    prev = node3
                 else:
                     current.processed = result
                     current.is_processed = True
                     prev = current
-                    current = current.next
+                current = prev.next
         return new_head, total_attempt_count, total_api_time
 
+    def _chat_nodes_concurrently(
+        self, provider: Provider, context: TranslateContext, nodes: List[SubtitleBlock]
+    ) -> List[ChatResult]:
+        """并发处理多个节点，返回与 nodes 顺序一致的结果。
+
+        Args:
+            provider (Provider): 服务提供者。
+            context (TranslateContext): 处理上下文，所有节点共用请求前的术语库。
+            nodes (List[SubtitleBlock]): 待处理的节点。
+
+        Returns:
+            List[ChatResult]: 各节点的处理结果。
+        """
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(nodes))
+        ) as executor:
+            futures = []
+            for node in nodes:
+                messages = self.build_contextual_subtitle_messages(context, node.origin)
+                logger.info("Processing node with %d subtitles", node.count_subtitles())
+                # 复制当前上下文，让 langfuse 的观测链路延续到工作线程
+                futures.append(
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        self._chat_with_timeline_check,
+                        provider,
+                        messages,
+                        node.origin,
+                    )
+                )
+            return [future.result() for future in futures]
+
+    def _chat_with_timeline_check(
+        self, provider: Provider, messages: List[Dict[str, str]], source: str
+    ) -> ChatResult:
+        """请求大模型处理字幕块，并核对输出的序号和时间轴。
+
+        输出中有字幕块的序号或时间轴与原文不一致时，把不一致的序号告诉大模型要求重新输出，
+        最多请求 SUBTITLE_VALIDATION_ATTEMPTS 次；仍不一致时退回原文，避免输出错误的时间轴。
+
+        Args:
+            provider (Provider): 服务提供者。
+            messages (List[Dict[str, str]]): 构建好的消息列表。
+            source (str): 原始字幕文本。
+
+        Returns:
+            ChatResult: 处理结果，调用次数和耗时为所有请求的累计值。
+        """
+        attempt_count = 0
+        time_taken = 0
+        for _ in range(SUBTITLE_VALIDATION_ATTEMPTS):
+            result = self._adaptive_chat(
+                provider, messages, timeout=500, response_format={"type": "json_object"}
+            )
+            attempt_count += result.attempt_count
+            time_taken += result.time_taken
+            result.attempt_count = attempt_count
+            result.time_taken = time_taken
+            if not result.success:
+                return result
+
+            try:
+                content = json_utils.loads(result.content).get("content")
+            except (AttributeError, ValueError):
+                # 无法解析的结果交给聚合阶段按原有逻辑处理
+                return result
+            if not isinstance(content, str):
+                return result
+            mismatched = find_mismatched_subtitles(source, content)
+            if not mismatched:
+                return result
+
+            logger.warning(
+                "Subtitles %s do not match the source timeline, asking for a fix",
+                ", ".join(mismatched),
+            )
+            messages = messages + [
+                {"role": "assistant", "content": result.content},
+                {
+                    "role": "user",
+                    "content": SUBTITLE_TIMELINE_REPAIR_PROMPT.format(
+                        indices=", ".join(mismatched)
+                    ),
+                },
+            ]
+
+        logger.error(
+            "Subtitle timeline still mismatched after %d attempts, keeping the source text",
+            SUBTITLE_VALIDATION_ATTEMPTS,
+        )
+        return ChatResult(
+            success=True,
+            attempt_count=attempt_count,
+            time_taken=time_taken,
+            content=json.dumps({"content": source}, ensure_ascii=False),
+        )
+
 
 class NoSliceSubtitleStrategy(BestEffortSubtitleStrategy):
     """不分片字幕处理策略。
@@ -473,16 +751,33 @@ class SliceSubtitleStrategy(BestEffortSubtitleStrategy):
 
     Attributes:
         slice_size (int): 每个分片的字幕条目数量。
+        batch_size (int): 一次请求合并处理的分片数量。
+        use_batch_api (bool): 是否先通过 Provider 的批处理接口提交所有分片。
     """
 
-    def __init__(self, stream, temperature, slice_size=200):
+    def __init__(
+        self,
+        stream,
+        temperature,
+        slice_size=200,
+        batch_size=1,
+        use_batch_api=False,
+        max_workers=None,
+    ):
         """初始化分片策略。
 
         Args:
             slice_size (int): 每个分片的字幕条目数量，默认200。
+            batch_size (int): 一次请求合并处理的分片数量，默认1即每个分片单独请求。
+            use_batch_api (bool): 是否先通过 Provider.batch_chat 一次提交所有分片，默认False。
+                批处理价格更低但完成时间不确定，未通过的分片再按常规流程处理。
+            max_workers (Optional[int]): 同时请求 Provider 的最大分片数，
+                为None时使用 SUBTITLE_WORKERS。
         """
-        super().__init__(stream, temperature)
+        super().__init__(stream, temperature, max_workers)
         self.slice_size = slice_size
+        self.batch_size = batch_size
+        self.use_batch_api = use_batch_api
 
     def _create_initial_linked_list(self, text: str) -> Optional[SubtitleBlock]:
         """创建多节点链表（预分片）。
@@ -512,3 +807,189 @@ class SliceSubtitleStrategy(BestEffortSubtitleStrategy):
             prev = node
 
         return head
+
+    def _process_linked_list_with_best_effort(
+        self,
+        provider,
+        context,
+        head: SubtitleBlock,
+        total_attempt_count: int,
+        total_api_time: int,
+    ) -> Tuple[SubtitleBlock, int, int]:
+        """先把多个分片合并到一次请求中处理，剩余的分片再逐个尽力而为处理。
+
+        启用 use_batch_api 时先把所有分片通过批处理接口提交一次。
+        之后每轮把未完成的分片按 batch_size 分组请求；有分片失败时批量大小减半再试，
+        直到批量大小为1，最后交给逐个处理的流程（失败时三等分重试）。
+
+        Args:
+            provider: 服务提供者。
+            context: 元数据。
+            head: 链表头节点。
+            total_attempt_count: 累计调用次数。
+            total_api_time: 累计API时间（毫秒）。
+        Returns:
+            A tuple containing:
+                SubtitleBlock: 更新后的头结点.
+                int: 总 api 调用次数.
+                int: 总 api 时间(ms).
+        """
+        if self.use_batch_api and head is not None:
+            context, attempt_count, api_time = self._process_with_batch_api(
+                provider, context, head
+            )
+            total_attempt_count += attempt_count
+            total_api_time += api_time
+
+        batch_size = self.batch_size
+        while batch_size > 1 and head is not None:
+            pending = []
+            node = head
+            while node is not None:
+                if not node.is_processed:
+                    pending.append(node)
+                node = node.next
+            if len(pending) < 2:
+                break
+
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start : start + batch_size]
+                if len(batch) < 2:
+                    continue
+                context, attempt_count, api_time = self._process_batch(
+                    provider, context, batch
+                )
+                total_attempt_count += attempt_count
+                total_api_time += api_time
+            batch_size //= 2
+
+        return super()._process_linked_list_with_best_effort(
+            provider, context, head, total_attempt_count, total_api_time
+        )
+
+    def _process_with_batch_api(
+        self, provider: Provider, context: TranslateContext, head: SubtitleBlock
+    ) -> Tuple[TranslateContext, int, int]:
+        """通过 Provider.batch_chat 一次提交所有未处理的分片。
+
+        通过编号和时间轴检查的分片标记为已处理，其余保持未处理，交给后续流程。
+
+        Args:
+            provider (Provider): 服务提供者。
+            context (TranslateContext): 处理上下文。
+            head (SubtitleBlock): 链表头节点。
+
+        Returns:
+            Tuple[TranslateContext, int, int]: 更新术语后的上下文、调用次数和API时间（毫秒）。
+        """
+        nodes = []
+        node = head
+        while node is not None:
+            if not node.is_processed:
+                nodes.append(node)
+            node = node.next
+        if not nodes:
+            return context, 0, 0
+
+        # 与逐个请求时 _adaptive_chat 传的参数相同（timeout 不计入缓存键），响应缓存可以互相命中
+        kwargs = self._chat_kwargs(response_format={"type": "json_object"})
+        logger.info("Submitting %d slices through the batch API", len(nodes))
+        results = provider.batch_chat(
+            [
+                self.build_contextual_subtitle_messages(context, node.origin)
+                for node in nodes
+            ],
+            **kwargs,
+        )
+
+        for node, result in zip(nodes, results):
+            if not result.success:
+                continue
+            try:
+                content = json_utils.loads(result.content).get("content")
+            except (AttributeError, ValueError):
+                continue
+            if (
+                not isinstance(content, str)
+                or not extract_timelines(content)
+                or find_mismatched_subtitles(node.origin, content)
+            ):
+                continue
+            node.processed = result
+            node.is_processed = True
+            context = update_translate_context(context, result)
+
+        logger.info(
+            "Batch API processed %d of %d slices",
+            sum(node.is_processed for node in nodes),
+            len(nodes),
+        )
+        # 批处理中的请求同时进行，耗时取最长的一个
+        return (
+            context,
+            sum(result.attempt_count for result in results),
+            max((result.time_taken for result in results), default=0),
+        )
+
+    def _process_batch(
+        self, provider: Provider, context: TranslateContext, nodes: List[SubtitleBlock]
+    ) -> Tuple[TranslateContext, int, int]:
+        """在一次请求中处理多个分片。
+
+        返回的每一项都要检查编号和时间轴，通过检查的分片标记为已处理，其余保持未处理。
+
+        Args:
+            provider (Provider): 服务提供者。
+            context (TranslateContext): 处理上下文。
+            nodes (List[SubtitleBlock]): 待处理的分片节点，编号从1开始。
+
+        Returns:
+            Tuple[TranslateContext, int, int]: 更新术语后的上下文、调用次数和API时间（毫秒）。
+        """
+        messages = self.build_contextual_subtitle_messages(
+            context,
+            [{"id": i, "text": node.origin} for i, node in enumerate(nodes, start=1)],
+        )
+        messages[0]["content"] += SUBTITLE_BATCH_INSTRUCTION
+
+        logger.info(
+            "Processing %d slices with %d subtitles in one request",
+            len(nodes),
+            sum(node.count_subtitles() for node in nodes),
+        )
+        result = self._adaptive_chat(
+            provider, messages, timeout=500, response_format={"type": "json_object"}
+        )
+        if not result.success:
+            logger.warning("Batched request for %d slices failed", len(nodes))
+            return context, result.attempt_count, result.time_taken
+
+        try:
+            items = {
+                int(item["id"]): item
+                for item in json_utils.loads(result.content)["results"]
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Failed to parse batched subtitle result: %s", e)
+            return context, result.attempt_count, result.time_taken
+
+        for i, node in enumerate(nodes, start=1):
+            item = items.get(i)
+            content = item.get("content") if isinstance(item, dict) else None
+            if (
+                not isinstance(content, str)
+                or not extract_timelines(content)
+                or find_mismatched_subtitles(node.origin, content)
+            ):
+                logger.warning("Slice %d of the batch is missing or mismatched", i)
+                continue
+            item_result = ChatResult(
+                success=True,
+                attempt_count=result.attempt_count,
+                time_taken=result.time_taken,
+                content=json.dumps(item, ensure_ascii=False),
+            )
+            node.processed = item_result
+            node.is_processed = True
+            context = update_translate_context(context, item_result)
+        return context, result.attempt_count, result.time_taken
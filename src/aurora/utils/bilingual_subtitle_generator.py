@@ -45,10 +45,10 @@ def _format_seconds_to_ass(seconds: float) -> str:
     """将秒数格式化为ASS时间戳 (H:MM:SS.cc)。"""
     if seconds < 0:
         seconds = 0
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    sec = int(seconds % 60)
-    csec = int((seconds * 100) % 100)
+    # 先换算成整数厘秒再用 divmod 拆分，避免浮点取余把 1.15 秒算成 1.14 秒
+    hours, rem = divmod(int(seconds * 100 + 0.5), 360_000)
+    minutes, rem = divmod(rem, 6000)
+    sec, csec = divmod(rem, 100)
     return f"{hours}:{minutes:02d}:{sec:02d}.{csec:02d}"
 
 
@@ -0,0 +1,44 @@
+import json
+
+# orjson 解析和序列化更快，且直接输出 UTF-8；未安装时退回标准库，输出完全相同。
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，调用方的异常处理不受影响。
+try:
+    import orjson
+
+    def loads(data):
+        """解析 JSON 文本。
+
+        Args:
+            data (str | bytes): JSON 文本。
+
+        Returns:
+            Any: 解析结果。
+        """
+        return orjson.loads(data)
+
+    def dumps_pretty(obj) -> str:
+        """序列化为缩进2格、不转义非 ASCII 字符的 JSON 文本。
+
+        Args:
+            obj: 待序列化的对象。
+
+        Returns:
+            str: JSON 文本。
+        """
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+except ImportError:
+    loads = json.loads
+
+    def dumps_pretty(obj) -> str:
+        """序列化为缩进2格、不转义非 ASCII 字符的 JSON 文本。
+
+        Args:
+            obj: 待序列化的对象。
+
+        Returns:
+            str: JSON 文本。
+        """
+        return json.dumps(obj, ensure_ascii=False, indent=2)
@@ -1,4 +1,5 @@
-from typing import List, Dict, Union
+import copy
+from typing import Any, Collection, List, Dict, Tuple, Union
 
 
 def recursive_replace(data_structure, replacements):
@@ -29,6 +30,65 @@ def recursive_replace(data_structure, replacements):
     return data_structure
 
 
+def find_placeholders(
+    data_structure, placeholders: Collection[str], path: Tuple = ()
+) -> List[Tuple[Tuple, str]]:
+    """找出嵌套的 dict/list 中值为占位符的位置，供 fill_placeholders 反复使用。
+
+    Args:
+        data_structure (Union[dict, list, Any]): 模板数据结构。
+        placeholders (Collection[str]): 占位符集合。
+        path (Tuple): 当前位置的路径，递归时使用。
+
+    Returns:
+        List[Tuple[Tuple, str]]: (键路径, 占位符) 列表。
+    """
+    if isinstance(data_structure, dict):
+        items = data_structure.items()
+    elif isinstance(data_structure, list):
+        items = enumerate(data_structure)
+    else:
+        if isinstance(data_structure, str) and data_structure in placeholders:
+            return [(path, data_structure)]
+        return []
+
+    found = []
+    for key, value in items:
+        found.extend(find_placeholders(value, placeholders, path + (key,)))
+    return found
+
+
+def fill_placeholders(
+    template: Union[dict, list],
+    plan: List[Tuple[Tuple, str]],
+    replacements: Dict[str, Any],
+) -> Union[dict, list]:
+    """按 find_placeholders 预先找到的位置替换占位符，结果与 recursive_replace 相同。
+
+    只复制占位符所在路径上的容器，其余部分与模板共享，模板本身不会被修改。
+
+    Args:
+        template (Union[dict, list]): 模板数据结构。
+        plan (List[Tuple[Tuple, str]]): find_placeholders 的返回值。
+        replacements (Dict[str, Any]): 占位符到替换内容的映射字典。
+
+    Returns:
+        Union[dict, list]: 替换后的新数据结构。
+    """
+    filled = copy.copy(template)
+    for path, placeholder in plan:
+        if placeholder not in replacements:
+            continue
+        parent, original = filled, template
+        for key in path[:-1]:
+            original = original[key]
+            if parent[key] is original:
+                parent[key] = copy.copy(original)
+            parent = parent[key]
+        parent[path[-1]] = replacements[placeholder]
+    return filled
+
+
 def build_messages(
     system_prompt: str, examples: Dict[str, str], query: str
 ) -> List[Dict[str, str]]:
@@ -1,12 +1,25 @@
 import json
-from typing import List
+import re
+from typing import List, Tuple
 
 from src.aurora.domain.context import TranslateContext
 from src.aurora.domain.results import ProcessResult
+from src.aurora.utils import json_utils
 from src.aurora.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# SRT 字幕块的序号行和紧随其后的时间轴行 HH:MM:SS,mmm --> HH:MM:SS,mmm
+_INDEXED_TIMELINE_RE = re.compile(
+    r"^[ \t]*(\d+)[ \t]*\r?\n"
+    r"[ \t]*(\d+:\d{1,2}:\d{1,2}[,.]\d{1,3})[ \t]*-->"
+    r"[ \t]*(\d+:\d{1,2}:\d{1,2}[,.]\d{1,3})",
+    re.MULTILINE,
+)
+
+# 字幕块之间的空行，连续多个空行视为一个分隔
+_BLANK_LINES_RE = re.compile(r"\n{2,}")
+
 
 def adaptive_slice_subtitle(srt_content: str, slice_size: int) -> List[str]:
     """自适应分片字幕内容。
@@ -22,7 +35,9 @@ def adaptive_slice_subtitle(srt_content: str, slice_size: int) -> List[str]:
     """
     if not srt_content:
         return []
-    all_blocks = [b for b in srt_content.strip().split("\n\n") if b.strip()]
+    all_blocks = [
+        b for b in _BLANK_LINES_RE.split(srt_content.strip()) if b and not b.isspace()
+    ]
     total_blocks = len(all_blocks)
 
     if total_blocks == 0:
@@ -145,17 +160,14 @@ def renumber_subtitles(srt_content: str) -> str:
     if not srt_content:
         return srt_content
 
-    blocks = srt_content.strip().split("\n\n")
     renumbered_blocks = []
-
-    for idx, block in enumerate(blocks, start=1):
-        if not block.strip():
+    for block in _BLANK_LINES_RE.split(srt_content.strip()):
+        if not block or block.isspace():
             continue
-        lines = block.split("\n")
-        if len(lines) >= 2:
-            # 替换第一行的序号
-            lines[0] = str(idx)
-            renumbered_blocks.append("\n".join(lines))
+        # 只替换第一行的序号，其余行原样保留；跳过的空块和残缺块不占用序号
+        _, newline, rest = block.partition("\n")
+        if newline:
+            renumbered_blocks.append(f"{len(renumbered_blocks) + 1}\n{rest}")
 
     return "\n\n".join(renumbered_blocks)
 
@@ -174,7 +186,7 @@ def update_translate_context(context, chat_result):
         return context
 
     try:
-        result_json = json.loads(chat_result.content)
+        result_json = json_utils.loads(chat_result.content)
         result_terms = result_json.get("terms", [])
         if not result_terms:
             return context
@@ -227,7 +239,7 @@ def aggregate_successful_results(
         if current.is_processed and current.processed and current.processed.success:
             # 解析 JSON 内容
             try:
-                result_json = json.loads(current.processed.content)
+                result_json = json_utils.loads(current.processed.content)
 
                 # 收集 content
                 if "content" in result_json:
@@ -263,3 +275,38 @@ def aggregate_successful_results(
         differences=all_differences if all_differences else None,
         success=renumbered_content is not None,
     )
+
+
+def extract_timelines(srt_content: str) -> List[Tuple[str, str, str]]:
+    """提取SRT字幕中每个字幕块的序号和起止时间。
+
+    Args:
+        srt_content (str): SRT字幕内容。
+
+    Returns:
+        List[Tuple[str, str, str]]: 按出现顺序排列的 (序号, 开始时间, 结束时间) 列表。
+    """
+    return _INDEXED_TIMELINE_RE.findall(srt_content)
+
+
+def find_mismatched_subtitles(source: str, output: str) -> List[str]:
+    """找出大模型输出中序号或时间轴与原文不一致的字幕块。
+
+    允许输出缺少部分字幕块（校正时会删除乱码块），但输出的每个字幕块都必须在原文中
+    有相同序号且时间轴完全一致的字幕块。
+
+    Args:
+        source (str): 原始SRT字幕。
+        output (str): 大模型输出的SRT字幕。
+
+    Returns:
+        List[str]: 不一致的字幕块序号，全部一致时为空列表。
+    """
+    source_timelines = {
+        index: (start, end) for index, start, end in extract_timelines(source)
+    }
+    return [
+        index
+        for index, start, end in extract_timelines(output)
+        if source_timelines.get(index) != (start, end)
+    ]
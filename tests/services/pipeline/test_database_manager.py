@@ -0,0 +1,440 @@
+import os
+import sqlite3
+
+import pytest
+
+from aurora.domain.enums import MetadataType, PiplinePhase, StageStatus
+from aurora.domain.movie import Metadata, Movie, Video
+from aurora.domain.subtitle import BilingualText
+from aurora.services.pipeline.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return DatabaseManager(str(tmp_path / "data.sqlite3"))
+
+
+@pytest.fixture
+def cursor(manager):
+    conn = sqlite3.connect(manager.db_path)
+    conn.row_factory = sqlite3.Row
+    yield conn.cursor()
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def sample_video(sha256, tmp_path):
+    return Video(
+        sha256=sha256,
+        filename="sample_video",
+        suffix="mp4",
+        absolute_path=str(tmp_path / "sample_video.mp4"),
+    )
+
+
+@pytest.fixture
+def registered_video(manager, cursor, sample_video):
+    manager.register_movie(Movie(code="ABC-123", videos=[sample_video]), cursor)
+    return sample_video
+
+
+def _fresh_copy(video: Video) -> Video:
+    return Video(
+        sha256=video.sha256,
+        filename=video.filename,
+        suffix=video.suffix,
+        absolute_path=video.absolute_path,
+    )
+
+
+class TestVideosWithoutRowid:
+    def _videos_sql(self, db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute(
+                "select sql from sqlite_master where type = 'table' and name = 'videos'"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_new_database_uses_without_rowid(self, manager):
+        assert "without rowid" in self._videos_sql(manager.db_path)
+
+    def test_legacy_videos_table_is_migrated(self, tmp_path, sha256):
+        db_path = str(tmp_path / "legacy.sqlite3")
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            create table videos
+            (
+                sha256                  text primary key,
+                absolute_path           text unique,
+                filename                text,
+                bilingual_subtitle_path text
+            );
+            create index idx_videos_filename on videos (filename);
+            """)
+        conn.execute(
+            "insert into videos values (?, ?, ?, ?)",
+            (sha256, "/videos/a.mp4", "a", "/videos/a.ass"),
+        )
+        conn.commit()
+        conn.close()
+
+        manager = DatabaseManager(db_path)
+        assert "without rowid" in self._videos_sql(db_path)
+        cursor = manager._get_conn().cursor()
+        cursor.execute(
+            "select sha256, filename, bilingual_subtitle_path, is_deleted from videos"
+        )
+        assert cursor.fetchall() == [(sha256, "a", "/videos/a.ass", 0)]
+        cursor.execute("pragma index_list(videos)")
+        assert "idx_videos_filename" in [row[1] for row in cursor.fetchall()]
+        manager.close()
+
+
+class TestPhaseIndex:
+    def test_indices_match_column_names(self, manager, cursor):
+        cursor.execute("select * from videos")
+        columns = [description[0] for description in cursor.description]
+        for phase, (status_col, path_col) in manager.phase_to_column.items():
+            status_idx, path_idx = manager._phase_to_idx[phase]
+            assert columns[status_idx] == status_col
+            assert columns[path_idx] == path_col
+
+
+class TestSharedConnection:
+    def test_internal_cursor_writes_are_committed(self, manager, sample_video):
+        manager.register_movie(Movie(code="ABC-123", videos=[sample_video]))
+
+        conn = sqlite3.connect(manager.db_path)
+        try:
+            rows = conn.execute("select movie_code, video_sha256 from movie_videos")
+            assert rows.fetchall() == [("ABC-123", sample_video.sha256)]
+        finally:
+            conn.close()
+
+    def test_register_movie_inserts_every_video(self, manager, sha256, tmp_path):
+        videos = [
+            Video(
+                sha256=f"{sha256[:-1]}{i}",
+                filename=f"part{i}",
+                suffix="mp4",
+                absolute_path=str(tmp_path / f"part{i}.mp4"),
+            )
+            for i in range(3)
+        ]
+        manager.register_movie(Movie(code="ABC-123", videos=videos))
+
+        conn = sqlite3.connect(manager.db_path)
+        try:
+            rows = conn.execute("select video_sha256 from movie_videos order by 1")
+            assert [row[0] for row in rows] == sorted(v.sha256 for v in videos)
+            assert conn.execute("select count(*) from videos").fetchone() == (3,)
+        finally:
+            conn.close()
+
+    def test_register_movie_is_idempotent(self, manager, sample_video):
+        movie = Movie(code="ABC-123", videos=[sample_video])
+        manager.register_movie(movie)
+        manager.register_movie(movie)
+
+        conn = sqlite3.connect(manager.db_path)
+        try:
+            for table in ("movies", "videos", "movie_videos"):
+                count = conn.execute(f"select count(*) from {table}").fetchone()
+                assert count == (1,)
+        finally:
+            conn.close()
+
+    def test_connection_is_reused_and_closed(self, manager):
+        conn = manager._get_conn()
+        assert manager._get_conn() is conn
+        manager.close()
+        assert manager._conn is None
+
+    def test_connection_pragmas_are_applied(self, manager):
+        conn = manager._get_conn()
+        assert conn.execute("pragma journal_mode").fetchone() == ("wal",)
+        assert conn.execute("pragma synchronous").fetchone() == (1,)
+        assert conn.execute("pragma temp_store").fetchone() == (2,)
+
+
+class TestSetVideoStatus:
+    @pytest.mark.parametrize(
+        "status_str, expected",
+        [
+            ("success", StageStatus.SUCCESS),
+            ("skipped", StageStatus.SKIPPED),
+            (None, StageStatus.PENDING),
+            ("", StageStatus.PENDING),
+            ("unknown", StageStatus.PENDING),
+        ],
+    )
+    def test_parse_status(self, status_str, expected):
+        assert DatabaseManager._parse_status(status_str) is expected
+
+    def test_final_product_probe_uses_primary_key(self, manager, cursor):
+        cursor.execute("explain query plan " + manager._final_product_probe_sql, ("x",))
+        assert "PRIMARY KEY" in cursor.fetchone()[3]
+
+    def test_unknown_video_is_untouched(self, manager, cursor, sample_video):
+        manager.set_video_status(sample_video, cursor)
+        assert sample_video.status == {}
+
+    def test_fresh_video_is_pending(self, manager, cursor, registered_video):
+        video = _fresh_copy(registered_video)
+        manager.set_video_status(video, cursor)
+        for phase in manager.video_phases:
+            assert video.status[phase] == StageStatus.PENDING
+
+    def test_all_phases_success_when_final_product_exists(
+        self, manager, cursor, registered_video, tmp_path
+    ):
+        for phase in manager.video_phases:
+            by_product = tmp_path / phase.value
+            by_product.touch()
+            registered_video.status[phase] = StageStatus.SUCCESS
+            registered_video.by_products[phase] = str(by_product)
+        manager.update_video(registered_video, cursor)
+
+        video = _fresh_copy(registered_video)
+        manager.set_video_status(video, cursor)
+        for phase in manager.video_phases:
+            assert video.status[phase] == StageStatus.SUCCESS
+
+    def test_completed_video_keeps_stored_statuses(
+        self, manager, cursor, registered_video, tmp_path
+    ):
+        final_product = tmp_path / "final.ass"
+        final_product.touch()
+        for phase in manager.video_phases:
+            registered_video.status[phase] = StageStatus.SUCCESS
+        registered_video.status[PiplinePhase.DENOISE_AUDIO] = StageStatus.SKIPPED
+        registered_video.by_products[PiplinePhase.BILINGUAL_SUBTITLE] = str(
+            final_product
+        )
+        manager.update_video(registered_video, cursor)
+
+        video = _fresh_copy(registered_video)
+        manager.set_video_status(video, cursor)
+        assert video.status == registered_video.status
+        assert video.by_products[PiplinePhase.BILINGUAL_SUBTITLE] == str(final_product)
+
+    def test_translated_but_not_merged_loads_every_path(
+        self, manager, cursor, registered_video, tmp_path
+    ):
+        for phase in manager.video_phases[:5]:
+            by_product = tmp_path / phase.value
+            by_product.touch()
+            registered_video.status[phase] = StageStatus.SUCCESS
+            registered_video.by_products[phase] = str(by_product)
+        registered_video.status[PiplinePhase.BILINGUAL_SUBTITLE] = StageStatus.PENDING
+        manager.update_video(registered_video, cursor)
+
+        video = _fresh_copy(registered_video)
+        manager.set_video_status(video, cursor)
+        assert video.status == registered_video.status
+        for phase in manager.video_phases[:5]:
+            assert video.by_products[phase] == registered_video.by_products[phase]
+
+    def test_missing_by_product_resets_subsequent_phases(
+        self, manager, cursor, registered_video, tmp_path
+    ):
+        for phase in manager.video_phases[:3]:
+            by_product = tmp_path / phase.value
+            by_product.touch()
+            registered_video.status[phase] = StageStatus.SUCCESS
+            registered_video.by_products[phase] = str(by_product)
+        (tmp_path / PiplinePhase.DENOISE_AUDIO.value).unlink()
+        manager.update_video(registered_video, cursor)
+
+        video = _fresh_copy(registered_video)
+        manager.set_video_status(video, cursor)
+        assert video.status[PiplinePhase.EXTRACT_AUDIO] == StageStatus.SUCCESS
+        for phase in manager.video_phases[1:]:
+            assert video.status[phase] == StageStatus.PENDING
+            assert phase not in video.by_products
+
+    def test_sibling_by_products_are_scanned_once(
+        self, manager, cursor, registered_video, tmp_path, monkeypatch
+    ):
+        for phase in manager.video_phases[:3]:
+            by_product = tmp_path / phase.value
+            by_product.touch()
+            registered_video.status[phase] = StageStatus.SUCCESS
+            registered_video.by_products[phase] = str(by_product)
+        manager.update_video(registered_video, cursor)
+
+        def fail(path):
+            raise AssertionError(f"unexpected stat of {path}")
+
+        monkeypatch.setattr(os.path, "exists", fail)
+        video = _fresh_copy(registered_video)
+        manager.set_video_status(video, cursor)
+        for phase in manager.video_phases[:3]:
+            assert video.status[phase] == StageStatus.SUCCESS
+
+    def test_scan_misses_fall_back_to_stat(self, tmp_path):
+        (tmp_path / "Audio.wav").touch()
+        (tmp_path / "other.wav").touch()
+        (tmp_path / "broken.srt").symlink_to(tmp_path / "nowhere.srt")
+        paths = [
+            str(tmp_path / "Audio.wav"),
+            str(tmp_path / "audio.wav"),
+            str(tmp_path / "broken.srt"),
+            str(tmp_path / "sub" / ".."),
+        ]
+        exists_cache = {}
+        DatabaseManager._scan_existence({str(tmp_path): paths}, exists_cache)
+        assert exists_cache == {str(tmp_path / "Audio.wav"): True}
+
+    def test_lone_path_is_not_scanned(self, tmp_path, monkeypatch):
+        def fail(path):
+            raise AssertionError(f"unexpected scandir of {path}")
+
+        monkeypatch.setattr(os, "scandir", fail)
+        path = str(tmp_path / "a.wav")
+        exists_cache = {}
+        DatabaseManager._scan_existence({str(tmp_path): [path, path]}, exists_cache)
+        assert exists_cache == {}
+
+    def test_internal_cursor_reads_tuple_rows(self, manager, cursor, registered_video):
+        cursor.connection.commit()
+        video = _fresh_copy(registered_video)
+        manager.set_video_status(video)
+        for phase in manager.video_phases:
+            assert video.status[phase] == StageStatus.PENDING
+
+
+class TestUpdateVideo:
+    def _row(self, cursor, video):
+        cursor.execute("select * from videos where sha256 = ?", (video.sha256,))
+        return cursor.fetchone()
+
+    def test_unset_phases_keep_stored_values(self, manager, cursor, registered_video):
+        registered_video.status[PiplinePhase.EXTRACT_AUDIO] = StageStatus.SUCCESS
+        registered_video.by_products[PiplinePhase.EXTRACT_AUDIO] = "a.wav"
+        manager.update_video(registered_video, cursor)
+
+        video = _fresh_copy(registered_video)
+        video.status[PiplinePhase.DENOISE_AUDIO] = StageStatus.FAILED
+        manager.update_video(video, cursor)
+
+        row = self._row(cursor, video)
+        assert row["extracted_audio_status"] == StageStatus.SUCCESS.value
+        assert row["extracted_audio_path"] == "a.wav"
+        assert row["denoised_audio_status"] == StageStatus.FAILED.value
+
+    def test_shared_path_column_takes_translated_path(
+        self, manager, cursor, registered_video
+    ):
+        registered_video.by_products[PiplinePhase.TRANSLATE_SUBTITLE] = "zh.srt"
+        manager.update_video(registered_video, cursor)
+        assert (
+            self._row(cursor, registered_video)["bilingual_subtitle_path"] == "zh.srt"
+        )
+
+
+class TestSetVideoStatusBatch:
+    @pytest.fixture
+    def videos(self, manager, cursor, sha256, tmp_path):
+        videos = [
+            Video(
+                sha256=f"{sha256[:-3]}{i:03d}",
+                filename=f"part{i}",
+                suffix="mp4",
+                absolute_path=str(tmp_path / f"part{i}.mp4"),
+            )
+            for i in range(3)
+        ]
+        manager.register_movie(Movie(code="ABC-123", videos=videos), cursor)
+        by_product = tmp_path / "part0.wav"
+        by_product.touch()
+        videos[0].status[PiplinePhase.EXTRACT_AUDIO] = StageStatus.SUCCESS
+        videos[0].by_products[PiplinePhase.EXTRACT_AUDIO] = str(by_product)
+        manager.update_video(videos[0], cursor)
+        return videos
+
+    @pytest.mark.parametrize("in_limit", [500, 1])
+    def test_matches_single_video_status(
+        self, manager, cursor, videos, sample_video, monkeypatch, in_limit
+    ):
+        monkeypatch.setattr(
+            "aurora.services.pipeline.database_manager.BATCH_IN_LIMIT", in_limit
+        )
+        batch = [_fresh_copy(video) for video in videos] + [sample_video]
+        manager.set_video_status_batch(batch, cursor)
+
+        for batched, video in zip(batch, videos):
+            expected = _fresh_copy(video)
+            manager.set_video_status(expected, cursor)
+            assert batched.status == expected.status
+            assert batched.by_products == expected.by_products
+        assert batch[0].status[PiplinePhase.EXTRACT_AUDIO] == StageStatus.SUCCESS
+        assert sample_video.status == {}
+
+
+class TestUpdateMovie:
+    def test_core_fields_are_written(self, manager, cursor):
+        movie = Movie(code="ABC-123")
+        manager.register_movie(movie, cursor)
+        movie.metadata = Metadata(
+            title=BilingualText(original="題名", translated="标题"),
+            release_date="2024-01-01",
+            studio=BilingualText(original="メーカー"),
+        )
+        manager.update_movie(movie, cursor)
+
+        cursor.execute("select * from movies where code = ?", (movie.code,))
+        row = dict(cursor.fetchone())
+        assert row == {
+            "code": "ABC-123",
+            "title_ja": "題名",
+            "title_zh": "标题",
+            "release_date": "2024-01-01",
+            "director_ja": None,
+            "studio_ja": "メーカー",
+            "synopsis_ja": None,
+            "synopsis_zh": None,
+        }
+
+    def test_missing_metadata_clears_fields(self, manager, cursor):
+        movie = Movie(
+            code="ABC-123",
+            metadata=Metadata(title=BilingualText(original="題名")),
+        )
+        manager.update_movie_for_test(movie, cursor)
+        movie.metadata = None
+        manager.update_movie(movie, cursor)
+
+        cursor.execute("select title_ja from movies where code = ?", (movie.code,))
+        assert cursor.fetchone()[0] is None
+
+
+class TestGetEntity:
+    @pytest.fixture
+    def movie_with_director(self, manager, cursor):
+        movie = Movie(
+            code="ABC-123",
+            metadata=Metadata(
+                director=BilingualText(original="監督", translated="导演甲")
+            ),
+        )
+        manager.update_movie_for_test(movie, cursor)
+        return movie
+
+    def test_translation_is_cached(self, manager, cursor, movie_with_director):
+        assert manager.get_entity(MetadataType.DIRECTOR, "監督", cursor) == "导演甲"
+        cursor.execute("update directors set name_zh = '导演乙'")
+        assert manager.get_entity(MetadataType.DIRECTOR, "監督", cursor) == "导演甲"
+
+    def test_update_movie_invalidates_cache(self, manager, cursor, movie_with_director):
+        assert manager.get_entity(MetadataType.DIRECTOR, "監督", cursor) == "导演甲"
+        movie_with_director.metadata.director.translated = "导演乙"
+        manager.update_movie(movie_with_director, cursor)
+        assert manager.get_entity(MetadataType.DIRECTOR, "監督", cursor) == "导演乙"
+
+    def test_missing_translation_is_not_cached(self, manager, cursor):
+        assert manager.get_entity(MetadataType.STUDIO, "メーカー", cursor) is None
+        assert not manager._entity_cache
@@ -0,0 +1,283 @@
+import contextvars
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from aurora.domain.results import ChatResult
+from aurora.services.transcription import quality_checker
+from aurora.services.transcription.quality_checker import QualityChecker
+
+_TRACE = contextvars.ContextVar("trace", default=None)
+
+SRT = """1
+00:00:01,000 --> 00:00:02,500
+えっと
+
+2
+00:00:04,000 --> 00:00:05,250
+うん
+はい
+
+3
+01:02:03,004 --> 01:02:04,000
+あの
+"""
+
+
+@pytest.fixture
+def checker():
+    return QualityChecker(check_provider=None, interval=10)
+
+
+class TestParseSrtTimestamps:
+    def test_parses_every_block(self, checker):
+        assert checker._parse_srt_timestamps(SRT).tolist() == [
+            [1.0, 2.5],
+            [4.0, 5.25],
+            [3723.004, 3724.0],
+        ]
+
+    def test_accepts_crlf_and_missing_milliseconds(self, checker):
+        srt = "1\r\n00:00:01 --> 00:00:02.5\r\ntext\r\n"
+        assert checker._parse_srt_timestamps(srt).tolist() == [[1.0, 2.005]]
+
+    def test_ignores_text_without_blocks(self, checker):
+        assert checker._parse_srt_timestamps("hello\nworld").shape == (0, 2)
+
+
+class TestFormatQualityCheck:
+    def test_valid_srt(self, checker):
+        assert checker._format_quality_check(SRT)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "   \n",
+            "1\nno timestamps here\n",
+            "00:00:01,000 --> 00:00:02,000\ntext without sequence\n",
+        ],
+    )
+    def test_invalid_srt(self, checker, text):
+        assert not checker._format_quality_check(text)
+
+    def test_missing_arrow_skips_regex(self, checker, mocker):
+        regex = mocker.patch.object(quality_checker, "_SRT_BLOCK_RE")
+        assert not checker._format_quality_check("1\nline\n" * 1000)
+        regex.search.assert_not_called()
+
+
+class TestRuleQualityCheck:
+    def test_gap_within_interval(self, checker):
+        assert checker._rule_quality_check(SRT.split("\n3\n")[0])
+
+    def test_gap_exceeds_interval(self, checker):
+        assert not checker._rule_quality_check(SRT)
+
+    def test_overlapping_entries_have_no_gap(self, checker):
+        srt = "1\n00:00:01,000 --> 00:00:05,000\na\n\n2\n00:00:02,000 --> 00:00:03,000\nb\n"
+        assert checker._rule_quality_check(srt)
+
+
+def _make_srt(count: int) -> str:
+    return "".join(
+        f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\nline {i}\n\n"
+        for i in range(1, count + 1)
+    )
+
+
+class TestSampleText:
+    def test_short_text_is_sent_whole(self, checker):
+        text = _make_srt(5)
+        assert checker._sample_text(text, checker._parse_srt(text)) == text
+
+    def test_long_text_keeps_head_and_tail(self, checker, monkeypatch):
+        monkeypatch.setattr(quality_checker, "LLM_SAMPLE_HEAD", 2)
+        monkeypatch.setattr(quality_checker, "LLM_SAMPLE_TAIL", 1)
+        text = _make_srt(6)
+        sample = checker._sample_text(text, checker._parse_srt(text))
+        assert checker._parse_srt_timestamps(sample)[:, 0].tolist() == [1, 2, 6]
+        assert "line 3" not in sample
+
+
+class TestQualityCheck:
+    def test_parses_once_and_sends_sample_to_llm(self, checker, mocker):
+        parse = mocker.spy(QualityChecker, "_parse_srt")
+        llm = mocker.patch.object(checker, "_llm_quality_check", return_value=True)
+        text = _make_srt(50)
+
+        assert checker.quality_check(text, context=None)
+        assert parse.call_count == 1
+        sample = llm.call_args.args[0]
+        assert len(checker._parse_srt(sample).block_starts) == 40
+
+    def test_format_failure_skips_llm(self, checker, mocker):
+        llm = mocker.patch.object(checker, "_llm_quality_check")
+        assert not checker.quality_check("garbage", context=None)
+        llm.assert_not_called()
+
+
+class TestSystemPrompt:
+    def test_minified_by_default(self, checker):
+        system = checker._check_messages("text")[0]["content"]
+        assert system == quality_checker.LLM_CHECK_SYSTEM_PROMPT_MINIFIED
+        assert len(system) < len(quality_checker.LLM_CHECK_SYSTEM_PROMPT)
+        assert "**" not in system and "\n\n" not in system
+        assert '{"qualified": true}' in system
+
+    def test_user_message_is_compact_json(self, checker):
+        user = checker._check_messages("えっと\n")[1]["content"]
+        assert user == '{"info":"这是一个成人影片的视频字幕","text":"えっと\\n"}'
+        assert json.loads(user)["text"] == "えっと\n"
+
+    def test_full_prompt_when_disabled(self):
+        checker = QualityChecker(None, interval=10, minified_prompt=False)
+        system = checker._check_messages("text")[0]["content"]
+        assert system == quality_checker.LLM_CHECK_SYSTEM_PROMPT
+
+
+class TestLlmCheckCache:
+    @pytest.fixture
+    def provider(self):
+        provider = Mock()
+        provider.chat.return_value = ChatResult(
+            success=True,
+            attempt_count=1,
+            time_taken=10,
+            content='{"qualified": false, "reason": "garbage"}',
+        )
+        return provider
+
+    @pytest.fixture
+    def context(self):
+        return Mock(langfuse_session_id="session", movie_code="ABC-123")
+
+    def test_repeated_check_hits_cache(self, provider, context):
+        checker = QualityChecker(provider, interval=10, cache={})
+        assert not checker._llm_quality_check(SRT, context)
+        assert not checker._llm_quality_check(SRT, context)
+        provider.chat.assert_called_once()
+
+    def test_expired_entry_is_ignored(self, provider, context, monkeypatch):
+        cache = {}
+        checker = QualityChecker(provider, interval=10, cache=cache)
+        checker._llm_quality_check(SRT, context)
+        monkeypatch.setattr(quality_checker, "LLM_CACHE_TTL", -1)
+        checker._llm_quality_check(SRT, context)
+        assert provider.chat.call_count == 2
+
+    def test_failed_call_is_not_cached(self, provider, context):
+        provider.chat.return_value = ChatResult(
+            success=False, attempt_count=3, time_taken=10, content=None
+        )
+        cache = {}
+        checker = QualityChecker(provider, interval=10, cache=cache)
+        assert checker._llm_quality_check(SRT, context)
+        assert cache == {}
+
+
+class TestLlmCheckJsonRetry:
+    @pytest.fixture
+    def context(self):
+        return Mock(langfuse_session_id="session", movie_code="ABC-123")
+
+    def _reply(self, content):
+        return ChatResult(success=True, attempt_count=1, time_taken=10, content=content)
+
+    def test_invalid_json_is_repaired(self, context):
+        provider = Mock()
+        provider.chat.side_effect = [
+            self._reply("qualified: no"),
+            self._reply('{"qualified": false}'),
+        ]
+        cache = {}
+        checker = QualityChecker(provider, interval=10, cache=cache)
+
+        assert not checker._llm_quality_check(SRT, context)
+        assert provider.chat.call_count == 2
+        repair = provider.chat.call_args.args[0][-2:]
+        assert repair[0] == {"role": "assistant", "content": "qualified: no"}
+        assert "qualified: no" in repair[1]["content"]
+        assert list(cache.values())[0][1] is False
+
+    def test_gives_up_after_max_attempts(self, context):
+        provider = Mock()
+        provider.chat.return_value = self._reply("not json")
+        cache = {}
+        checker = QualityChecker(provider, interval=10, cache=cache)
+
+        assert checker._llm_quality_check(SRT, context)
+        assert provider.chat.call_count == quality_checker.LLM_JSON_ATTEMPTS
+        assert cache == {}
+
+
+class TestQualityCheckStream:
+    @pytest.fixture(autouse=True)
+    def small_sample(self, monkeypatch):
+        monkeypatch.setattr(quality_checker, "LLM_SAMPLE_HEAD", 2)
+        monkeypatch.setattr(quality_checker, "LLM_SAMPLE_TAIL", 1)
+
+    def _blocks(self, count, consumed, head_checked=None):
+        for i in range(1, count + 1):
+            if head_checked is not None and i > 2:
+                head_checked.wait(1)
+            consumed.append(i)
+            yield f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\nline {i}\n\n"
+
+    def test_checks_head_then_tail(self, checker, mocker):
+        llm = mocker.patch.object(checker, "_llm_quality_check", return_value=True)
+        consumed = []
+
+        passed, text = checker.quality_check_stream(
+            self._blocks(5, consumed), context=None
+        )
+
+        assert passed
+        assert text == _make_srt(5)
+        assert [call.args[0] for call in llm.call_args_list] == [
+            _make_srt(2),
+            "5\n00:00:05,000 --> 00:00:05,500\nline 5\n\n",
+        ]
+
+    def test_failed_head_stops_consuming(self, checker, mocker):
+        head_checked = threading.Event()
+
+        def reject(text, context):
+            head_checked.set()
+            return False
+
+        mocker.patch.object(checker, "_llm_quality_check", side_effect=reject)
+        consumed = []
+
+        passed, text = checker.quality_check_stream(
+            self._blocks(500, consumed, head_checked), context=None
+        )
+
+        assert not passed
+        assert len(consumed) < 500
+        assert text == _make_srt(len(consumed))
+
+    def test_head_check_keeps_caller_context(self, checker, mocker):
+        seen = []
+        mocker.patch.object(
+            checker,
+            "_llm_quality_check",
+            side_effect=lambda text, context: seen.append(_TRACE.get()) or True,
+        )
+        token = _TRACE.set("trace-1")
+        try:
+            checker.quality_check_stream(self._blocks(5, []), context=None)
+        finally:
+            _TRACE.reset(token)
+
+        assert seen[0] == "trace-1"
+
+    def test_short_stream_uses_single_check(self, checker, mocker):
+        llm = mocker.patch.object(checker, "_llm_quality_check", return_value=True)
+
+        passed, text = checker.quality_check_stream(iter([_make_srt(1)]), context=None)
+
+        assert passed
+        llm.assert_called_once_with(_make_srt(1), None)
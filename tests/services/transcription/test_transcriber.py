@@ -0,0 +1,173 @@
+from types import SimpleNamespace
+
+import pytest
+
+from aurora.services.transcription import transcriber as transcriber_module
+from aurora.services.transcription.transcriber import WhisperTranscriber
+
+
+@pytest.fixture
+def transcriber(mocker):
+    transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+    transcriber.language = "ja"
+    transcriber.beam_size = 6
+    transcriber.vad_filter = True
+    transcriber.batch_size = 1
+    transcriber.model = mocker.Mock()
+    transcriber.pipeline = None
+    return transcriber
+
+
+class TestFormatTimeSrt:
+    @pytest.mark.parametrize(
+        "seconds, expected",
+        [
+            (0, "00:00:00,000"),
+            (1.001, "00:00:01,001"),
+            (59.9996, "00:01:00,000"),
+            (3723.004, "01:02:03,004"),
+        ],
+    )
+    def test_format(self, seconds, expected):
+        assert WhisperTranscriber._format_time_srt(seconds) == expected
+
+
+class TestTranscribe:
+    def test_builds_srt_blocks(self, transcriber, tmp_path):
+        audio = tmp_path / "audio.wav"
+        audio.touch()
+        transcriber.model.transcribe.return_value = (
+            iter(
+                [
+                    SimpleNamespace(start=1.0, end=2.5, text=" えっと "),
+                    SimpleNamespace(start=4.0, end=5.25, text="うん"),
+                ]
+            ),
+            None,
+        )
+
+        assert transcriber.transcribe(str(audio)) == (
+            "1\n00:00:01,000 --> 00:00:02,500\nえっと\n\n"
+            "2\n00:00:04,000 --> 00:00:05,250\nうん\n\n"
+        )
+
+    def test_missing_file_raises(self, transcriber, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            transcriber.transcribe(str(tmp_path / "missing.wav"))
+
+
+class TestIterSrtBlocks:
+    def test_decoding_stops_when_consumer_stops(self, transcriber, tmp_path):
+        audio = tmp_path / "audio.wav"
+        audio.touch()
+        decoded = []
+
+        def segments():
+            for i in range(100):
+                decoded.append(i)
+                yield SimpleNamespace(start=i, end=i + 0.5, text=f"line {i}")
+
+        transcriber.model.transcribe.return_value = (segments(), None)
+
+        blocks = transcriber.iter_srt_blocks(str(audio))
+        assert next(blocks) == "1\n00:00:00,000 --> 00:00:00,500\nline 0\n\n"
+        blocks.close()
+        assert decoded == [0]
+
+
+class TestLoadWhisperModel:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        transcriber_module._load_whisper_model.cache_clear()
+        yield
+        transcriber_module._load_whisper_model.cache_clear()
+
+    def test_same_config_shares_model(self, mocker):
+        whisper_model = mocker.patch.object(transcriber_module, "WhisperModel")
+
+        first = WhisperTranscriber(model_size="small", device="cpu")
+        second = WhisperTranscriber(model_size="small", device="cpu", language="en")
+
+        assert first.model is second.model
+        whisper_model.assert_called_once_with(
+            "small",
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=transcriber_module.CPU_THREADS,
+            num_workers=transcriber_module.CPU_NUM_WORKERS,
+        )
+
+    def test_falls_back_to_cpu(self, mocker):
+        fallback = mocker.Mock()
+        whisper_model = mocker.patch.object(
+            transcriber_module,
+            "WhisperModel",
+            side_effect=[RuntimeError("no cuda"), fallback],
+        )
+
+        assert WhisperTranscriber(model_size="small").model is fallback
+        assert WhisperTranscriber(model_size="small").model is fallback
+        assert whisper_model.call_count == 2
+        whisper_model.assert_called_with(
+            "small",
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=transcriber_module.CPU_THREADS,
+            num_workers=transcriber_module.CPU_NUM_WORKERS,
+        )
+
+    @pytest.mark.parametrize(
+        "kwargs, compute_type",
+        [
+            ({"device": "cuda"}, "int8_float16"),
+            ({"device": "cuda", "high_precision": True}, "float16"),
+            ({"device": "cpu", "high_precision": True}, "float32"),
+            ({"device": "cuda", "compute_type": "float32"}, "float32"),
+        ],
+    )
+    def test_compute_type_by_device(self, mocker, kwargs, compute_type):
+        whisper_model = mocker.patch.object(transcriber_module, "WhisperModel")
+
+        WhisperTranscriber(model_size="small", **kwargs)
+
+        assert whisper_model.call_args.kwargs["compute_type"] == compute_type
+
+
+class TestBatchedInference:
+    @pytest.fixture(autouse=True)
+    def whisper_model(self, mocker):
+        transcriber_module._load_whisper_model.cache_clear()
+        yield mocker.patch.object(transcriber_module, "WhisperModel")
+        transcriber_module._load_whisper_model.cache_clear()
+
+    @pytest.fixture
+    def audio(self, tmp_path):
+        audio = tmp_path / "audio.wav"
+        audio.touch()
+        return str(audio)
+
+    def test_uses_batched_pipeline(self, mocker, audio):
+        pipeline = mocker.patch.object(transcriber_module, "BatchedInferencePipeline")
+        pipeline.return_value.transcribe.return_value = (iter([]), None)
+
+        transcriber = WhisperTranscriber(batch_size=8)
+        transcriber.transcribe(audio)
+
+        pipeline.assert_called_once_with(model=transcriber.model)
+        pipeline.return_value.transcribe.assert_called_once_with(
+            audio, batch_size=8, beam_size=6, vad_filter=True, language="ja"
+        )
+        transcriber.model.transcribe.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"batch_size": 1}, {"batch_size": 16, "vad_filter": False}]
+    )
+    def test_sequential_without_batching_or_vad(self, mocker, audio, kwargs):
+        pipeline = mocker.patch.object(transcriber_module, "BatchedInferencePipeline")
+
+        transcriber = WhisperTranscriber(**kwargs)
+        transcriber.model.transcribe.return_value = (iter([]), None)
+        transcriber.transcribe(audio)
+
+        pipeline.assert_not_called()
+        transcriber.model.transcribe.assert_called_once()
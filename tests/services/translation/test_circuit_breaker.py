@@ -0,0 +1,74 @@
+import pytest
+
+from aurora.services.translation import circuit_breaker as circuit_breaker_module
+from aurora.services.translation.circuit_breaker import CircuitBreaker, CircuitState
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [100.0]
+    mocker.patch.object(
+        circuit_breaker_module.time, "monotonic", side_effect=lambda: now[0]
+    )
+    return now
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        failure_threshold=3, success_threshold=2, open_ms=1000, half_open_requests=2
+    )
+
+
+def _open(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.on_failure()
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, breaker):
+        breaker.on_failure()
+        breaker.on_failure()
+        breaker.on_success()
+        breaker.on_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        _open(breaker)
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_half_open_after_open_ms(self, breaker, clock):
+        _open(breaker)
+        clock[0] += 0.999
+        assert breaker.state is CircuitState.OPEN
+        clock[0] += 0.001
+        assert breaker.state is CircuitState.HALF_OPEN
+
+    def test_half_open_limits_probes_and_closes(self, breaker, clock):
+        _open(breaker)
+        clock[0] += 1
+
+        assert breaker.allow_request()
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.on_success()
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.on_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        _open(breaker)
+        clock[0] += 1
+        assert breaker.allow_request()
+
+        breaker.on_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        clock[0] += 1
+        assert breaker.state is CircuitState.HALF_OPEN
+
+    def test_trip_opens_immediately(self, breaker):
+        breaker.trip()
+        assert breaker.state is CircuitState.OPEN
@@ -0,0 +1,330 @@
+import threading
+import time
+
+import pytest
+import yaml
+
+from aurora.domain.enums import TaskType
+from aurora.domain.results import ProcessResult
+from aurora.services.translation.orchestrator import TaskConfig, TranslateOrchestrator
+from aurora.services.translation.strategies import SimpleMetaDataStrategy
+
+
+def _result(success, content="ok"):
+    return ProcessResult(
+        task_type=TaskType.METADATA_TITLE,
+        success=success,
+        content=content if success else None,
+        attempt_count=1,
+        time_taken=1,
+    )
+
+
+@pytest.fixture
+def providers(mocker):
+    return [mocker.Mock(model=f"model-{i}") for i in range(3)]
+
+
+def _orchestrator(providers, hedge_ms):
+    return TranslateOrchestrator(
+        {TaskType.METADATA_TITLE: TaskConfig(providers=providers, hedge_ms=hedge_ms)}
+    )
+
+
+def _patch_strategy(mocker, orchestrator, process):
+    strategy = mocker.Mock()
+    strategy.process.side_effect = process
+    mocker.patch.object(orchestrator, "_select_strategy", return_value=strategy)
+    return strategy
+
+
+class TestHedgedProviders:
+    def test_slow_provider_is_hedged(self, mocker, providers):
+        release = threading.Event()
+
+        def process(provider, context):
+            if provider is providers[0]:
+                release.wait(5)
+                return _result(True, "slow")
+            return _result(True, "fast")
+
+        orchestrator = _orchestrator(providers, hedge_ms=10)
+        strategy = _patch_strategy(mocker, orchestrator, process)
+
+        started = time.monotonic()
+        result = orchestrator.translate_title("タイトル")
+        release.set()
+
+        assert result.content == "fast"
+        assert time.monotonic() - started < 1
+        assert strategy.process.call_count == 2
+
+    def test_failure_moves_to_next_provider_without_delay(self, mocker, providers):
+        def process(provider, context):
+            return _result(provider is providers[2], "third")
+
+        orchestrator = _orchestrator(providers, hedge_ms=60_000)
+        _patch_strategy(mocker, orchestrator, process)
+
+        assert orchestrator.translate_title("タイトル").content == "third"
+
+    def test_all_failed(self, mocker, providers):
+        orchestrator = _orchestrator(providers, hedge_ms=10)
+        strategy = _patch_strategy(mocker, orchestrator, lambda p, c: _result(False))
+
+        assert not orchestrator.translate_title("タイトル").success
+        assert strategy.process.call_count == 3
+
+    def test_without_hedge_providers_run_in_order(self, mocker, providers):
+        calls = []
+
+        def process(provider, context):
+            calls.append(provider)
+            return _result(provider is providers[1])
+
+        orchestrator = _orchestrator(providers, hedge_ms=None)
+        _patch_strategy(mocker, orchestrator, process)
+
+        assert orchestrator.translate_title("タイトル").success
+        assert calls == providers[:2]
+
+    def test_max_parallel_caps_in_flight_requests(self, mocker, providers):
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def process(provider, context):
+            with lock:
+                active.append(provider)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(provider)
+            return _result(provider is providers[2], "third")
+
+        orchestrator = TranslateOrchestrator(
+            {
+                TaskType.METADATA_TITLE: TaskConfig(
+                    providers=providers, hedge_ms=0, max_parallel=2
+                )
+            }
+        )
+        strategy = _patch_strategy(mocker, orchestrator, process)
+
+        assert orchestrator.translate_title("タイトル").content == "third"
+        assert strategy.process.call_count == 3
+        assert max(peak) == 2
+
+
+class TestFromConfig:
+    def test_hedging_is_opt_in(self, mocker):
+        mocker.patch(
+            "aurora.services.translation.orchestrator.Provider.from_config",
+            return_value=mocker.Mock(),
+        )
+        config = {
+            "config": {
+                "title": {"providers": [{}]},
+                "subtitle": {"providers": [{}]},
+                "actor": {"providers": [{}], "hedge_ms": 500, "max_parallel": 2},
+            }
+        }
+        task_configs = TranslateOrchestrator.from_config(config).task_configs
+
+        assert task_configs[TaskType.METADATA_TITLE].hedge_ms is None
+        assert task_configs[TaskType.TRANSLATE_SUBTITLE].hedge_ms is None
+        assert task_configs[TaskType.METADATA_ACTOR].hedge_ms == 500
+        assert task_configs[TaskType.METADATA_ACTOR].max_parallel == 2
+        assert task_configs[TaskType.METADATA_TITLE].max_parallel is None
+
+    def test_providers_are_created_on_first_use(self, mocker):
+        from_config = mocker.patch(
+            "aurora.services.translation.orchestrator.Provider.from_config",
+            return_value=mocker.Mock(model="model"),
+        )
+        config = {
+            "config": {
+                "actor": {"providers": [{"model": "a"}, {"model": "b"}]},
+                "subtitle": {"providers": [{"model": "c"}]},
+            }
+        }
+        orchestrator = TranslateOrchestrator.from_config(config)
+        from_config.assert_not_called()
+        _patch_strategy(mocker, orchestrator, lambda p, c: _result(True))
+
+        orchestrator.translate_generic_metadata(TaskType.METADATA_ACTOR, "a")
+        orchestrator.translate_generic_metadata(TaskType.METADATA_ACTOR, "b")
+
+        assert [call.args[0] for call in from_config.call_args_list] == [
+            {"model": "a"},
+            {"model": "b"},
+        ]
+        actor_config = orchestrator.task_configs[TaskType.METADATA_ACTOR]
+        assert len(actor_config.providers) == 2
+
+    def test_from_config_yaml(self, mocker, tmp_path):
+        mocker.patch(
+            "aurora.services.translation.orchestrator.Provider.from_config",
+            return_value=mocker.Mock(),
+        )
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            "translate_orchestrator:\n"
+            "  config:\n"
+            "    actor:\n"
+            "      providers: [{}]\n"
+            "      hedge_ms: 500\n",
+            encoding="utf-8",
+        )
+
+        task_configs = TranslateOrchestrator.from_config_yaml(str(path)).task_configs
+
+        assert task_configs[TaskType.METADATA_ACTOR].hedge_ms == 500
+
+    def test_unchanged_yaml_is_parsed_once(self, mocker, tmp_path):
+        mocker.patch(
+            "aurora.services.translation.orchestrator.Provider.from_config",
+            return_value=mocker.Mock(),
+        )
+        load = mocker.spy(yaml, "load")
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            "translate_orchestrator: {config: {actor: {hedge_ms: 500}}}",
+            encoding="utf-8",
+        )
+
+        TranslateOrchestrator.from_config_yaml(str(path))
+        TranslateOrchestrator.from_config_yaml(str(path))
+        assert load.call_count == 1
+
+        path.write_text(
+            "translate_orchestrator: {config: {actor: {hedge_ms: 1500}}}",
+            encoding="utf-8",
+        )
+        task_configs = TranslateOrchestrator.from_config_yaml(str(path)).task_configs
+        assert load.call_count == 2
+        assert task_configs[TaskType.METADATA_ACTOR].hedge_ms == 1500
+
+
+class TestResultCache:
+    def test_repeated_metadata_hits_cache(self, mocker, providers):
+        orchestrator = _orchestrator(providers, hedge_ms=None)
+        strategy = _patch_strategy(mocker, orchestrator, lambda p, c: _result(True))
+
+        first = orchestrator.translate_title("タイトル", actress=[{"name": "a"}])
+        second = orchestrator.translate_title("タイトル", actress=[{"name": "a"}])
+        orchestrator.translate_title("タイトル", actress=[{"name": "b"}])
+
+        assert first.content == second.content == "ok"
+        assert second.attempt_count == 0
+        assert strategy.process.call_count == 2
+
+    def test_failures_are_not_cached(self, mocker, providers):
+        orchestrator = _orchestrator(providers, hedge_ms=None)
+        strategy = _patch_strategy(mocker, orchestrator, lambda p, c: _result(False))
+
+        orchestrator.translate_title("タイトル")
+        orchestrator.translate_title("タイトル")
+
+        assert strategy.process.call_count == 6
+        assert orchestrator.result_cache == {}
+
+    def test_subtitles_are_not_cached(self, mocker, providers):
+        cache = {}
+        orchestrator = TranslateOrchestrator(
+            {TaskType.TRANSLATE_SUBTITLE: TaskConfig(providers=providers)},
+            result_cache=cache,
+        )
+        strategy = _patch_strategy(mocker, orchestrator, lambda p, c: _result(True))
+
+        orchestrator.translate_subtitle("1\n", metadata={})
+        orchestrator.translate_subtitle("1\n", metadata={})
+
+        assert strategy.process.call_count == 2
+        assert cache == {}
+
+
+class TestMetadataBatch:
+    @pytest.fixture
+    def orchestrator(self, providers):
+        return TranslateOrchestrator(
+            {TaskType.METADATA_ACTOR: TaskConfig(providers=providers)}
+        )
+
+    @pytest.fixture
+    def strategy(self, mocker, orchestrator):
+        strategy = mocker.Mock(spec=SimpleMetaDataStrategy)
+        strategy.process.side_effect = lambda p, c: _result(True, c.text_to_process)
+        mocker.patch.object(orchestrator, "_select_strategy", return_value=strategy)
+        return strategy
+
+    def test_distinct_texts_share_one_request(self, orchestrator, strategy):
+        strategy.process_batch.side_effect = lambda p, t, texts: [
+            _result(True, text.upper()) for text in texts
+        ]
+
+        results = orchestrator.translate_metadata_batch(
+            TaskType.METADATA_ACTOR, ["a", "b", "a"]
+        )
+
+        assert [r.content for r in results] == ["A", "B", "A"]
+        strategy.process_batch.assert_called_once()
+        assert strategy.process_batch.call_args.args[2] == ["a", "b"]
+        strategy.process.assert_not_called()
+
+        again = orchestrator.translate_metadata_batch(TaskType.METADATA_ACTOR, ["b"])
+        assert again[0].content == "B" and again[0].attempt_count == 0
+        strategy.process_batch.assert_called_once()
+
+    def test_malformed_batch_falls_back_to_single_requests(
+        self, orchestrator, strategy
+    ):
+        strategy.process_batch.return_value = None
+
+        results = orchestrator.translate_metadata_batch(
+            TaskType.METADATA_ACTOR, ["a", "b", "a"]
+        )
+
+        assert [r.content for r in results] == ["a", "b", "a"]
+        assert strategy.process_batch.call_count == 3
+        assert strategy.process.call_count == 2
+
+    def test_batch_only_mode_skips_single_requests(self, orchestrator, strategy):
+        strategy.process_batch.return_value = None
+
+        results = orchestrator.translate_metadata_batch(
+            TaskType.METADATA_ACTOR, ["a", "b"], fallback=False
+        )
+
+        assert [r.success for r in results] == [False, False]
+        strategy.process.assert_not_called()
+
+    def test_single_text_skips_batch(self, orchestrator, strategy):
+        results = orchestrator.translate_metadata_batch(
+            TaskType.METADATA_ACTOR, ["a", " "]
+        )
+
+        assert [r.content for r in results] == ["a", " "]
+        strategy.process_batch.assert_not_called()
+
+
+class TestSelectStrategy:
+    def test_strategy_is_reused_per_task_and_stream(self, providers):
+        task_config = TaskConfig(providers=providers, strategy={"size": 300})
+        orchestrator = TranslateOrchestrator(
+            {TaskType.CORRECT_SUBTITLE: task_config}, streaming_models=["model-1"]
+        )
+
+        first = orchestrator._select_strategy(
+            providers[0], TaskType.CORRECT_SUBTITLE, task_config
+        )
+        second = orchestrator._select_strategy(
+            providers[2], TaskType.CORRECT_SUBTITLE, task_config
+        )
+        streaming = orchestrator._select_strategy(
+            providers[1], TaskType.CORRECT_SUBTITLE, task_config
+        )
+
+        assert first is second
+        assert first.slice_size == 300 and not first.stream
+        assert streaming is not first and streaming.stream
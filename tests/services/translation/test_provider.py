@@ -0,0 +1,698 @@
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import httpx
+import openai as native_openai
+import pytest
+
+from aurora.domain.enums import ErrorType
+from aurora.services.translation import provider as provider_module
+from aurora.services.translation.circuit_breaker import CircuitBreaker
+from aurora.services.translation.provider import OpenaiProvider
+
+MESSAGES = [{"role": "user", "content": "こんにちは"}]
+
+
+def _status_error(status_code, headers=None, cls=native_openai.APIStatusError):
+    request = httpx.Request("POST", "https://example.com/v1/chat/completions")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return cls("error", response=response, body=None)
+
+
+def _completion(content="ok", finish_reason="stop"):
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=message, finish_reason=finish_reason)]
+    )
+
+
+@pytest.fixture
+def provider(mocker):
+    provider = OpenaiProvider("key", "https://example.com/v1", "test-model")
+    provider.client = mocker.Mock()
+    return provider
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch.object(provider_module.time, "sleep")
+
+
+class TestComputeBackoff:
+    def test_exponential_with_full_jitter(self, provider, mocker):
+        uniform = mocker.patch.object(
+            provider_module.random, "uniform", side_effect=lambda a, b: b
+        )
+        assert [provider._compute_backoff(n, None) for n in range(3)] == [1, 2, 4]
+        assert uniform.call_args.args == (0, 4)
+
+    def test_capped(self, provider, mocker):
+        mocker.patch.object(
+            provider_module.random, "uniform", side_effect=lambda a, b: b
+        )
+        assert provider._compute_backoff(10, None) == provider_module.RETRY_MAX_DELAY
+
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [
+            ({"retry-after-ms": "1500"}, 1.5),
+            ({"retry-after": "3"}, 3.0),
+            ({"retry-after-ms": "250", "retry-after": "3"}, 0.25),
+        ],
+    )
+    def test_honors_retry_after(self, provider, headers, expected):
+        err = _status_error(429, headers, native_openai.RateLimitError)
+        assert provider._compute_backoff(0, err) == expected
+
+    def test_ignores_unreasonable_retry_after(self, provider, mocker):
+        mocker.patch.object(provider_module.random, "uniform", return_value=0.5)
+        err = _status_error(429, {"retry-after": "3600"}, native_openai.RateLimitError)
+        assert provider._compute_backoff(0, err) == 0.5
+
+
+class TestChatRetry:
+    def test_rate_limit_waits_for_retry_after(self, provider, sleep):
+        provider.client.chat.completions.create.side_effect = [
+            _status_error(429, {"retry-after-ms": "200"}, native_openai.RateLimitError),
+            _completion(),
+        ]
+
+        result = provider.chat(MESSAGES)
+
+        assert result.success
+        assert result.attempt_count == 2
+        assert sleep.call_args_list[0].args == (0.2,)
+
+    def test_server_error_backs_off_exponentially(self, provider, sleep, mocker):
+        mocker.patch.object(
+            provider_module.random, "uniform", side_effect=lambda a, b: b
+        )
+        provider.client.chat.completions.create.side_effect = _status_error(503)
+
+        result = provider.chat(MESSAGES)
+
+        assert not result.success
+        assert result.error == ErrorType.OTHER
+        assert [call.args[0] for call in sleep.call_args_list] == [1, 2]
+
+
+class TestAchat:
+    def test_requests_run_concurrently(self, provider, mocker):
+        barrier = threading.Barrier(3, timeout=1)
+
+        def chat(messages, **kwargs):
+            barrier.wait()
+            return _completion(messages[0]["content"])
+
+        provider.client.chat.completions.create.side_effect = lambda **kw: chat(
+            kw["messages"]
+        )
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    provider.achat([{"role": "user", "content": str(i)}])
+                    for i in range(3)
+                )
+            )
+
+        results = asyncio.run(run())
+
+        assert [result.content for result in results] == ["0", "1", "2"]
+
+
+class TestHttpClient:
+    def test_instances_share_connection_pool(self):
+        first = OpenaiProvider("key", "https://example.com/v1", "model-a")
+        second = OpenaiProvider("key", "https://example.com/v1", "model-b", timeout=30)
+
+        assert first.client._client is provider_module._HTTP_CLIENT
+        assert second.client._client is provider_module._HTTP_CLIENT
+        assert second.client.timeout == 30
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def cached_provider(self, provider):
+        provider.cache = {}
+        return provider
+
+    def test_repeated_request_hits_cache(self, cached_provider):
+        create = cached_provider.client.chat.completions.create
+        create.return_value = _completion(" 你好 ")
+
+        first = cached_provider.chat(MESSAGES, temperature=0)
+        second = cached_provider.chat(MESSAGES, temperature=0)
+
+        create.assert_called_once()
+        assert first.content == second.content == "你好"
+        assert second.attempt_count == 0
+
+    def test_key_includes_request_parameters(self, cached_provider):
+        create = cached_provider.client.chat.completions.create
+        create.return_value = _completion()
+
+        cached_provider.chat(MESSAGES, temperature=0)
+        cached_provider.chat(MESSAGES, temperature=1)
+        cached_provider.chat(MESSAGES, temperature=0, stream=False)
+
+        assert create.call_count == 2
+
+    def test_key_ignores_transport_parameters(self, cached_provider):
+        create = cached_provider.client.chat.completions.create
+        create.return_value = _completion()
+
+        cached_provider.chat(MESSAGES, temperature=0, timeout=500)
+        second = cached_provider.chat(
+            MESSAGES, temperature=0, timeout=30, extra_headers={"X-Trace": "1"}
+        )
+
+        create.assert_called_once()
+        assert create.call_args.kwargs["timeout"] <= 500
+        assert second.attempt_count == 0
+
+    def test_key_ignores_dict_order(self, cached_provider):
+        first = cached_provider._response_cache_key(
+            [{"role": "user", "content": "えっと"}],
+            {"temperature": 0, "response_format": {"type": "json_object"}},
+        )
+        second = cached_provider._response_cache_key(
+            [{"content": "えっと", "role": "user"}],
+            {"response_format": {"type": "json_object"}, "temperature": 0},
+        )
+        assert first == second
+
+    def test_shared_prefix_is_hashed_once(self, cached_provider, mocker):
+        provider_module._prefix_message_digest.cache_clear()
+        dumps = mocker.spy(provider_module, "_dumps_sorted")
+        system = {"role": "system", "content": "翻译以下字幕"}
+
+        for text in ["えっと", "うん", "はい"]:
+            cached_provider._response_cache_key(
+                [system, {"role": "user", "content": text}], {}
+            )
+
+        # 系统消息 1 次 + 每条用户消息 1 次 + 每次的 kwargs 1 次
+        assert dumps.call_count == 1 + 3 + 3
+        # 只有前缀消息留在缓存里，用户消息不被长期持有
+        assert provider_module._prefix_message_digest.cache_info().currsize == 1
+
+    def test_key_separates_messages(self, cached_provider):
+        first = cached_provider._response_cache_key(
+            [{"role": "user", "content": "a"}, {"role": "user", "content": "b"}], {}
+        )
+        second = cached_provider._response_cache_key(
+            [{"role": "user", "content": "ab"}], {}
+        )
+        assert first != second
+
+    def test_truncated_response_is_not_cached(self, cached_provider):
+        create = cached_provider.client.chat.completions.create
+        create.return_value = _completion(finish_reason="length")
+
+        assert not cached_provider.chat(MESSAGES).success
+        assert cached_provider.cache == {}
+
+    def test_from_config_uses_cache_dir(self, mocker, tmp_path):
+        OpenaiProvider.clear_cache()
+        disk_cache = mocker.patch.object(provider_module, "DiskCache")
+        config = {
+            "model": "test-model",
+            "api_key": "key",
+            "base_url": "https://example.com/v1",
+            "cache_dir": str(tmp_path),
+        }
+
+        provider = OpenaiProvider.from_config(config)
+
+        disk_cache.assert_called_once_with(str(tmp_path))
+        assert provider.cache is disk_cache.return_value
+        OpenaiProvider.clear_cache()
+
+    def test_whitespace_variants_share_entry(self, cached_provider):
+        create = cached_provider.client.chat.completions.create
+        create.return_value = _completion()
+
+        cached_provider.chat([{"role": "user", "content": "1\nえっと\n"}])
+        cached_provider.chat([{"role": "user", "content": "1  \r\nえっと　\r\n\r\n"}])
+        cached_provider.chat([{"role": "user", "content": "1\nえ っと\n"}])
+
+        assert create.call_count == 2
+
+
+class TestCircuitBreaker:
+    @pytest.fixture
+    def breaker_provider(self, provider):
+        provider.breaker = CircuitBreaker(failure_threshold=2, open_ms=60000)
+        return provider
+
+    def test_open_circuit_fails_fast(self, breaker_provider, sleep):
+        create = breaker_provider.client.chat.completions.create
+        create.side_effect = _status_error(503)
+
+        first = breaker_provider.chat(MESSAGES)
+        second = breaker_provider.chat(MESSAGES)
+
+        assert first.attempt_count == 2
+        assert second.attempt_count == 0
+        assert create.call_count == 2
+        assert not breaker_provider.available
+
+    def test_client_errors_do_not_trip(self, breaker_provider):
+        create = breaker_provider.client.chat.completions.create
+        create.side_effect = _status_error(400)
+
+        for _ in range(3):
+            assert (
+                breaker_provider.chat(MESSAGES).error == ErrorType.UNPROCESSABLE_ENTITY
+            )
+
+        assert breaker_provider.available
+
+    def test_recovers_after_auth_error(self, breaker_provider, mocker):
+        create = breaker_provider.client.chat.completions.create
+        create.side_effect = [_status_error(401), _completion()]
+
+        assert breaker_provider.chat(MESSAGES).error == ErrorType.AUTHENTICATION_ERROR
+        assert not breaker_provider.available
+
+        breaker_provider.breaker.open_ms = 0
+        assert breaker_provider.available
+        assert breaker_provider.chat(MESSAGES).success
+
+
+def _completion_json(content="ok"):
+    return {
+        "id": "1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "test-model",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+    }
+
+
+def _use_transport(provider, handler):
+    """让 provider 通过 MockTransport 发送真实的 HTTP 请求，并挂上共享客户端的响应钩子。"""
+    provider.client = native_openai.OpenAI(
+        api_key="key",
+        base_url="https://example.com/v1",
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(handler),
+            event_hooks=provider_module._HTTP_CLIENT.event_hooks,
+        ),
+    )
+
+
+class TestRequestBody:
+    @pytest.fixture
+    def bodies(self):
+        return []
+
+    def _provider(self, bodies, model, base_url="https://example.com/v1"):
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json=_completion_json())
+
+        provider = OpenaiProvider("key", base_url, model)
+        _use_transport(provider, handler)
+        return provider
+
+    @pytest.mark.parametrize(
+        "model, base_url",
+        [
+            ("gemini-2.5-pro", "https://example.com/v1"),
+            ("z-ai/glm-4.6", "https://openrouter.ai/api/v1"),
+        ],
+    )
+    def test_safety_settings_for_google_routes(self, bodies, model, base_url):
+        provider = self._provider(bodies, model, base_url)
+
+        provider.chat(MESSAGES)
+        provider.chat(MESSAGES)
+
+        assert bodies[0]["safety_settings"] == bodies[1]["safety_settings"]
+        assert len(bodies[0]["safety_settings"]) == 4
+        assert isinstance(provider_module._SAFETY_SETTINGS["safety_settings"], tuple)
+
+    def test_no_safety_settings_for_other_models(self, bodies):
+        self._provider(bodies, "gpt-4o").chat(MESSAGES)
+        assert "safety_settings" not in bodies[0]
+
+    def test_caller_extra_body_is_merged(self, bodies):
+        provider = self._provider(bodies, "gemini-2.5-pro")
+
+        provider.chat(MESSAGES, extra_body={"reasoning": {"enabled": False}})
+
+        assert bodies[0]["reasoning"] == {"enabled": False}
+        assert "safety_settings" in bodies[0]
+
+    def test_system_prompt_marked_for_prompt_caching(self, bodies):
+        messages = [{"role": "system", "content": "rules"}, *MESSAGES]
+
+        self._provider(bodies, "anthropic/claude-sonnet-4").chat(messages)
+
+        assert bodies[0]["messages"][0]["content"] == [
+            {"type": "text", "text": "rules", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert bodies[0]["messages"][1:] == MESSAGES
+        assert messages[0]["content"] == "rules"
+
+    def test_no_cache_control_for_other_models(self, bodies):
+        messages = [{"role": "system", "content": "rules"}, *MESSAGES]
+
+        self._provider(bodies, "gpt-4o").chat(messages)
+
+        assert bodies[0]["messages"] == messages
+
+
+class TestRateLimitHeaders:
+    def test_response_headers_feed_limiter(self, provider, mocker):
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-reset-requests": "2s",
+                },
+                json=_completion_json(),
+            )
+
+        _use_transport(provider, handler)
+        update = mocker.spy(provider.limiter, "update")
+
+        assert provider.chat(MESSAGES).content == "ok"
+        assert update.call_args.args[0]["x-ratelimit-reset-requests"] == "2s"
+        sleep = mocker.patch.object(provider_module.time, "sleep")
+        provider.limiter.acquire()
+        assert sleep.call_args.args[0] == pytest.approx(2, abs=0.1)
+
+    def test_retry_after_pauses_other_requests(self, provider, sleep, mocker):
+        provider.client.chat.completions.create.side_effect = [
+            _status_error(429, {"retry-after": "5"}, native_openai.RateLimitError),
+            _completion(),
+        ]
+        block_for = mocker.spy(provider.limiter, "block_for")
+
+        assert provider.chat(MESSAGES).success
+        block_for.assert_called_once_with(5.0)
+
+
+class TestIdempotencyKey:
+    def _keys(self, create):
+        return [
+            call.kwargs["extra_headers"]["Idempotency-Key"]
+            for call in create.call_args_list
+        ]
+
+    def test_retries_reuse_key(self, provider, sleep):
+        create = provider.client.chat.completions.create
+        create.side_effect = [_status_error(503), _completion()]
+
+        provider.chat(MESSAGES)
+
+        first, retry = self._keys(create)
+        assert first == retry
+
+    def test_separate_calls_get_new_keys(self, provider):
+        create = provider.client.chat.completions.create
+        create.return_value = _completion()
+
+        provider.chat(MESSAGES)
+        provider.chat(MESSAGES)
+
+        first, second = self._keys(create)
+        assert first != second
+
+    def test_caller_headers_are_kept(self, provider):
+        create = provider.client.chat.completions.create
+        create.return_value = _completion()
+
+        provider.chat(MESSAGES, extra_headers={"X-Title": "aurora"})
+
+        headers = create.call_args.kwargs["extra_headers"]
+        assert headers["X-Title"] == "aurora"
+        assert "Idempotency-Key" in headers
+
+
+class TestTimeTaken:
+    def test_measured_with_monotonic_clock(self, provider, mocker):
+        clock = [50.0]
+        mocker.patch.object(
+            provider_module.time, "monotonic", side_effect=lambda: clock[0]
+        )
+        mocker.patch.object(provider_module.time, "time", return_value=0)
+
+        def create(**kwargs):
+            clock[0] += 1.5
+            return _completion()
+
+        provider.client.chat.completions.create.side_effect = create
+
+        assert provider.chat(MESSAGES).time_taken == 1500
+
+
+_REQUEST = httpx.Request("POST", "https://example.com/v1/chat/completions")
+
+
+class TestErrorPolicy:
+    @pytest.mark.parametrize(
+        "err, error, retryable, trip",
+        [
+            (_status_error(401), ErrorType.AUTHENTICATION_ERROR, False, True),
+            (_status_error(402), ErrorType.INSUFFICIENT_QUOTA, False, True),
+            (_status_error(404), ErrorType.NOT_FOUND, False, True),
+            (_status_error(413), ErrorType.PAYLOAD_TOO_LARGE, False, False),
+            (_status_error(408), ErrorType.TIMEOUT, True, False),
+            (_status_error(429), ErrorType.RATE_LIMIT, True, False),
+            (_status_error(502), ErrorType.OTHER, True, False),
+            (native_openai.APITimeoutError(_REQUEST), ErrorType.TIMEOUT, True, False),
+            (
+                native_openai.APIConnectionError(request=_REQUEST),
+                ErrorType.CONNECTION_ERROR,
+                True,
+                False,
+            ),
+            (ValueError("boom"), ErrorType.OTHER, True, False),
+        ],
+    )
+    def test_classification(self, err, error, retryable, trip):
+        policy = provider_module._classify_error(err)
+        assert (policy.error, policy.retryable, policy.trip) == (error, retryable, trip)
+
+    def test_quota_rate_limit_is_not_retried(self, provider, sleep):
+        create = provider.client.chat.completions.create
+        response = httpx.Response(429, request=_REQUEST)
+        create.side_effect = native_openai.RateLimitError(
+            "You exceeded your current quota", response=response, body=None
+        )
+
+        result = provider.chat(MESSAGES)
+
+        assert result.error == ErrorType.INSUFFICIENT_QUOTA
+        assert create.call_count == 1
+        assert not provider.available
+
+    def test_connection_error_is_retried(self, provider, sleep):
+        create = provider.client.chat.completions.create
+        create.side_effect = [
+            native_openai.APIConnectionError(request=_REQUEST),
+            _completion(),
+        ]
+
+        result = provider.chat(MESSAGES)
+
+        assert result.success
+        assert result.attempt_count == 2
+
+
+class TestDeadline:
+    @pytest.fixture
+    def clock(self, mocker):
+        now = [0.0]
+        mocker.patch.object(
+            provider_module.time, "monotonic", side_effect=lambda: now[0]
+        )
+        mocker.patch.object(
+            provider_module.time,
+            "sleep",
+            side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds),
+        )
+        return now
+
+    def test_stops_retrying_past_deadline(self, provider, clock, mocker):
+        mocker.patch.object(provider, "_compute_backoff", return_value=10)
+        provider.deadline = 15
+
+        def slow_failure(**kwargs):
+            clock[0] += 10
+            raise _status_error(503)
+
+        provider.client.chat.completions.create.side_effect = slow_failure
+
+        result = provider.chat(MESSAGES)
+
+        assert not result.success
+        assert result.attempt_count == 1
+        assert clock[0] == 10
+
+    def test_attempt_timeout_shrinks_with_remaining_budget(
+        self, provider, clock, mocker
+    ):
+        mocker.patch.object(provider, "_compute_backoff", return_value=1)
+        provider.deadline = 100
+        create = provider.client.chat.completions.create
+
+        def slow_failure(**kwargs):
+            clock[0] += 60
+            raise _status_error(503)
+
+        calls = iter([slow_failure, lambda **kwargs: _completion()])
+        create.side_effect = lambda **kwargs: next(calls)(**kwargs)
+
+        assert provider.chat(MESSAGES).success
+        timeouts = [call.kwargs["timeout"] for call in create.call_args_list]
+        assert timeouts == [100, 39]
+
+    def test_default_deadline_from_timeout(self):
+        assert (
+            OpenaiProvider("key", "https://example.com/v1", "m", timeout=30).deadline
+            == 60
+        )
+
+
+def _batch_output(*records):
+    lines = []
+    for custom_id, content, finish_reason in records:
+        body = {
+            "choices": [
+                {"message": {"content": content}, "finish_reason": finish_reason}
+            ]
+        }
+        lines.append(
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "response": {"status_code": 200, "body": body},
+                }
+            )
+        )
+    return SimpleNamespace(text="\n".join(lines))
+
+
+class TestBatchChat:
+    @pytest.fixture
+    def batches(self, provider):
+        provider.client.files.create.return_value = SimpleNamespace(id="file-in")
+        provider.client.batches.create.return_value = SimpleNamespace(
+            id="batch-1", status="in_progress", output_file_id=None
+        )
+        provider.client.batches.retrieve.return_value = SimpleNamespace(
+            id="batch-1", status="completed", output_file_id="file-out"
+        )
+        return provider.client.batches
+
+    def test_results_follow_input_order(self, provider, batches, sleep):
+        provider.client.files.content.return_value = _batch_output(
+            ("1", " second ", "stop"), ("0", "first", "stop")
+        )
+
+        results = provider.batch_chat(
+            [MESSAGES, [{"role": "user", "content": "again"}]],
+            stream=True,
+            temperature=0.5,
+        )
+
+        assert [r.content for r in results] == ["first", "second"]
+        assert all(r.success for r in results)
+        sleep.assert_called_once_with(provider_module.BATCH_POLL_INTERVAL)
+        upload = provider.client.files.create.call_args.kwargs
+        assert upload["purpose"] == "batch"
+        requests = [json.loads(line) for line in upload["file"][1].splitlines()]
+        assert [r["custom_id"] for r in requests] == ["0", "1"]
+        assert requests[0]["body"] == {
+            "model": "test-model",
+            "messages": MESSAGES,
+            "temperature": 0.5,
+        }
+        assert batches.create.call_args.kwargs["endpoint"] == "/v1/chat/completions"
+
+    def test_missing_and_truncated_items_fail(self, provider, batches, sleep):
+        provider.client.files.content.return_value = _batch_output(
+            ("0", "cut", "length")
+        )
+
+        results = provider.batch_chat([MESSAGES, MESSAGES])
+
+        assert [r.success for r in results] == [False, False]
+        assert results[0].error is ErrorType.OTHER
+
+    def test_cached_items_are_not_submitted(self, provider, batches, sleep):
+        provider.cache = {}
+        provider.client.files.content.return_value = _batch_output(("1", "b", "stop"))
+        other = [{"role": "user", "content": "other"}]
+        provider.cache[provider._response_cache_key(MESSAGES, {})] = "a"
+
+        results = provider.batch_chat([MESSAGES, other])
+
+        assert [r.content for r in results] == ["a", "b"]
+        upload = provider.client.files.create.call_args.kwargs["file"][1]
+        assert len(upload.splitlines()) == 1
+        assert provider.cache[provider._response_cache_key(other, {})] == "b"
+
+    def test_cancel_keeps_finished_requests(
+        self, provider, batches, sleep, monkeypatch
+    ):
+        monkeypatch.setattr(provider_module, "BATCH_MAX_WAIT", 0)
+        batches.cancel.return_value = SimpleNamespace(
+            id="batch-1", status="cancelling", output_file_id=None
+        )
+        batches.retrieve.return_value = SimpleNamespace(
+            id="batch-1", status="cancelled", output_file_id="file-out"
+        )
+        provider.client.files.content.return_value = _batch_output(("0", "a", "stop"))
+
+        results = provider.batch_chat([MESSAGES, MESSAGES])
+
+        batches.cancel.assert_called_once_with("batch-1")
+        assert [r.success for r in results] == [True, False]
+        assert provider.breaker.consecutive_failures == 1
+
+    @pytest.mark.parametrize("status", ["failed", "expired"])
+    def test_unfinished_batch_counts_as_failure(self, provider, batches, sleep, status):
+        provider.breaker.consecutive_failures = 2
+        batches.retrieve.return_value = SimpleNamespace(
+            id="batch-1", status=status, output_file_id=None
+        )
+
+        results = provider.batch_chat([MESSAGES])
+
+        assert not results[0].success
+        assert provider.breaker.consecutive_failures == 3
+
+    def test_shares_cache_with_chat(self, provider, batches, sleep):
+        provider.cache = {}
+        provider.client.files.content.return_value = _batch_output(("0", "a", "stop"))
+
+        provider.batch_chat([MESSAGES], temperature=None, timeout=10)
+        result = provider.chat(MESSAGES, temperature=None, timeout=500)
+
+        assert result.content == "a" and result.attempt_count == 0
+        provider.client.chat.completions.create.assert_not_called()
+
+    def test_upload_error_counts_as_failure(self, provider):
+        provider.client.files.create.side_effect = _status_error(
+            401, cls=native_openai.AuthenticationError
+        )
+
+        results = provider.batch_chat([MESSAGES])
+
+        assert not results[0].success
+        assert not provider.available
@@ -0,0 +1,87 @@
+import pytest
+
+from aurora.services.translation import rate_limiter as rate_limiter_module
+from aurora.services.translation.rate_limiter import RateLimiter, parse_reset_seconds
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [100.0]
+    mocker.patch.object(
+        rate_limiter_module.time, "monotonic", side_effect=lambda: now[0]
+    )
+    return now
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch.object(rate_limiter_module.time, "sleep")
+
+
+class TestParseResetSeconds:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("1s", 1), ("6m0s", 360), ("20ms", 0.02), ("1h2m3.5s", 3723.5), ("2.5", 2.5)],
+    )
+    def test_durations(self, value, expected):
+        assert parse_reset_seconds(value) == pytest.approx(expected)
+
+    def test_unix_timestamps(self, mocker):
+        mocker.patch.object(
+            rate_limiter_module.time, "time", return_value=1_700_000_000
+        )
+        assert parse_reset_seconds("1700000003") == 3
+        assert parse_reset_seconds("1700000001500") == 1.5
+
+    def test_garbage(self):
+        assert parse_reset_seconds("soon") is None
+        assert parse_reset_seconds("1s later") is None
+
+
+class TestRateLimiter:
+    def test_no_headers_no_wait(self, clock, sleep):
+        assert RateLimiter().acquire() == 0
+        sleep.assert_not_called()
+
+    def test_exhausted_requests_wait_for_reset(self, clock, sleep):
+        limiter = RateLimiter()
+        limiter.update(
+            {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "3s"}
+        )
+
+        assert limiter.acquire() == 3
+        sleep.assert_called_once_with(3)
+
+    def test_low_remaining_spreads_requests(self, clock, sleep):
+        limiter = RateLimiter(low_watermark=5)
+        limiter.update({"x-ratelimit-remaining": "3", "x-ratelimit-reset": "8"})
+
+        assert limiter.acquire() == 2
+        assert limiter.acquire() == pytest.approx(8 / 3)
+
+    def test_exhausted_tokens_wait_for_reset(self, clock, sleep):
+        limiter = RateLimiter()
+        limiter.update(
+            {
+                "x-ratelimit-remaining-requests": "100",
+                "x-ratelimit-reset-requests": "1s",
+                "x-ratelimit-remaining-tokens": "0",
+                "x-ratelimit-reset-tokens": "500ms",
+            }
+        )
+
+        assert limiter.acquire() == 0.5
+
+    def test_expired_window_is_dropped(self, clock, sleep):
+        limiter = RateLimiter()
+        limiter.update({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "1"})
+        clock[0] += 1
+
+        assert limiter.acquire() == 0
+
+    def test_block_for(self, clock, sleep):
+        limiter = RateLimiter(max_wait=10)
+        limiter.block_for(4)
+        assert limiter.acquire() == 4
+        limiter.block_for(60)
+        assert limiter.acquire() == 10
@@ -0,0 +1,320 @@
+import json
+import threading
+import time
+
+import pytest
+
+from aurora.domain.context import TranslateContext
+from aurora.domain.enums import TaskType
+from aurora.domain.results import ChatResult
+from aurora.services.translation.prompts import SUBTITLE_TIMELINE_REPAIR_PROMPT
+from aurora.services.translation.strategies import (
+    SUBTITLE_VALIDATION_ATTEMPTS,
+    ContextualMetaDataStrategy,
+    NoSliceSubtitleStrategy,
+    SimpleMetaDataStrategy,
+    SliceSubtitleStrategy,
+)
+
+
+def _srt(start, count):
+    return "".join(
+        f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\nline {i}\n\n"
+        for i in range(start, start + count)
+    )
+
+
+def _reply(content):
+    return ChatResult(success=True, attempt_count=1, time_taken=10, content=content)
+
+
+def _fake_chat(messages, broken_ids=()):
+    srt_block = json.loads(messages[1]["content"])["srt_block"]
+    if isinstance(srt_block, str):
+        return _reply(json.dumps({"content": srt_block.replace("line", "行")}))
+    results = []
+    for item in srt_block:
+        content = item["text"].replace("line", "行")
+        if item["id"] in broken_ids:
+            content = content.replace(",500", ",999")
+        results.append({"id": item["id"], "content": content})
+    return _reply(json.dumps({"results": results}, ensure_ascii=False))
+
+
+class _ChatSequence:
+    def __init__(self, broken_ids_per_call):
+        self.broken_ids_per_call = list(broken_ids_per_call)
+
+    def __call__(self, messages, **kwargs):
+        broken_ids = self.broken_ids_per_call.pop(0) if self.broken_ids_per_call else ()
+        return _fake_chat(messages, broken_ids)
+
+
+def _batch_sizes(provider):
+    sizes = []
+    for call in provider.chat.call_args_list:
+        srt_block = json.loads(call.args[0][1]["content"])["srt_block"]
+        sizes.append(len(srt_block) if isinstance(srt_block, list) else 1)
+    return sizes
+
+
+@pytest.fixture
+def context():
+    return TranslateContext(
+        task_type=TaskType.TRANSLATE_SUBTITLE,
+        metadata={},
+        terms=[],
+        text_to_process=_srt(1, 12),
+    )
+
+
+@pytest.fixture
+def provider(mocker):
+    provider = mocker.Mock(model="model", available=True)
+    return provider
+
+
+class TestSliceBatching:
+    def test_slices_share_one_request(self, provider, context):
+        provider.chat.side_effect = lambda messages, **kwargs: _fake_chat(messages)
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=3, batch_size=4)
+
+        result = strategy.process(provider, context)
+
+        assert result.success
+        assert _batch_sizes(provider) == [4]
+        assert result.content.count("行") == 12
+        assert "line" not in result.content
+
+    def test_failed_slices_are_retried_in_smaller_batches(self, provider, context):
+        provider.chat.side_effect = _ChatSequence([(2, 3), ()])
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=3, batch_size=4)
+
+        result = strategy.process(provider, context)
+
+        assert result.success
+        assert _batch_sizes(provider) == [4, 2]
+        assert "line" not in result.content
+
+    def test_mismatched_timeline_goes_to_single_request(self, provider, context):
+        provider.chat.side_effect = _ChatSequence([(4,), ()])
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=3, batch_size=4)
+
+        result = strategy.process(provider, context)
+
+        assert _batch_sizes(provider) == [4, 1]
+        assert ",999" not in result.content
+
+    def test_unparsable_batch_falls_back_to_single_slices(self, provider, context):
+        def chat(messages, **kwargs):
+            srt_block = json.loads(messages[1]["content"])["srt_block"]
+            if isinstance(srt_block, list):
+                return _reply("not json")
+            return _fake_chat(messages)
+
+        provider.chat.side_effect = chat
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=3, batch_size=2)
+
+        result = strategy.process(provider, context)
+
+        assert result.success
+        assert "line" not in result.content
+        assert _batch_sizes(provider) == [2, 2, 1, 1, 1, 1]
+
+    def test_batch_size_one_keeps_single_requests(self, provider, context):
+        provider.chat.side_effect = lambda messages, **kwargs: _fake_chat(messages)
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=3)
+
+        strategy.process(provider, context)
+
+        assert _batch_sizes(provider) == [1, 1, 1, 1]
+
+
+class TestTimelineCheck:
+    @pytest.fixture
+    def context(self):
+        return TranslateContext(
+            task_type=TaskType.TRANSLATE_SUBTITLE,
+            metadata={},
+            terms=[],
+            text_to_process=_srt(1, 3),
+        )
+
+    def _translated(self, srt):
+        return _reply(json.dumps({"content": srt.replace("line", "行")}))
+
+    def _broken(self):
+        return self._translated(_srt(1, 3).replace("00:00:02,000", "00:00:02,100"))
+
+    def test_mismatch_is_repaired(self, provider, context):
+        provider.chat.side_effect = [self._broken(), self._translated(_srt(1, 3))]
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=10)
+
+        result = strategy.process(provider, context)
+
+        assert result.success
+        assert result.attempt_count == 2
+        assert result.content.count("行") == 3
+        assert "00:00:02,100" not in result.content
+        assert provider.chat.call_args.args[0][-1][
+            "content"
+        ] == SUBTITLE_TIMELINE_REPAIR_PROMPT.format(indices="2")
+
+    def test_keeps_source_after_repeated_mismatch(self, provider, context):
+        provider.chat.side_effect = lambda messages, **kwargs: self._broken()
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=10)
+
+        result = strategy.process(provider, context)
+
+        assert provider.chat.call_count == SUBTITLE_VALIDATION_ATTEMPTS
+        assert result.success
+        assert result.content.strip() == _srt(1, 3).strip()
+
+
+class TestConcurrentNodes:
+    def test_nodes_are_requested_concurrently(self, provider, context):
+        barrier = threading.Barrier(4)
+
+        def chat(messages, **kwargs):
+            barrier.wait(timeout=5)
+            return _fake_chat(messages)
+
+        provider.chat.side_effect = chat
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=3)
+
+        result = strategy.process(provider, context)
+
+        assert result.success
+        assert result.content.count("行") == 12
+
+    def test_failed_nodes_are_split_in_order(self, provider):
+        context = TranslateContext(
+            task_type=TaskType.TRANSLATE_SUBTITLE,
+            metadata={},
+            terms=[],
+            text_to_process=_srt(1, 30),
+        )
+
+        def chat(messages, **kwargs):
+            srt_block = json.loads(messages[1]["content"])["srt_block"]
+            if srt_block.count("-->") >= 10:
+                return ChatResult(
+                    success=False, attempt_count=1, time_taken=10, content=None
+                )
+            return _fake_chat(messages)
+
+        provider.chat.side_effect = chat
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=15)
+
+        result = strategy.process(provider, context)
+
+        assert result.success
+        assert provider.chat.call_count == 8
+        assert result.content == _srt(1, 30).replace("line", "行").strip()
+
+    def test_max_workers_limits_concurrency(self, provider, context):
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def chat(messages, **kwargs):
+            with lock:
+                active.append(messages)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(messages)
+            return _fake_chat(messages)
+
+        provider.chat.side_effect = chat
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=3, max_workers=2)
+
+        assert strategy.process(provider, context).success
+        assert provider.chat.call_count == 4
+        assert max(peak) == 2
+
+
+class TestBatchApi:
+    def test_slices_go_through_batch_api_first(self, provider, context):
+        def batch_chat(messages_list, **kwargs):
+            results = [_fake_chat(messages) for messages in messages_list]
+            results[1] = ChatResult(
+                success=False, attempt_count=1, time_taken=10, content=None
+            )
+            return results
+
+        provider.batch_chat.side_effect = batch_chat
+        provider.chat.side_effect = lambda messages, **kwargs: _fake_chat(messages)
+        strategy = SliceSubtitleStrategy(False, 1.0, slice_size=3, use_batch_api=True)
+
+        result = strategy.process(provider, context)
+
+        assert result.success
+        assert "line" not in result.content
+        assert len(provider.batch_chat.call_args.args[0]) == 4
+        # 与逐个重试时的参数一致（timeout、stream 不计入缓存键），两条路径共用响应缓存
+        chat_kwargs = dict(provider.chat.call_args.kwargs)
+        chat_kwargs.pop("stream")
+        chat_kwargs.pop("timeout")
+        assert provider.batch_chat.call_args.kwargs == chat_kwargs
+        assert _batch_sizes(provider) == [1]
+        assert result.attempt_count == 5
+
+
+class TestBlankInput:
+    @pytest.mark.parametrize(
+        "strategy_cls, task_type",
+        [
+            (SimpleMetaDataStrategy, TaskType.METADATA_ACTOR),
+            (ContextualMetaDataStrategy, TaskType.METADATA_TITLE),
+        ],
+    )
+    @pytest.mark.parametrize("text", ["", "  \n"])
+    def test_metadata_skips_provider(self, provider, strategy_cls, task_type, text):
+        context = TranslateContext(task_type=task_type, text_to_process=text)
+
+        result = strategy_cls(False, None).process(provider, context)
+
+        assert result.success
+        assert result.content == ""
+        provider.chat.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "strategy", [SliceSubtitleStrategy(False, 1.0), NoSliceSubtitleStrategy()]
+    )
+    def test_subtitle_skips_provider(self, provider, context, strategy):
+        context.text_to_process = "\n\n"
+
+        result = strategy.process(provider, context)
+
+        assert not result.success
+        assert result.attempt_count == 0
+        provider.chat.assert_not_called()
+
+
+class TestMetadataBatch:
+    def test_results_follow_input_order(self, provider):
+        provider.chat.return_value = _reply('{"results": ["花咲一杏", "树花凛"]}')
+
+        results = SimpleMetaDataStrategy(False, None).process_batch(
+            provider, TaskType.METADATA_ACTOR, ["花咲いあん", "樹花凜"]
+        )
+
+        assert [r.content for r in results] == ["花咲一杏", "树花凛"]
+        assert all(r.success for r in results)
+        messages = provider.chat.call_args.args[0]
+        assert json.loads(messages[-1]["content"]) == ["花咲いあん", "樹花凜"]
+        assert "results" in json.loads(messages[-2]["content"])
+
+    @pytest.mark.parametrize(
+        "content", ["not json", '{"results": ["only one"]}', '{"results": [1, 2]}']
+    )
+    def test_malformed_reply_returns_none(self, provider, content):
+        provider.chat.return_value = _reply(content)
+
+        assert (
+            SimpleMetaDataStrategy(False, None).process_batch(
+                provider, TaskType.METADATA_CATEGORY, ["a", "b"]
+            )
+            is None
+        )
@@ -0,0 +1,19 @@
+import pytest
+
+from aurora.utils.bilingual_subtitle_generator import _format_seconds_to_ass
+
+
+class TestFormatSecondsToAss:
+    @pytest.mark.parametrize(
+        "seconds, expected",
+        [
+            (0, "0:00:00.00"),
+            (-1, "0:00:00.00"),
+            (0.29, "0:00:00.29"),
+            (1.15, "0:00:01.15"),
+            (59.999, "0:01:00.00"),
+            (3723.45, "1:02:03.45"),
+        ],
+    )
+    def test_format(self, seconds, expected):
+        assert _format_seconds_to_ass(seconds) == expected
@@ -0,0 +1,27 @@
+import json
+
+import pytest
+
+from aurora.utils import json_utils
+
+QUERY = {
+    "command": "请为我翻译这份srt字幕",
+    "movie_info": {"metadata": {"title": "タイトル"}, "terms": [], "extra": {}},
+    "srt_block": '1\n00:00:01,000 --> 00:00:02,000\n"こんにちは"\n\n',
+    "additional": None,
+    "ratio": 0.5,
+}
+
+
+class TestJsonUtils:
+    def test_dumps_pretty_matches_stdlib(self):
+        assert json_utils.dumps_pretty(QUERY) == json.dumps(
+            QUERY, ensure_ascii=False, indent=2
+        )
+
+    def test_loads_round_trip(self):
+        assert json_utils.loads(json_utils.dumps_pretty(QUERY)) == QUERY
+
+    def test_invalid_input_raises_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads("not json")
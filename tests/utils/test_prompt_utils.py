@@ -0,0 +1,57 @@
+import pytest
+
+from aurora.services.translation.prompts import (
+    CORRECT_SUBTITLE_USER_QUERY,
+    SYNOPSIS_USER_QUERY,
+    TRANSLATE_SUBTITLE_USER_QUERY,
+)
+from aurora.utils.prompt_utils import (
+    fill_placeholders,
+    find_placeholders,
+    recursive_replace,
+)
+
+REPLACEMENTS = {
+    "metadata_value": {"title": "タイトル"},
+    "text_value": "1\n00:00:01,000 --> 00:00:02,000\nこんにちは\n\n",
+    "terms_value": [{"japanese": "先生", "recommended_chinese": "老师"}],
+    "actors_value": [],
+    "actresses_value": [{"original": "花子"}],
+    "synopsis_value": "あらすじ",
+}
+
+
+class TestFillPlaceholders:
+    @pytest.mark.parametrize(
+        "template",
+        [
+            CORRECT_SUBTITLE_USER_QUERY,
+            TRANSLATE_SUBTITLE_USER_QUERY,
+            SYNOPSIS_USER_QUERY,
+            {"list": ["text_value", {"nested": "terms_value"}], "keep": "text"},
+        ],
+    )
+    def test_matches_recursive_replace(self, template):
+        plan = find_placeholders(template, REPLACEMENTS.keys())
+
+        filled = fill_placeholders(template, plan, REPLACEMENTS)
+
+        assert filled == recursive_replace(template, REPLACEMENTS)
+
+    def test_template_is_not_modified(self):
+        template = {"info": {"metadata": "metadata_value", "source": "s"}, "x": [1]}
+        plan = find_placeholders(template, {"metadata_value"})
+
+        filled = fill_placeholders(template, plan, REPLACEMENTS)
+
+        assert template["info"]["metadata"] == "metadata_value"
+        assert filled["info"]["metadata"] == {"title": "タイトル"}
+        assert filled["x"] is template["x"]
+
+    def test_missing_replacement_keeps_placeholder(self):
+        template = {"a": "text_value", "b": "terms_value"}
+        plan = find_placeholders(template, {"text_value", "terms_value"})
+
+        filled = fill_placeholders(template, plan, {"text_value": "t"})
+
+        assert filled == {"a": "t", "b": "terms_value"}
@@ -0,0 +1,45 @@
+from aurora.utils.subtitle_utils import adaptive_slice_subtitle, renumber_subtitles
+
+
+def _srt(start, count):
+    return "".join(
+        f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\nline {i}\n\n"
+        for i in range(start, start + count)
+    )
+
+
+class TestAdaptiveSliceSubtitle:
+    def test_slices_evenly(self):
+        slices = adaptive_slice_subtitle(_srt(1, 7), 3)
+        assert [s.count("-->") for s in slices] == [3, 2, 2]
+        assert slices[0] == _srt(1, 3).strip()
+
+    def test_blank_line_runs_are_one_separator(self):
+        text = "\n" + _srt(1, 2) + "\n\n\n" + _srt(3, 2)
+        slices = adaptive_slice_subtitle(text, 2)
+        assert slices == [_srt(1, 2).strip(), _srt(3, 2).strip()]
+
+    def test_empty_input(self):
+        assert adaptive_slice_subtitle("", 3) == []
+        assert adaptive_slice_subtitle("\n\n\n", 3) == []
+
+
+class TestRenumberSubtitles:
+    def test_numbers_are_consecutive_across_extra_blank_lines(self):
+        result = renumber_subtitles(_srt(1, 2) + "\n\n" + _srt(5, 2))
+
+        blocks = result.split("\n\n")
+        assert [block.split("\n")[0] for block in blocks] == ["1", "2", "3", "4"]
+        assert blocks[2].endswith("line 5")
+
+    def test_incomplete_blocks_are_dropped(self):
+        text = "7\n00:00:01,000 --> 00:00:01,500\na\n\norphan\n\n9\n00:00:02,000 --> 00:00:02,500\nb"
+        assert renumber_subtitles(text) == (
+            "1\n00:00:01,000 --> 00:00:01,500\na\n\n2\n00:00:02,000 --> 00:00:02,500\nb"
+        )
+
+    def test_only_index_line_is_replaced(self):
+        text = "3\n00:00:01,000 --> 00:00:01,500\n12\nsecond line\n"
+        assert renumber_subtitles(text) == (
+            "1\n00:00:01,000 --> 00:00:01,500\n12\nsecond line"
+        )